@@ -0,0 +1,94 @@
+"""Compare throughput of shared codecs, and of the table-driven base62 codec with
+a per-digit divmod loop.
+
+Usage:
+
+```console
+python benchmarks/bench_codecs.py
+```
+"""
+
+import os
+import timeit
+
+from genid.codecs import BASE16, BASE32, BASE32_LOWER, BASE58, BASE62, Codec
+
+NUMBER = 100_000
+BATCH = 100_000
+# Codecs and the size of values they encode
+CODECS = {
+    "base16": (BASE16, 12),
+    "base32": (BASE32, 16),
+    "base32 lower": (BASE32_LOWER, 16),
+    "base58": (BASE58, 16),
+    "base62": (BASE62, 20),
+}
+
+
+def divmod_encode(binary: bytes) -> str:
+    value = int.from_bytes(binary, "big")
+    digits = []
+    for _ in range(27):
+        value, digit = divmod(value, 62)
+        digits.append(BASE62.alphabet[digit])
+    return "".join(reversed(digits))
+
+
+def divmod_decode(encoded: str) -> bytes:
+    value = 0
+    for char in encoded:
+        value = value * 62 + BASE62.alphabet.index(char)
+    return value.to_bytes(20, "big")
+
+
+def report(name: str, seconds: float, number: int = NUMBER) -> None:
+    print(
+        f"{name:>28}: {seconds / number * 1e9:8.0f}ns/id {number / seconds:12,.0f} ids/s"
+    )
+
+
+def bench_codec(name: str, codec: Codec, size: int) -> None:
+    value = os.urandom(size)
+    encoded = codec.encode(value)
+    report(
+        f"{name} encode", min(timeit.repeat(lambda: codec.encode(value), number=NUMBER))
+    )
+    report(
+        f"{name} decode",
+        min(timeit.repeat(lambda: codec.decode(encoded, size), number=NUMBER)),
+    )
+    buffer = os.urandom(size * BATCH)
+    strings = codec.encode_many(buffer, size)
+    report(
+        f"{name} encode_many",
+        min(timeit.repeat(lambda: codec.encode_many(buffer, size), number=1, repeat=3)),
+        BATCH,
+    )
+    report(
+        f"{name} decode_many",
+        min(
+            timeit.repeat(lambda: codec.decode_many(strings, size), number=1, repeat=3)
+        ),
+        BATCH,
+    )
+
+
+def main() -> None:
+    for name, (codec, size) in CODECS.items():
+        bench_codec(name, codec, size)
+    value = os.urandom(20)
+    encoded = BASE62.encode(value)
+    assert divmod_encode(value) == encoded
+    assert divmod_decode(encoded) == value
+    report(
+        "base62 divmod encode",
+        min(timeit.repeat(lambda: divmod_encode(value), number=NUMBER)),
+    )
+    report(
+        "base62 divmod decode",
+        min(timeit.repeat(lambda: divmod_decode(encoded), number=NUMBER)),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure compression ratio and throughput of the delta/varint codec.
+
+IDs are generated by actual generators, then sorted before compression.
+
+Usage:
+
+```console
+python benchmarks/bench_compress.py
+```
+"""
+
+import time
+import typing as t
+
+from genid.compress import CompressedIDs, compress, decompress
+from genid.generators import Kind, generator
+
+NUMBER = 200_000
+KINDS = [
+    Kind.INCREMENTAL,
+    Kind.TIMESTAMP,
+    Kind.NSTIMESTAMP,
+    Kind.OBJECTID,
+    Kind.ULID,
+    Kind.KSUID,
+]
+
+
+def measure(func: t.Callable[[], t.Any]) -> t.Tuple[float, t.Any]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    print(
+        f"{'kind':>12} {'raw':>10} {'compressed':>10} {'ratio':>6}"
+        f" {'encode':>12} {'decode':>12} {'random access':>14}"
+    )
+    for kind in KINDS:
+        gen = generator(kind)
+        _, ids = gen.new_ids_at_index(NUMBER)
+        ids.sort()
+        raw_size = NUMBER * t.cast(int, gen.id_width)
+        encode_time, data = measure(lambda: compress(kind, ids))
+        decode_time, decoded = measure(lambda: decompress(data))
+        assert gen.ids_to_strings(decoded) == gen.ids_to_strings(ids)
+        compressed = CompressedIDs(data)
+        positions = range(0, NUMBER, NUMBER // 1000)
+        access_time, _ = measure(lambda: [compressed[i] for i in positions])
+        print(
+            f"{kind.value:>12} {raw_size:>10,} {len(data):>10,}"
+            f" {raw_size / len(data):>6.2f}"
+            f" {NUMBER / encode_time:>8,.0f} /s {NUMBER / decode_time:>8,.0f} /s"
+            f" {access_time / len(positions) * 1e6:>9.0f} us/id"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Measure memory allocated per generated ID for every kind.
+
+For both `new()` and `new_id_at_index()`, reports:
+
+- the peak of memory allocated by a single call, which includes all
+  intermediate objects alive at the same time.
+- the number of bytes and memory blocks kept alive by each result.
+
+Use `--budget` to print budgets in the format expected by
+`tests/e2e/test_allocations.py`.
+
+Usage:
+
+```console
+python benchmarks/bench_memory.py
+```
+"""
+
+import argparse
+import gc
+import tracemalloc
+import typing as t
+
+from genid.generators import Kind, generator
+
+
+def peak_memory(func: t.Callable[[], t.Any], repeat: int = 20) -> int:
+    func()
+    peaks: t.List[int] = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        func()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(peaks)
+
+
+def kept_memory(
+    func: t.Callable[[], t.Any], number: int = 1000
+) -> t.Tuple[float, float]:
+    results: t.List[t.Any] = [None] * number
+    func()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for idx in range(number):
+        results[idx] = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(exclude).compare_to(
+        before.filter_traces(exclude), "filename"
+    )
+    size = sum(stat.size_diff for stat in stats) / number
+    count = sum(stat.count_diff for stat in stats) / number
+    return size, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", action="store_true", help="print budgets")
+    args = parser.parse_args()
+    kinds = [kind for kind in Kind if kind != Kind.CONSTANT]
+    if not args.budget:
+        print(
+            f"{'kind':>12} {'method':>16} {'peak bytes':>11}"
+            f" {'kept bytes':>11} {'kept blocks':>12}"
+        )
+    for kind in kinds:
+        gen = generator(kind)
+        results = []
+        for name, func in (("new", gen.new), ("new_id_at_index", gen.new_id_at_index)):
+            peak = peak_memory(func)
+            size, count = kept_memory(func)
+            results.append((peak, count))
+            if not args.budget:
+                print(
+                    f"{kind.value:>12} {name:>16} {peak:>11}"
+                    f" {size:>11.0f} {count:>12.0f}"
+                )
+        if args.budget:
+            # Tuple and index are kept in addition to ID objects
+            objects = round(results[1][1]) - 2
+            print(
+                f"    Kind.{kind.name}: ({results[0][0]}, {results[1][0]}, {objects}),"
+            )
+
+
+if __name__ == "__main__":
+    main()
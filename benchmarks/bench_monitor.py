@@ -0,0 +1,42 @@
+"""Measure memory and per-ID overhead of collision monitoring.
+
+Usage:
+
+```console
+python benchmarks/bench_monitor.py
+```
+"""
+
+import timeit
+
+from genid import MonitoredIDGenerator, generator
+
+NUMBER = 100_000
+
+
+def bench(kind: str, **kwargs: object) -> None:
+    plain = generator(kind, **kwargs)
+    plain_time = min(timeit.repeat(plain.new, number=NUMBER, repeat=3))
+    for error_rate in (1e-4, 1e-6, 1e-9):
+        monitored = MonitoredIDGenerator(
+            generator(kind, **kwargs), capacity=1_000_000, error_rate=error_rate
+        )
+        monitored_time = min(timeit.repeat(monitored.new, number=NUMBER, repeat=3))
+        overhead = (monitored_time - plain_time) / NUMBER * 1e9
+        print(
+            f"{kind:>8} p={error_rate:<6g} "
+            f"memory={monitored.filter.nbytes / 1e6:6.2f}MB "
+            f"plain={plain_time / NUMBER * 1e9:8.0f}ns/id "
+            f"monitored={monitored_time / NUMBER * 1e9:8.0f}ns/id "
+            f"overhead={overhead:8.0f}ns/id"
+        )
+
+
+def main() -> None:
+    bench("nanoid", size=10)
+    bench("objectid")
+    bench("ulid")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Measure memory and throughput of a `GeneratorPool` serving many tenants.
+
+Compares the memory used by one generator per tenant with the memory used by a
+pool holding generators of active tenants only, then measures ID generation
+throughput when tenants are served by existing generators (hits) and when
+generators are created and evicted (misses).
+
+States of evicted incremental generators are kept in memory by the pool unless
+they are saved elsewhere: the `incremental (external)` row saves them into a
+SQLite database instead.
+
+Usage:
+
+```console
+python benchmarks/bench_pool.py
+```
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+import typing as t
+
+from genid.generators import Kind, generator
+from genid.pool import GeneratorPool, PoolKey, State
+
+TENANTS = 100_000
+POOL_SIZE = 10_000
+KINDS = [Kind.INCREMENTAL, Kind.NANOID]
+
+
+class SQLiteStates:
+    """Store generator states in a SQLite database."""
+
+    def __init__(self, path: str) -> None:
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE states (key TEXT PRIMARY KEY, state TEXT)")
+
+    def save(self, key: PoolKey, state: State) -> None:
+        self.db.execute(
+            "INSERT OR REPLACE INTO states VALUES (?, ?)",
+            (repr(key), json.dumps(state)),
+        )
+
+    def load(self, key: PoolKey) -> t.Optional[State]:
+        row = self.db.execute(
+            "SELECT state FROM states WHERE key = ?", (repr(key),)
+        ).fetchone()
+        return None if row is None else t.cast(State, json.loads(row[0]))
+
+
+def measure(create: t.Callable[[], t.Any]) -> int:
+    tracemalloc.start()
+    value = create()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def bench(name: str, kind: Kind, create_pool: t.Callable[[], GeneratorPool]) -> None:
+    generator(kind)
+    dedicated = measure(lambda: {idx: generator(kind) for idx in range(TENANTS)})
+
+    def fill_pool() -> GeneratorPool:
+        pool = create_pool()
+        for idx in range(TENANTS):
+            pool.new(idx, kind)
+        return pool
+
+    pooled = measure(fill_pool)
+    pool = fill_pool()
+    start = time.perf_counter()
+    for idx in range(TENANTS - POOL_SIZE, TENANTS):
+        pool.new(idx, kind)
+    hit = time.perf_counter() - start
+    start = time.perf_counter()
+    for idx in range(POOL_SIZE):
+        pool.new(idx, kind)
+    miss = time.perf_counter() - start
+    print(
+        f"{name:>24} {dedicated / 2**20:>8.1f} MiB {pooled / 2**20:>8.1f} MiB"
+        f" {pool.footprint() / 2**20:>8.1f} MiB"
+        f" {hit / POOL_SIZE * 1e6:>9.2f} us {miss / POOL_SIZE * 1e6:>9.2f} us"
+    )
+
+
+def main() -> None:
+    print(
+        f"{'kind':>24} {'per tenant':>12} {'pool':>12} {'footprint':>12}"
+        f" {'hit':>12} {'miss':>12}"
+    )
+    for kind in KINDS:
+        bench(kind.value, kind, lambda: GeneratorPool(max_size=POOL_SIZE))
+    with tempfile.TemporaryDirectory() as directory:
+        states = SQLiteStates(os.path.join(directory, "states"))
+        bench(
+            "incremental (external)",
+            Kind.INCREMENTAL,
+            lambda: GeneratorPool(
+                max_size=POOL_SIZE, save_state=states.save, load_state=states.load
+            ),
+        )
+        states.db.close()
+
+
+if __name__ == "__main__":
+    main()
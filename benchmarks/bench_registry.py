@@ -0,0 +1,47 @@
+"""Measure membership checks of an `IDRegistry` holding many issued IDs.
+
+Usage:
+
+```console
+python benchmarks/bench_registry.py
+```
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from genid.generators import generator
+from genid.registry import IDRegistry
+
+SIZES = [10_000, 100_000, 1_000_000]
+LOOKUPS = 100_000
+
+
+def main() -> None:
+    gen = generator("secret")
+    print(f"{'issued':>10} {'add':>12} {'hit':>12} {'miss':>12}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as directory:
+            with IDRegistry(Path(directory) / "issued") as registry:
+                issued = gen.new_many(size)
+                forged = gen.new_many(LOOKUPS)
+                start = time.perf_counter()
+                registry.add_many(issued)
+                add = time.perf_counter() - start
+                sample = issued[:LOOKUPS]
+                start = time.perf_counter()
+                assert all(value in registry for value in sample)
+                hit = time.perf_counter() - start
+                start = time.perf_counter()
+                assert not any(value in registry for value in forged)
+                miss = time.perf_counter() - start
+                print(
+                    f"{size:>10,} {add / size * 1e6:>9.2f} us"
+                    f" {hit / len(sample) * 1e6:>9.2f} us"
+                    f" {miss / LOOKUPS * 1e6:>9.2f} us"
+                )
+
+
+if __name__ == "__main__":
+    main()
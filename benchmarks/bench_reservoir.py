@@ -0,0 +1,76 @@
+"""Compare popping IDs from a shared memory reservoir with generating IDs locally.
+
+A producer process keeps the reservoir filled while consumer processes pop
+blocks of IDs. Reservoir statistics show whether consumers had to wait for
+the producer.
+
+Usage:
+
+```console
+python benchmarks/bench_reservoir.py
+```
+"""
+
+import multiprocessing
+import time
+import typing as t
+
+from genid.generators import generator
+from genid.reservoir import Reservoir
+
+KIND = "ulid"
+CONSUMERS = 4
+NUMBER = 200_000
+BLOCK_SIZE = 256
+
+
+def generate_locally(_: t.Any, output: t.Any) -> None:
+    gen = generator(KIND)
+    start = time.perf_counter()
+    for _ in range(NUMBER // BLOCK_SIZE):
+        gen.new_ids_at_index(BLOCK_SIZE)
+    output.put(time.perf_counter() - start)
+
+
+def pop_from_reservoir(reservoir: Reservoir, output: t.Any) -> None:
+    start = time.perf_counter()
+    for _ in range(NUMBER // BLOCK_SIZE):
+        reservoir.pop_many(BLOCK_SIZE)
+    output.put(time.perf_counter() - start)
+
+
+def run(target: t.Callable[[t.Any, t.Any], None], reservoir: t.Any) -> float:
+    output: t.Any = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=target, args=(reservoir, output))
+        for _ in range(CONSUMERS)
+    ]
+    for process in processes:
+        process.start()
+    durations = [output.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return max(durations)
+
+
+def main() -> None:
+    local = run(generate_locally, None)
+    with Reservoir.create(KIND, capacity=65536) as reservoir:
+        stop = multiprocessing.Event()
+        producer = multiprocessing.Process(target=reservoir.produce, args=(stop,))
+        producer.start()
+        while reservoir.available() < reservoir.capacity:
+            time.sleep(0.01)
+        shared = run(pop_from_reservoir, reservoir)
+        stop.set()
+        producer.join()
+        stats = reservoir.stats()
+    total = CONSUMERS * NUMBER
+    print(f"{CONSUMERS} consumers, {NUMBER:,} {KIND} IDs each")
+    print(f"local generators: {total / local:>12,.0f} IDs/s")
+    print(f"reservoir:        {total / shared:>12,.0f} IDs/s")
+    print(f"low watermark: {stats.low_watermark:,} IDs, starved pops: {stats.starved}")
+
+
+if __name__ == "__main__":
+    main()
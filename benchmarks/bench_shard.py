@@ -0,0 +1,64 @@
+"""Compare shard routing with `shard_many()` against parsing and hashing IDs.
+
+The baseline parses each ID string into an ID object, then hashes its string
+form, which is how shards are usually computed without `genid.shard`.
+
+Usage:
+
+```console
+python benchmarks/bench_shard.py
+```
+"""
+
+import hashlib
+import time
+import typing as t
+from uuid import UUID
+
+from genid import shard_many
+from genid.generators import Kind, generator
+from genid.objectid import ObjectID
+from genid.ulid import ULID
+
+NUMBER = 200_000
+N_SHARDS = 1024
+PARSERS: t.Dict[Kind, t.Callable[[str], t.Any]] = {
+    Kind.OBJECTID: ObjectID,
+    Kind.ULID: ULID.from_str,
+    Kind.UUID4: UUID,
+    Kind.NUID: str,
+    Kind.NANOID: str,
+}
+
+
+def parse_and_hash(parse: t.Callable[[str], t.Any], values: t.List[str]) -> t.List[int]:
+    return [
+        int.from_bytes(hashlib.md5(str(parse(value)).encode()).digest()[:8], "big")
+        % N_SHARDS
+        for value in values
+    ]
+
+
+def measure(func: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'kind':>10} {'parse+hash':>14} {'shard_many':>14} {'jump hash':>14}")
+    for kind, parse in PARSERS.items():
+        gen = generator(kind)
+        _, ids = gen.new_ids_at_index(NUMBER)
+        strings = gen.ids_to_strings(ids)
+        baseline = measure(lambda: parse_and_hash(parse, strings))
+        direct = measure(lambda: shard_many(kind, strings, N_SHARDS))
+        jump = measure(lambda: shard_many(kind, strings, N_SHARDS, consistent=True))
+        print(
+            f"{kind.value:>10} {NUMBER / baseline:>11,.0f} /s"
+            f" {NUMBER / direct:>11,.0f} /s {NUMBER / jump:>11,.0f} /s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare binary and text storage of IDs in a local SQLite database.
+
+For each kind, rows are inserted using `bulk_insert()` into a table whose
+primary key is stored either as text or using a binary column type. Reports the
+size of the primary key index, insert throughput, and lookup throughput by
+primary key.
+
+Usage:
+
+```console
+python benchmarks/bench_sqlalchemy.py
+```
+"""
+
+import random
+import tempfile
+import time
+import typing as t
+from pathlib import Path
+
+import sqlalchemy as sa
+
+from genid.generators import Kind, generator
+from genid.sqlalchemy import KSUIDType, ObjectIDType, ULIDType, UUIDType, bulk_insert
+
+ROWS = 200_000
+LOOKUPS = 20_000
+# Binary column type and text length of each kind
+KINDS = {
+    Kind.ULID: (ULIDType, 26),
+    Kind.OBJECTID: (ObjectIDType, 24),
+    Kind.UUID4: (UUIDType, 36),
+    Kind.KSUID: (KSUIDType, 27),
+}
+
+
+def index_size(connection: sa.Connection) -> int:
+    """Size in bytes of the primary key index of the table (SQLite `dbstat`)."""
+    return t.cast(
+        int,
+        connection.exec_driver_sql(
+            "SELECT SUM(pgsize) FROM dbstat WHERE name = 'sqlite_autoindex_items_1'"
+        ).scalar_one(),
+    )
+
+
+def bench(kind: Kind, column_type: t.Any, path: Path) -> t.Tuple[int, float, float]:
+    engine = sa.create_engine(f"sqlite:///{path}")
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "items",
+        metadata,
+        sa.Column("id", column_type, primary_key=True),
+        sa.Column("name", sa.String),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        start = time.perf_counter()
+        rows = ({"name": f"row-{idx}"} for idx in range(ROWS))
+        bulk_insert(connection, table, rows, generator(kind))
+        insert = time.perf_counter() - start
+    with engine.connect() as connection:
+        ids = connection.execute(sa.select(table.c.id)).scalars().all()
+        sample = random.sample(ids, LOOKUPS)
+        statement = sa.select(table.c.name).where(table.c.id == sa.bindparam("key"))
+        start = time.perf_counter()
+        for key in sample:
+            connection.execute(statement, {"key": key}).scalar_one()
+        lookup = time.perf_counter() - start
+        size = index_size(connection)
+    engine.dispose()
+    return size, ROWS / insert, LOOKUPS / lookup
+
+
+def main() -> None:
+    print(f"{'kind':>10} {'storage':>8} {'index':>10} {'insert':>14} {'lookup':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for kind, (binary_type, length) in KINDS.items():
+            for storage, column_type in [
+                ("text", sa.String(length)),
+                ("binary", binary_type()),
+            ]:
+                path = Path(directory) / f"{kind.value}-{storage}.db"
+                size, insert, lookup = bench(kind, column_type, path)
+                print(
+                    f"{kind.value:>10} {storage:>8} {size / 2**20:>6.2f} MiB"
+                    f" {insert:>11,.0f} /s {lookup:>11,.0f} /s"
+                )
+
+
+if __name__ == "__main__":
+    main()
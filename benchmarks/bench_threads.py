@@ -0,0 +1,83 @@
+"""Measure throughput of generators shared between 1 to N threads.
+
+Each thread generates IDs in a loop using `new()` (or `new_many()` when
+`--batch` is provided) during a fixed duration. On free-threaded CPython builds,
+throughput of generators which do not hold a lock while creating IDs should scale
+with the number of threads.
+
+Usage:
+
+```console
+python benchmarks/bench_threads.py --threads 8 --duration 1 --kind ulid uuid4
+```
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import typing as t
+
+from genid.generators import IDGenerator, Kind, generator
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def measure(
+    gen: IDGenerator[t.Any], threads: int, duration: float, batch: int
+) -> float:
+    barrier = threading.Barrier(threads + 1)
+    stop = threading.Event()
+    counts = [0] * threads
+
+    def target(number: int) -> None:
+        barrier.wait()
+        count = 0
+        while not stop.is_set():
+            if batch:
+                gen.new_many(batch)
+                count += batch
+            else:
+                for _ in range(100):
+                    gen.new()
+                count += 100
+        counts[number] = count
+
+    workers = [threading.Thread(target=target, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=min(os.cpu_count() or 1, 8))
+    parser.add_argument("--duration", type=float, default=0.5)
+    parser.add_argument("--batch", type=int, default=0)
+    parser.add_argument(
+        "--kind",
+        nargs="+",
+        choices=[kind.value for kind in Kind if kind != Kind.CONSTANT],
+        default=["nuid", "objectid", "uuid4", "ulid", "ksuid", "incremental"],
+    )
+    args = parser.parse_args()
+    print(f"Python {sys.version.split()[0]} (GIL enabled: {gil_enabled()})")
+    counts = list(range(1, args.threads + 1))
+    print(f"{'kind':>12} " + " ".join(f"{n:>7} thr" for n in counts))
+    for kind in args.kind:
+        rates = [measure(generator(kind), n, args.duration, args.batch) for n in counts]
+        print(f"{kind:>12} " + " ".join(f"{rate / 1e3:>7.0f}k/s" for rate in rates))
+
+
+if __name__ == "__main__":
+    main()
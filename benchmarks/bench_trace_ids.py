@@ -0,0 +1,94 @@
+"""Compare throughput of trace and span ID generators with the approaches of the
+OpenTelemetry SDK (`random.getrandbits()`) and of `os.urandom()` called for each ID.
+
+Usage:
+
+```console
+python benchmarks/bench_trace_ids.py
+```
+
+The OpenTelemetry SDK generator is also measured when `opentelemetry-sdk` is
+installed.
+"""
+
+import os
+import random
+import timeit
+import typing as t
+
+from genid.generators import SpanIDGenerator, TraceIDGenerator
+
+NUMBER = 100_000
+BATCH = 100_000
+
+
+def getrandbits_trace_id() -> int:
+    trace_id = random.getrandbits(128)
+    while trace_id == 0:
+        trace_id = random.getrandbits(128)
+    return trace_id
+
+
+def getrandbits_span_id() -> int:
+    span_id = random.getrandbits(64)
+    while span_id == 0:
+        span_id = random.getrandbits(64)
+    return span_id
+
+
+def urandom_trace_id() -> int:
+    trace_id = int.from_bytes(os.urandom(16), "big")
+    while trace_id == 0:
+        trace_id = int.from_bytes(os.urandom(16), "big")
+    return trace_id
+
+
+def urandom_span_id() -> int:
+    span_id = int.from_bytes(os.urandom(8), "big")
+    while span_id == 0:
+        span_id = int.from_bytes(os.urandom(8), "big")
+    return span_id
+
+
+def report(name: str, seconds: float, number: int = NUMBER) -> None:
+    print(
+        f"{name:>32}: {seconds / number * 1e9:8.0f}ns/id {number / seconds:12,.0f} ids/s"
+    )
+
+
+def bench(name: str, func: t.Callable[[], t.Any]) -> None:
+    report(name, min(timeit.repeat(func, number=NUMBER)))
+
+
+def main() -> None:
+    for label, gen, getrandbits_id, urandom_id in (
+        ("trace", TraceIDGenerator(), getrandbits_trace_id, urandom_trace_id),
+        ("span", SpanIDGenerator(), getrandbits_span_id, urandom_span_id),
+    ):
+        bench(f"{label} getrandbits", getrandbits_id)
+        bench(f"{label} urandom", urandom_id)
+        bench(f"{label} genid pool (csprng)", gen.unsafe_create_id)
+        seeded = type(gen)(rng=random.Random())
+        bench(f"{label} genid pool (random)", seeded.unsafe_create_id)
+        bench(f"{label} getrandbits hex", lambda: format(getrandbits_id(), "x"))
+        bench(f"{label} genid new", gen.new)
+        report(
+            f"{label} genid new_many",
+            min(timeit.repeat(lambda: gen.new_many(BATCH), number=1, repeat=3)),
+            BATCH,
+        )
+    try:
+        from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+
+        from genid.opentelemetry import OpenTelemetryIdGenerator
+    except ImportError:
+        return
+    sdk, adapter = RandomIdGenerator(), OpenTelemetryIdGenerator()
+    bench("otel sdk trace", sdk.generate_trace_id)
+    bench("otel genid trace", adapter.generate_trace_id)
+    bench("otel sdk span", sdk.generate_span_id)
+    bench("otel genid span", adapter.generate_span_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Check uniqueness of IDs generated at scale across threads and processes.
+
+For each kind, `--count` IDs are generated in binary form using
+`IDGenerator.fill_into()` by `--threads` threads in each of `--processes`
+processes. Each thread sorts the chunks it generates and writes them as sorted
+runs of packed fixed-width IDs. Runs are then merged from memory-mapped files
+(an external sort), so that duplicates are found without holding all IDs in
+memory.
+
+Scenarios:
+
+- `threads`: a single process, all threads share a single generator.
+- `processes`: each forked process creates its own generator.
+- `fork`: a generator is created and used in the parent process, then inherited
+  by forked processes. This exercises state copied by `fork()`, such as NUID
+  prefixes and sequences, and the ObjectID counter.
+
+Reports duplicates, generation and deduplication throughput, and peak resident
+memory of the parent and of child processes. Exits with status 1 when
+duplicates are found. Requires a POSIX platform (`fork()` and `resource`).
+
+Usage:
+
+```console
+python benchmarks/stress_uniqueness.py --count 100000000 --kind nuid --kind objectid
+```
+"""
+
+import argparse
+import heapq
+import mmap
+import multiprocessing
+import os
+import resource
+import tempfile
+import threading
+import time
+import typing as t
+
+from genid.generators import IDGenerator, Kind, generator
+
+SCENARIOS = ("threads", "processes", "fork")
+# Kinds expected to generate unique IDs in every scenario
+UNIQUE_KINDS = [
+    Kind.NANOID,
+    Kind.NUID,
+    Kind.OBJECTID,
+    Kind.UUID1,
+    Kind.UUID4,
+    Kind.ULID,
+    Kind.KSUID,
+    Kind.TYPEID,
+    Kind.SECRET,
+]
+MAX_SAMPLES = 5
+
+
+class Report(t.NamedTuple):
+    kind: Kind
+    scenario: str
+    total: int
+    duplicates: int
+    samples: t.List[bytes]
+    generate_seconds: float
+    dedupe_seconds: float
+
+
+def write_runs(
+    gen: IDGenerator[t.Any], count: int, chunk_size: int, directory: str, name: str
+) -> None:
+    """Generate `count` IDs by chunks, and write each chunk as a sorted run."""
+    width = t.cast(int, gen.id_width)
+    buffer = bytearray(width * chunk_size)
+    run = 0
+    while count > 0:
+        size = min(chunk_size, count)
+        gen.fill_into(buffer, size)
+        ids = [
+            bytes(buffer[idx : idx + width]) for idx in range(0, size * width, width)
+        ]
+        ids.sort()
+        with open(os.path.join(directory, f"{name}-{run}.run"), "wb") as output:
+            output.write(b"".join(ids))
+        count -= size
+        run += 1
+
+
+def run_threads(
+    gen: IDGenerator[t.Any], count: int, threads: int, chunk_size: int, directory: str
+) -> None:
+    """Split `count` IDs between `threads` threads sharing a generator.
+    The calling thread is one of them, so that forked processes keep using
+    state inherited from the thread which forked them.
+    """
+    prefix = f"{os.getpid()}"
+    counts = [count // threads + (idx < count % threads) for idx in range(threads)]
+    workers = [
+        threading.Thread(
+            target=write_runs,
+            args=(gen, share, chunk_size, directory, f"{prefix}-{idx}"),
+        )
+        for idx, share in enumerate(counts[1:], 1)
+    ]
+    for worker in workers:
+        worker.start()
+    write_runs(gen, counts[0], chunk_size, directory, f"{prefix}-0")
+    for worker in workers:
+        worker.join()
+
+
+def run_scenario(
+    kind: Kind,
+    scenario: str,
+    count: int,
+    processes: int,
+    threads: int,
+    chunk_size: int,
+    directory: str,
+) -> None:
+    if scenario == "threads":
+        run_threads(generator(kind), count, threads, chunk_size, directory)
+        return
+    context = multiprocessing.get_context("fork")
+    gen = generator(kind) if scenario == "fork" else None
+    if gen is not None:
+        # The parent uses the generator before forking, and keeps generating
+        # IDs while children run
+        share = count // (processes + 1)
+        write_runs(gen, min(share, chunk_size), chunk_size, directory, "parent")
+        count -= min(share, chunk_size)
+
+    def child(share: int) -> None:
+        run_threads(gen or generator(kind), share, threads, chunk_size, directory)
+
+    workers = processes if gen is None else processes + 1
+    shares = [count // workers + (idx < count % workers) for idx in range(workers)]
+    children = [
+        context.Process(target=child, args=(share,)) for share in shares[:processes]
+    ]
+    for process in children:
+        process.start()
+    if gen is not None:
+        child(shares[-1])
+    for process in children:
+        process.join()
+        if process.exitcode != 0:
+            raise RuntimeError(f"Worker process failed with code {process.exitcode}")
+
+
+def read_run(path: str, width: int) -> t.Iterator[bytes]:
+    with open(path, "rb") as run, mmap.mmap(
+        run.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        for offset in range(0, len(data), width):
+            yield data[offset : offset + width]
+
+
+def find_duplicates(directory: str, width: int) -> t.Tuple[int, int, t.List[bytes]]:
+    """Merge sorted runs. Return the number of IDs, of duplicates, and samples."""
+    paths = [
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.getsize(os.path.join(directory, name))
+    ]
+    count = duplicates = 0
+    samples: t.List[bytes] = []
+    previous = None
+    for value in heapq.merge(*(read_run(path, width) for path in paths)):
+        count += 1
+        if value == previous:
+            duplicates += 1
+            if len(samples) < MAX_SAMPLES:
+                samples.append(value)
+        previous = value
+    return count, duplicates, samples
+
+
+def stress(
+    kind: Kind,
+    scenario: str,
+    count: int,
+    processes: int,
+    threads: int,
+    chunk_size: int,
+    workdir: t.Optional[str] = None,
+) -> Report:
+    width = t.cast(int, generator(kind).id_width)
+    with tempfile.TemporaryDirectory(prefix="genid-stress-", dir=workdir) as directory:
+        start = time.perf_counter()
+        run_scenario(kind, scenario, count, processes, threads, chunk_size, directory)
+        generated = time.perf_counter()
+        total, duplicates, samples = find_duplicates(directory, width)
+        end = time.perf_counter()
+    if total != count:
+        raise RuntimeError(f"Expected {count} IDs, found {total}")
+    return Report(
+        kind, scenario, count, duplicates, samples, generated - start, end - generated
+    )
+
+
+def peak_rss_mb() -> t.Tuple[float, float]:
+    """Peak resident memory of this process and of its largest child, in MiB."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own / 1024, children / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=[kind.value for kind in UNIQUE_KINDS],
+        help="kind of ID to check (default: all kinds generating unique IDs)",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="scenario to run (default: all scenarios)",
+    )
+    parser.add_argument("--count", type=int, default=10_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=1 << 20)
+    parser.add_argument("--workdir", help="directory holding sorted runs")
+    args = parser.parse_args()
+    kinds = [Kind(kind) for kind in args.kind] if args.kind else UNIQUE_KINDS
+    failed = False
+    print(
+        f"{'kind':>10} {'scenario':>10} {'count':>13} {'duplicates':>10}"
+        f" {'generate':>14} {'dedupe':>14}"
+    )
+    for kind in kinds:
+        for scenario in args.scenario or SCENARIOS:
+            report = stress(
+                kind,
+                scenario,
+                args.count,
+                args.processes,
+                args.threads,
+                args.chunk_size,
+                args.workdir,
+            )
+            print(
+                f"{kind.value:>10} {scenario:>10} {report.total:>13,}"
+                f" {report.duplicates:>10,}"
+                f" {report.total / report.generate_seconds:>11,.0f} /s"
+                f" {report.total / report.dedupe_seconds:>11,.0f} /s"
+            )
+            for sample in report.samples:
+                print(f"{'':>10} duplicate: {sample.hex()}")
+            failed = failed or report.duplicates > 0
+    own, children = peak_rss_mb()
+    print(f"peak RSS: {own:,.0f} MiB (parent), {children:,.0f} MiB (largest child)")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
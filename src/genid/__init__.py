@@ -4,30 +4,47 @@ from .generators import (
     IDGenerator,
     IncrementalIDGenerator,
     Kind,
+    KSUIDGenerator,
     NanoIDGenerator,
     NanosecondTimestampGenerator,
     NUIDGenerator,
     ObjectIDGenerator,
     SecretIDGenerator,
+    SpanIDGenerator,
     TimestampGenerator,
+    TraceIDGenerator,
+    TypeIDGenerator,
+    ULIDGenerator,
     UUID1Generator,
     UUID4Generator,
+    WrappedIDGenerator,
     generator,
 )
+from .monitor import MonitoredIDGenerator
+from .shard import shard_many, shard_of
 
 __all__ = [
     "__version__",
     "generator",
+    "shard_many",
+    "shard_of",
     "ConstantIDGenerator",
     "IDGenerator",
     "IncrementalIDGenerator",
     "Kind",
+    "KSUIDGenerator",
+    "MonitoredIDGenerator",
     "NanoIDGenerator",
     "NanosecondTimestampGenerator",
     "NUIDGenerator",
     "ObjectIDGenerator",
     "SecretIDGenerator",
+    "SpanIDGenerator",
     "TimestampGenerator",
+    "TraceIDGenerator",
+    "TypeIDGenerator",
     "UUID1Generator",
     "UUID4Generator",
+    "ULIDGenerator",
+    "WrappedIDGenerator",
 ]
@@ -0,0 +1,234 @@
+"""Check characters used to reject mistyped or truncated IDs without any I/O.
+
+A [`Checksum`][genid.checksum.Checksum] computes a check character over the
+string form of an ID, using the Luhn mod N algorithm over the alphabet of the
+ID. The check character belongs to the same alphabet, and detects all single
+character substitutions and most transpositions of adjacent characters.
+
+ULIDs use Crockford base32 check symbols instead (see
+[`CrockfordChecksum`][genid.checksum.CrockfordChecksum]): the check symbol is the
+value of the ULID modulo 37, written with one of the 37 check symbols.
+
+A [`CheckedIDGenerator`][genid.checksum.CheckedIDGenerator] appends a check
+character to each generated ID, and verifies IDs:
+
+```python
+from genid import generator
+from genid.checksum import CheckedIDGenerator
+
+gen = CheckedIDGenerator(generator("nanoid"))
+value = gen.new()
+assert gen.verify(value)
+assert not gen.verify(value[:-2])
+```
+
+Supported kinds are `nanoid` (with ASCII alphabets), `nuid`, `ulid` and `secret`.
+"""
+
+import string
+import typing as t
+
+from .codecs import BASE32, BASE62
+from .generators import (
+    IDGenerator,
+    Kind,
+    NanoIDGenerator,
+    NUIDGenerator,
+    SecretIDGenerator,
+    T,
+    ULIDGenerator,
+    WrappedIDGenerator,
+)
+from .nanoid import DEFAULT_ALPHABET, DEFAULT_SIZE
+from .nuid import TOTAL_LENGTH as NUID_LENGTH
+
+CROCKFORD_CHECK_SYMBOLS = BASE32.alphabet + "*~$=U"
+ULID_LENGTH = 26
+ULID_MAX = (1 << 128) - 1
+
+
+class Checksum:
+    """Luhn mod N check character of IDs written with the given alphabet.
+
+    When `width` is provided, only IDs of `width` characters (without the check
+    character) are considered valid.
+    """
+
+    def __init__(self, alphabet: str, width: t.Optional[int] = None) -> None:
+        if not alphabet.isascii() or not 1 < len(alphabet) < 256:
+            raise ValueError("Alphabet must hold between 2 and 255 ASCII characters")
+        if len(set(alphabet)) != len(alphabet):
+            raise ValueError("Alphabet characters must be unique")
+        base = len(alphabet)
+        self.alphabet = alphabet
+        self.width = width
+        self._base = base
+        self._digits = alphabet.encode()
+        # Translation tables from characters to the value they add to the sum,
+        # depending on whether they are doubled or not
+        single = bytearray(256)
+        double = bytearray(256)
+        for code, char in enumerate(self._digits):
+            single[char] = code
+            double[char] = (2 * code) // base + (2 * code) % base
+        self._single = bytes(single)
+        self._double = bytes(double)
+
+    def _is_valid(self, data: bytes) -> bool:
+        return not data.translate(None, self._digits)
+
+    def _sum(self, data: bytes, double_last: bool) -> int:
+        reverse = data[::-1]
+        doubled = reverse[0::2] if double_last else reverse[1::2]
+        single = reverse[1::2] if double_last else reverse[0::2]
+        return sum(doubled.translate(self._double)) + sum(
+            single.translate(self._single)
+        )
+
+    def compute(self, value: str) -> str:
+        """Return the check character of an ID."""
+        data = value.encode()
+        if not self._is_valid(data):
+            raise ValueError(f"Invalid character in ID: {value!r}")
+        return self.alphabet[-self._sum(data, True) % self._base]
+
+    def append(self, value: str) -> str:
+        """Return an ID followed by its check character."""
+        return value + self.compute(value)
+
+    def append_many(self, values: t.Iterable[str]) -> t.List[str]:
+        """Append check characters to several IDs."""
+        compute = self.compute
+        return [value + compute(value) for value in values]
+
+    def verify(self, value: str) -> bool:
+        """Return True when an ID ends with a valid check character."""
+        if self.width is not None and len(value) != self.width + 1:
+            return False
+        try:
+            data = value.encode("ascii")
+        except UnicodeEncodeError:
+            return False
+        if len(data) < 2 or not self._is_valid(data):
+            return False
+        return self._sum(data, False) % self._base == 0
+
+    def verify_many(self, values: t.Iterable[str]) -> t.List[bool]:
+        """Verify several IDs."""
+        verify = self.verify
+        return [verify(value) for value in values]
+
+    def strip(self, value: str) -> str:
+        """Return an ID without its check character.
+        Raise ValueError when check character is not valid.
+        """
+        if not self.verify(value):
+            raise ValueError(f"Invalid check character: {value!r}")
+        return value[:-1]
+
+
+class CrockfordChecksum(Checksum):
+    """Crockford base32 check symbol of ULIDs.
+
+    Decoding is case insensitive and accepts `I`, `L` and `O` as aliases of `1`
+    and `0`, as specified by Crockford base32.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(BASE32.accepted, ULID_LENGTH)
+
+    def _number(self, value: str) -> int:
+        number = BASE32.decode_int(value, ULID_LENGTH)
+        if number > ULID_MAX:
+            raise ValueError(f"Invalid ULID: {value!r}")
+        return number
+
+    def compute(self, value: str) -> str:
+        return CROCKFORD_CHECK_SYMBOLS[self._number(value) % 37]
+
+    def verify(self, value: str) -> bool:
+        try:
+            number = self._number(value[:-1])
+        except ValueError:
+            return False
+        return value[-1:].upper() == CROCKFORD_CHECK_SYMBOLS[number % 37]
+
+
+def checksum(kind: t.Union[str, Kind], **options: t.Any) -> Checksum:
+    """Create the checksum of IDs of given kind.
+
+    `options` are the options used to create the generator (for example
+    `alphabet` and `size` for `nanoid`, or `length` for `secret`).
+    """
+    kind = Kind(kind)
+    if kind == Kind.NANOID:
+        return Checksum(
+            options.get("alphabet", DEFAULT_ALPHABET),
+            options.get("size", DEFAULT_SIZE),
+        )
+    if kind == Kind.NUID:
+        return Checksum(BASE62.alphabet, NUID_LENGTH)
+    if kind == Kind.ULID:
+        return CrockfordChecksum()
+    if kind == Kind.SECRET:
+        return Checksum(string.hexdigits[:16], 2 * options.get("length", 16))
+    raise ValueError(f"Kind {kind.value!r} does not support checksums")
+
+
+def checksum_for(gen: IDGenerator[t.Any]) -> Checksum:
+    """Create the checksum of IDs generated by a generator."""
+    if isinstance(gen, NanoIDGenerator):
+        return checksum(Kind.NANOID, alphabet=gen.alphabet, size=gen.size)
+    if isinstance(gen, NUIDGenerator):
+        return checksum(Kind.NUID)
+    if isinstance(gen, ULIDGenerator):
+        return checksum(Kind.ULID)
+    if isinstance(gen, SecretIDGenerator):
+        return checksum(Kind.SECRET, length=gen.length)
+    raise ValueError(f"{type(gen).__name__} does not support checksums")
+
+
+class CheckedIDGenerator(WrappedIDGenerator[T]):
+    """An ID generator appending a check character to the string form of IDs
+    generated by another generator.
+
+    The checksum is derived from the wrapped generator unless `checksum` is
+    provided. Binary forms of IDs (`id_to_bytes()` and `fill_into()`) do not
+    include the check character.
+    """
+
+    __slots__ = ("_checksum",)
+
+    def __init__(
+        self, generator: IDGenerator[T], checksum: t.Optional[Checksum] = None
+    ) -> None:
+        super().__init__(generator)
+        self._checksum = checksum or checksum_for(generator)
+
+    @property
+    def checksum(self) -> Checksum:
+        """The checksum of generated IDs."""
+        return self._checksum
+
+    def verify(self, value: str) -> bool:
+        """Return True when an ID ends with a valid check character."""
+        return self._checksum.verify(value)
+
+    def verify_many(self, values: t.Iterable[str]) -> t.List[bool]:
+        """Verify several IDs."""
+        return self._checksum.verify_many(values)
+
+    def unsafe_create_id(self) -> T:
+        return self._generator.unsafe_create_id()
+
+    def unsafe_create_ids(self, count: int) -> t.List[T]:
+        return self._generator.unsafe_create_ids(count)
+
+    def id_to_string(self, value: T) -> str:
+        return self._checksum.append(self._generator.id_to_string(value))
+
+    def ids_to_strings(self, values: t.List[T]) -> t.List[str]:
+        return self._checksum.append_many(self._generator.ids_to_strings(values))
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        self._generator.unsafe_fill_into(view, offset, count)
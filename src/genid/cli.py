@@ -0,0 +1,200 @@
+"""Command line interface used to generate IDs outside of Python code.
+
+Example usage:
+
+```console
+$ genid --kind ulid --count 3
+01GTWZ5ZQ5XKJ2N8Y6QJ7G1N5V
+01GTWZ5ZQ5R0M6FCB4MMB5W4K9
+01GTWZ5ZQ5A4PXE5HX3J1W9G8T
+```
+
+IDs are generated by chunks and each chunk is written at once, so that
+millions of IDs can be generated per second for the fastest kinds.
+
+Supported formats:
+
+- `text`: one ID per line.
+- `csv`: a header line followed by one `index,id` line per ID.
+- `jsonl`: one `{"index": ..., "id": ...}` JSON object per line.
+- `binary`: IDs concatenated in binary form (8 bytes big endian integers, 12 bytes
+  ObjectIDs, 16 bytes ULIDs, UUIDs and TypeIDs (without prefix), 20 bytes KSUIDs,
+  ASCII strings for other kinds).
+"""
+
+import argparse
+import os
+import sys
+import time
+import typing as t
+from json.encoder import encode_basestring
+
+from .__about__ import __version__
+from .generators import IDGenerator, Kind, generator
+
+FORMATS = ("text", "binary", "csv", "jsonl")
+DEFAULT_CHUNK_SIZE = 65536
+BUFFER_SIZE = 1 << 20
+# Options which must be provided for some kinds
+REQUIRED_OPTIONS = {Kind.CONSTANT: ("value",)}
+# Errors raised when creating generators with invalid options
+OPTION_ERRORS = (TypeError, ValueError)
+
+
+def format_chunk(
+    gen: IDGenerator[t.Any], fmt: str, index: int, ids: t.List[t.Any]
+) -> bytes:
+    """Format a chunk of IDs generated by `gen`, starting at `index`."""
+    if fmt == "binary":
+        return gen.ids_to_bytes(ids)
+    strings = gen.ids_to_strings(ids)
+    if fmt == "text":
+        lines = strings
+    elif fmt == "csv":
+        lines = [f"{idx},{value}" for idx, value in enumerate(strings, index)]
+    elif fmt == "jsonl":
+        lines = [
+            f'{{"index": {idx}, "id": {encode_basestring(value)}}}'
+            for idx, value in enumerate(strings, index)
+        ]
+    else:
+        raise ValueError(f"Invalid format: {fmt}")
+    lines.append("")
+    return "\n".join(lines).encode()
+
+
+def generate(
+    gen: IDGenerator[t.Any],
+    output: t.BinaryIO,
+    count: int,
+    fmt: str = "text",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Write `count` IDs generated by `gen` into `output`."""
+    if fmt == "csv":
+        output.write(b"index,id\n")
+    width = gen.id_width
+    if fmt == "binary" and width is not None:
+        # Fixed-width IDs are written directly into a reused buffer
+        buffer = bytearray(min(chunk_size, count) * width)
+        view = memoryview(buffer)
+        remaining = count
+        while remaining > 0:
+            written = gen.fill_into(buffer, min(chunk_size, remaining))
+            output.write(view[: written * width])
+            remaining -= written
+        return
+    remaining = count
+    while remaining > 0:
+        index, ids = gen.new_ids_at_index(min(chunk_size, remaining))
+        output.write(format_chunk(gen, fmt, index, ids))
+        remaining -= len(ids)
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="genid", description="Generate IDs of a specific kind."
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        choices=[kind.value for kind in Kind],
+        default=Kind.UUID4.value,
+        help="kind of ID to generate (default: uuid4)",
+    )
+    parser.add_argument(
+        "-n", "--count", type=int, default=1, help="number of IDs to generate"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        default="text",
+        help="output format (default: text)",
+    )
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument("--alphabet", help="nanoid alphabet")
+    parser.add_argument("--size", type=int, help="nanoid size")
+    parser.add_argument("--offset", type=int, help="incremental offset")
+    parser.add_argument("--length", type=int, help="secret length in bytes")
+    parser.add_argument("--value", help="constant value")
+    parser.add_argument("--prefix", help="typeid prefix")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed of a fast non-cryptographic random source (random-based kinds only)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="number of IDs generated at once",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report throughput"
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    return parser
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("count must be a non-negative integer")
+    if args.chunk_size <= 0:
+        parser.error("chunk size must be a positive integer")
+    if args.alphabet == "":
+        parser.error("alphabet must not be empty")
+    if args.size is not None and args.size <= 0:
+        parser.error("size must be a positive integer")
+    if args.length is not None and args.length <= 0:
+        parser.error("length must be a positive integer")
+    if args.offset is not None and args.offset < 0:
+        parser.error("offset must be a non-negative integer")
+    if args.format == "binary":
+        # Incremental IDs are written as 8 bytes integers
+        if args.offset is not None and args.offset + args.count > 1 << 64:
+            parser.error("offset is too large for 8 bytes IDs in binary format")
+        if args.value == "":
+            parser.error("value must not be empty in binary format")
+    kwargs = {
+        key: getattr(args, key)
+        for key in ("alphabet", "size", "offset", "length", "value", "prefix")
+        if getattr(args, key) is not None
+    }
+    options = sorted(kwargs)
+    for option in REQUIRED_OPTIONS.get(Kind(args.kind), ()):
+        if option not in kwargs:
+            parser.error(f"option --{option} is required for kind {args.kind}")
+    if args.seed is not None:
+        kwargs["rng"] = args.seed
+        options.append("seed")
+    try:
+        gen = generator(args.kind, **kwargs)
+    except OPTION_ERRORS as exc:
+        parser.error(
+            f"invalid options for kind {args.kind} ({', '.join(options)}): {exc}"
+        )
+    start = time.perf_counter()
+    try:
+        if args.output:
+            with open(args.output, "wb", buffering=BUFFER_SIZE) as output:
+                generate(gen, output, args.count, args.format, args.chunk_size)
+        else:
+            generate(gen, sys.stdout.buffer, args.count, args.format, args.chunk_size)
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # Output was closed early (for example when piped into `head`).
+        # Redirect standard output to devnull to avoid another error at exit.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    elapsed = time.perf_counter() - start
+    if not args.quiet:
+        rate = args.count / elapsed if elapsed else 0
+        print(
+            f"Generated {args.count} IDs in {elapsed:.3f}s ({rate:,.0f} IDs/s)",
+            file=sys.stderr,
+        )
+    return 0
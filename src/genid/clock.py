@@ -0,0 +1,191 @@
+"""Clock sources used by time-based ID generators.
+
+Time-based generators (`timestamp`, `nstimestamp`, `objectid`, `ulid`, `ksuid`)
+accept an optional `clock` argument. By default, they read the system clock.
+
+- [`SystemClock`][genid.clock.SystemClock] reads the system clock on each call.
+- [`MillisecondClock`][genid.clock.MillisecondClock] reads the system clock with
+  millisecond resolution using integer arithmetic only.
+- [`CachedClock`][genid.clock.CachedClock] is a coarse clock refreshed in background
+  at most once per tick, so that reading time does not require a system call.
+- [`VirtualClock`][genid.clock.VirtualClock] is a manually driven clock, useful within
+  tests and benchmarks.
+"""
+
+import abc
+import os
+import threading
+import time
+import typing as t
+import weakref
+
+NS_IN_MS = 1_000_000
+NS_IN_S = 1_000_000_000
+
+
+class Clock(metaclass=abc.ABCMeta):
+    """Abstract base class for clocks.
+
+    Implementations must provide the `time_ns()` method. Other methods are
+    derived from `time_ns()` using integer arithmetic, and can be overriden
+    when a cheaper implementation is available.
+    """
+
+    @abc.abstractmethod
+    def time_ns(self) -> int:
+        """Return time as an integer number of nanoseconds since the epoch."""
+        raise NotImplementedError
+
+    def time_ms(self) -> int:
+        """Return time as an integer number of milliseconds since the epoch."""
+        return self.time_ns() // NS_IN_MS
+
+    def time_s(self) -> int:
+        """Return time as an integer number of seconds since the epoch."""
+        return self.time_ns() // NS_IN_S
+
+    def time(self) -> float:
+        """Return time as a floating point number of seconds since the epoch."""
+        return self.time_ns() / NS_IN_S
+
+
+class SystemClock(Clock):
+    """A clock reading system time on each call."""
+
+    def time_ns(self) -> int:
+        return time.time_ns()
+
+    def time_s(self) -> int:
+        return int(time.time())
+
+    def time(self) -> float:
+        return time.time()
+
+
+class MillisecondClock(Clock):
+    """A clock reading system time with millisecond resolution.
+
+    Time is never converted to a floating point number.
+    """
+
+    def time_ns(self) -> int:
+        return time.time_ns() // NS_IN_MS * NS_IN_MS
+
+    def time_ms(self) -> int:
+        return time.time_ns() // NS_IN_MS
+
+
+# Cached clocks must restart their refresh thread in forked processes
+_cached_clocks: "weakref.WeakSet[CachedClock]" = weakref.WeakSet()
+
+
+class CachedClock(Clock):
+    """A coarse clock refreshed by a background thread at most once per tick.
+
+    Reading time from a cached clock does not perform any system call nor any
+    conversion, at the cost of a resolution limited to `tick` seconds.
+    Values returned by a cached clock never decrease as long as the source clock
+    does not go backward.
+
+    Arguments:
+        tick: refresh interval in seconds.
+        source: the clock to read time from. Defaults to the system clock.
+    """
+
+    def __init__(self, tick: float = 0.001, source: t.Optional[Clock] = None) -> None:
+        if tick <= 0:
+            raise ValueError("Clock tick must be a positive number")
+        self.tick = tick
+        self.source = source or SYSTEM_CLOCK
+        self._ns = self._ms = self._s = 0
+        self._stopped = threading.Event()
+        self.refresh()
+        self._start()
+        _cached_clocks.add(self)
+
+    def _start(self) -> None:
+        self._stopped.clear()
+        # The thread must not hold a reference to the clock, otherwise
+        # the clock would never be garbage collected
+        thread = threading.Thread(
+            target=_refresh_loop,
+            args=(weakref.ref(self), self._stopped, self.tick),
+            name="genid-cached-clock",
+            daemon=True,
+        )
+        thread.start()
+
+    def refresh(self) -> None:
+        """Read time from the source clock."""
+        ns = self.source.time_ns()
+        self._ms = ns // NS_IN_MS
+        self._s = ns // NS_IN_S
+        self._ns = ns
+
+    def close(self) -> None:
+        """Stop refreshing time."""
+        self._stopped.set()
+
+    def time_ns(self) -> int:
+        return self._ns
+
+    def time_ms(self) -> int:
+        return self._ms
+
+    def time_s(self) -> int:
+        return self._s
+
+    def __del__(self) -> None:
+        self._stopped.set()
+
+
+def _refresh_loop(
+    ref: "weakref.ReferenceType[CachedClock]", stopped: threading.Event, tick: float
+) -> None:
+    while not stopped.wait(tick):
+        clock = ref()
+        if clock is None:
+            return
+        clock.refresh()
+        del clock
+
+
+def _restart_cached_clocks() -> None:
+    for clock in list(_cached_clocks):
+        if not clock._stopped.is_set():
+            clock._stopped = threading.Event()
+            clock._start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_cached_clocks)
+
+
+class VirtualClock(Clock):
+    """A clock which only moves when told to.
+
+    Arguments:
+        start: initial time in nanoseconds since the epoch.
+        step: number of nanoseconds added to current time after each read.
+    """
+
+    def __init__(self, start: int = 0, step: int = 0) -> None:
+        self._ns = start
+        self.step = step
+
+    def time_ns(self) -> int:
+        ns = self._ns
+        self._ns = ns + self.step
+        return ns
+
+    def set(self, ns: int) -> None:
+        """Set current time in nanoseconds since the epoch."""
+        self._ns = ns
+
+    def advance(self, ns: int) -> None:
+        """Move time forward (or backward when `ns` is negative)."""
+        self._ns += ns
+
+
+SYSTEM_CLOCK = SystemClock()
+"""Default clock used by time-based generators."""
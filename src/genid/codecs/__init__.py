@@ -0,0 +1,39 @@
+"""Table-driven codecs shared by all kinds of IDs.
+
+A [`Codec`][genid.codecs.Codec] converts fixed-width integers or bytes to text
+in a given base and back, one value at a time or in batches over buffers of
+packed values:
+
+```python
+from genid.codecs import BASE62
+
+text = BASE62.encode(bytes(range(20)))
+assert BASE62.decode(text, 20) == bytes(range(20))
+```
+
+Available codecs:
+
+- `BASE16`: lowercase hexadecimal (ObjectIDs and secrets). Decoding is case insensitive.
+- `BASE32`: Crockford base32 (ULIDs). Decoding is case insensitive, and accepts
+  `I`, `L` and `O` as aliases of `1` and `0`.
+- `BASE32_LOWER`: lowercase Crockford base32 (TypeIDs).
+- `BASE58`: Bitcoin base58.
+- `BASE62`: digits, uppercase then lowercase letters (KSUIDs and NUIDs).
+"""
+
+from .codec import Codec
+
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+CROCKFORD_ALIASES = {"I": "1", "i": "1", "L": "1", "l": "1", "O": "0", "o": "0"}
+
+BASE16 = Codec("0123456789abcdef", case_insensitive=True)
+BASE32 = Codec(CROCKFORD, CROCKFORD_ALIASES, case_insensitive=True)
+BASE32_LOWER = Codec(
+    CROCKFORD.lower(),
+    {alias: digit.lower() for alias, digit in CROCKFORD_ALIASES.items()},
+    case_insensitive=True,
+)
+BASE58 = Codec("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
+BASE62 = Codec("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+__all__ = ["Codec", "BASE16", "BASE32", "BASE32_LOWER", "BASE58", "BASE62"]
@@ -0,0 +1,242 @@
+import typing as t
+
+INVALID = 0xFF
+# Digits understood by `int(value, base)` for bases up to 36
+INT_DIGITS = b"0123456789abcdefghijklmnopqrstuvwxyz"
+# Byte rejected by `int()`, used for characters outside of the alphabet
+INT_INVALID = ord("!")
+
+Buffer = t.Union[bytes, bytearray, memoryview]
+
+
+class Codec:
+    """Fixed-width conversion between integers (or bytes) and text in any base.
+
+    Encoding and decoding are table-driven:
+
+    - Two digits are encoded at once using a table of all pairs of digits.
+      Power of two bases extract pairs using shifts, other bases using `divmod()`.
+    - Text is decoded by translating all characters at once, then by `int()`
+      for bases up to 36, or two digits at once for larger bases.
+
+    Arguments:
+        alphabet: the digits of the base, from lowest to highest value.
+        aliases: additional characters accepted when decoding, mapped to a digit.
+        case_insensitive: accept both cases of digits when decoding.
+    """
+
+    def __init__(
+        self,
+        alphabet: str,
+        aliases: t.Optional[t.Mapping[str, str]] = None,
+        case_insensitive: bool = False,
+    ) -> None:
+        base = len(alphabet)
+        if not alphabet.isascii() or not 2 <= base <= 255:
+            raise ValueError("Alphabet must hold between 2 and 255 ASCII characters")
+        if len(set(alphabet)) != base:
+            raise ValueError("Alphabet characters must be unique")
+        self.alphabet = alphabet
+        self.base = base
+        self.case_insensitive = case_insensitive
+        # Number of bits of each digit when base is a power of two, else 0
+        self.bits = base.bit_length() - 1 if base & (base - 1) == 0 else 0
+        self.pairs: t.List[str] = [a + b for a in alphabet for b in alphabet]
+        self.byte_pairs: t.List[bytes] = [pair.encode() for pair in self.pairs]
+        accepted = {char: char for char in alphabet}
+        if case_insensitive:
+            for char in alphabet:
+                for variant in (char.lower(), char.upper()):
+                    if accepted.setdefault(variant, char) != char:
+                        raise ValueError(f"Alphabet is not case insensitive: {char}")
+        for alias, char in (aliases or {}).items():
+            if char not in alphabet or accepted.setdefault(alias, char) != char:
+                raise ValueError(f"Invalid alias: {alias!r}")
+        decode = bytearray([INVALID] * 256)
+        for char, digit in accepted.items():
+            decode[ord(char)] = alphabet.index(digit)
+        self.decode_table = bytes(decode)
+        self.accepted = "".join(sorted(accepted))
+        if base <= len(INT_DIGITS):
+            self._int_table: t.Optional[bytes] = bytes(
+                INT_INVALID if value == INVALID else INT_DIGITS[value]
+                for value in decode
+            )
+        else:
+            self._int_table = None
+        self._widths: t.Dict[int, int] = {}
+        self._shifts: t.Dict[int, t.Tuple[int, ...]] = {}
+        self._pair_mask = (1 << (2 * self.bits)) - 1
+        self._base_pair = base * base
+        # Formats of lowercase and uppercase hexadecimal alphabets
+        self._format = {
+            "0123456789abcdef": "x",
+            "0123456789ABCDEF": "X",
+        }.get(alphabet)
+        # Unbound, so that codecs do not hold a reference cycle through it
+        self._encoder: t.Callable[["Codec", int, int], str] = (
+            Codec._encode_format
+            if self._format
+            else Codec._encode_shifts if self.bits else Codec._encode_divmod
+        )
+
+    def __repr__(self) -> str:
+        return f"Codec({self.alphabet!r})"
+
+    def width(self, size: int) -> int:
+        """Number of characters used to encode `size` bytes."""
+        try:
+            return self._widths[size]
+        except KeyError:
+            width = 0
+            while self.base**width < 256**size:
+                width += 1
+            self._widths[size] = width
+            return width
+
+    def encode_int(self, value: int, width: int) -> str:
+        """Encode a non-negative integer as exactly `width` digits."""
+        if value < 0 or value >= self.base**width:
+            raise ValueError(f"Value does not fit in {width} digits: {value}")
+        return self._encoder(self, value, width)
+
+    # Encoders do not call each other, so that the integer being encoded is only
+    # referenced by the encoder and can be released as soon as it is divided.
+
+    def _encode_format(self, value: int, width: int) -> str:
+        return format(value, f"0{width}{self._format}")
+
+    def _encode_shifts(self, value: int, width: int) -> str:
+        pairs = self.pairs
+        if width == 26 and self.bits == 5:
+            return _encode_pairs_128(value, pairs)
+        try:
+            shifts = self._shifts[width]
+        except KeyError:
+            even = width - width % 2
+            shifts = self._shifts[width] = tuple(
+                range(self.bits * (even - 2), -1, -2 * self.bits)
+            )
+        mask = self._pair_mask
+        digits = (
+            [self.alphabet[value >> (self.bits * (width - 1))]] if width % 2 else []
+        )
+        for shift in shifts:
+            digits.append(pairs[(value >> shift) & mask])
+        return "".join(digits)
+
+    def _encode_divmod(self, value: int, width: int) -> str:
+        pairs, base_pair = self.pairs, self._base_pair
+        digits: t.List[str] = []
+        for _ in range(width // 2):
+            value, pair = divmod(value, base_pair)
+            digits.append(pairs[pair])
+        if width % 2:
+            digits.append(self.alphabet[value])
+        digits.reverse()
+        return "".join(digits)
+
+    def decode_int(self, text: str, width: t.Optional[int] = None) -> int:
+        """Decode digits into an integer. When `width` is provided, text must
+        hold exactly `width` digits. Raise ValueError on invalid digits.
+        """
+        if (width is not None and len(text) != width) or not text:
+            raise ValueError(f"Expected {width} digits: {text!r}")
+        try:
+            data = text.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"Invalid digits: {text!r}") from None
+        if self._int_table is not None:
+            try:
+                return int(data.translate(self._int_table), self.base)
+            except ValueError:
+                raise ValueError(f"Invalid digits: {text!r}") from None
+        digits = data.translate(self.decode_table)
+        if INVALID in digits:
+            raise ValueError(f"Invalid digits: {text!r}")
+        base, base_pair = self.base, self._base_pair
+        start = len(digits) % 2
+        value = digits[0] if start else 0
+        for idx in range(start, len(digits), 2):
+            value = value * base_pair + digits[idx] * base + digits[idx + 1]
+        return value
+
+    def encode(self, binary: Buffer) -> str:
+        """Encode bytes as a big endian integer, using `width(len(binary))` digits."""
+        if self._format == "x":
+            return binary.hex()
+        return self._encoder(
+            self, int.from_bytes(binary, "big"), self.width(len(binary))
+        )
+
+    def decode(self, text: str, size: int) -> bytes:
+        """Decode text encoded by `encode()` into `size` bytes."""
+        if self._format and self.case_insensitive:
+            try:
+                data = bytes.fromhex(text)
+            except ValueError:
+                raise ValueError(f"Invalid digits: {text!r}") from None
+            # Whitespace is ignored by `bytes.fromhex()`
+            if len(data) != size or len(text) != 2 * size:
+                raise ValueError(f"Expected {2 * size} digits: {text!r}")
+            return data
+        value = self.decode_int(text, self.width(size))
+        if value >> (8 * size):
+            raise ValueError(f"Value does not fit in {size} bytes: {text!r}")
+        return value.to_bytes(size, "big")
+
+    def encode_many(self, buffer: Buffer, size: int) -> t.List[str]:
+        """Encode a buffer holding several packed values of `size` bytes."""
+        view = memoryview(buffer).cast("B")
+        if len(view) % size:
+            raise ValueError(f"Buffer length must be a multiple of {size} bytes")
+        if self._format == "x":
+            data = view.hex()
+            return [
+                data[start : start + 2 * size]
+                for start in range(0, len(data), 2 * size)
+            ]
+        encode, width, from_bytes = self._encoder, self.width(size), int.from_bytes
+        return [
+            encode(self, from_bytes(view[offset : offset + size], "big"), width)
+            for offset in range(0, len(view), size)
+        ]
+
+    def decode_many(self, values: t.Iterable[str], size: int) -> bytearray:
+        """Decode several values into a buffer of packed values of `size` bytes."""
+        decode = self.decode
+        buffer = bytearray()
+        for value in values:
+            buffer += decode(value, size)
+        return buffer
+
+    def byte_table(self) -> bytes:
+        """Translation table mapping each byte to the digit of its lowest bits.
+        Only available for power of two bases: mapping random bytes through this
+        table gives uniformly distributed digits.
+        """
+        if not self.bits:
+            raise ValueError(f"Base {self.base} is not a power of two")
+        mask = self.base - 1
+        return bytes(ord(self.alphabet[byte & mask]) for byte in range(256))
+
+
+def _encode_pairs_128(number: int, pairs: t.Sequence[str]) -> str:
+    # Unrolled so that no intermediate list or bytes slice is allocated
+    return "".join(
+        (
+            pairs[number >> 120],
+            pairs[(number >> 110) & 0x3FF],
+            pairs[(number >> 100) & 0x3FF],
+            pairs[(number >> 90) & 0x3FF],
+            pairs[(number >> 80) & 0x3FF],
+            pairs[(number >> 70) & 0x3FF],
+            pairs[(number >> 60) & 0x3FF],
+            pairs[(number >> 50) & 0x3FF],
+            pairs[(number >> 40) & 0x3FF],
+            pairs[(number >> 30) & 0x3FF],
+            pairs[(number >> 20) & 0x3FF],
+            pairs[(number >> 10) & 0x3FF],
+            pairs[number & 0x3FF],
+        )
+    )
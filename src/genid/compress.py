@@ -0,0 +1,373 @@
+"""Delta/varint compression of sorted ID sequences.
+
+Sorted IDs produced by time-based or incremental generators share most of their
+high-order bytes. The codec splits each ID into fields, and stores each field as
+a column within blocks of IDs:
+
+- timestamps, counters and integers are stored as zigzag varint deltas from the
+  previous ID of the block (a single byte for most consecutive IDs).
+- random parts are stored as raw bytes.
+
+Supported kinds are `incremental`, `timestamp`, `nstimestamp`, `objectid`, `ulid`
+and `ksuid`. IDs do not need to be sorted, but unsorted IDs compress worse.
+
+Each block holds `block_size` IDs (except the last one) and can be decoded
+independently, so that IDs can be decoded by streaming from a file, or accessed
+randomly using the block index written at the end of the data:
+
+```text
+header   magic (4 bytes) | version (1 byte) | kind tag (1 byte) | block size (4 bytes)
+block*   count (varint) | payload size (varint) | payload
+end      0 (varint)
+index    offset of each block (8 bytes each)
+footer   number of IDs (8 bytes) | number of blocks (4 bytes) | magic (4 bytes)
+```
+"""
+
+import io
+import struct
+import typing as t
+
+from .generators import Kind
+from .serialize import KIND_TAGS, TAG_KINDS, pack_values, unpack_values
+
+MAGIC = b"GIDZ"
+VERSION = 1
+HEADER = struct.Struct(">4sBBI")
+FOOTER = struct.Struct(">QI4s")
+INDEX_ENTRY = struct.Struct(">Q")
+DEFAULT_BLOCK_SIZE = 1024
+
+# Fields of each supported kind, as (width in bytes, stored as delta) tuples
+LAYOUTS: t.Dict[Kind, t.Tuple[t.Tuple[int, bool], ...]] = {
+    Kind.INCREMENTAL: ((8, True),),
+    Kind.TIMESTAMP: ((8, True),),
+    Kind.NSTIMESTAMP: ((8, True),),
+    # Timestamp, machine and process identifiers, and counter
+    Kind.OBJECTID: ((4, True), (5, True), (3, True)),
+    # Timestamp and randomness
+    Kind.ULID: ((6, True), (10, False)),
+    Kind.KSUID: ((4, True), (16, False)),
+}
+
+
+class CorruptedData(ValueError):
+    """Raised when compressed data cannot be decoded."""
+
+
+def _layout(kind: Kind) -> t.Tuple[t.Tuple[int, bool], ...]:
+    try:
+        return LAYOUTS[kind]
+    except KeyError:
+        raise ValueError(f"Cannot compress IDs of kind {kind.value}") from None
+
+
+def _append_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: t.Any, position: int) -> t.Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _read_stream_varint(stream: t.BinaryIO) -> t.Optional[int]:
+    value = shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def encode_block(kind: Kind, packed: bytes) -> bytes:
+    """Encode IDs packed back to back (see `genid.serialize.pack_values()`)."""
+    layout = _layout(kind)
+    width = sum(field_width for field_width, _ in layout)
+    size = len(packed)
+    out = bytearray()
+    start = 0
+    for field_width, delta in layout:
+        end = start + field_width
+        if delta:
+            previous = 0
+            for offset in range(start, size, width):
+                value = int.from_bytes(packed[offset : offset + field_width], "big")
+                diff = value - previous
+                previous = value
+                zigzag = diff << 1 if diff >= 0 else (-diff << 1) - 1
+                while zigzag > 0x7F:
+                    out.append(zigzag & 0x7F | 0x80)
+                    zigzag >>= 7
+                out.append(zigzag)
+        else:
+            out += b"".join(
+                packed[offset : offset + field_width]
+                for offset in range(start, size, width)
+            )
+        start = end
+    return bytes(out)
+
+
+def decode_block(kind: Kind, payload: bytes, count: int) -> bytes:
+    """Decode a block of `count` IDs. Return IDs packed back to back."""
+    columns: t.List[t.List[bytes]] = []
+    position = 0
+    try:
+        for field_width, delta in _layout(kind):
+            if delta:
+                values: t.List[bytes] = []
+                previous = 0
+                for _ in range(count):
+                    zigzag = shift = 0
+                    while True:
+                        byte = payload[position]
+                        position += 1
+                        zigzag |= (byte & 0x7F) << shift
+                        if byte < 0x80:
+                            break
+                        shift += 7
+                    previous += -((zigzag + 1) >> 1) if zigzag & 1 else zigzag >> 1
+                    values.append(previous.to_bytes(field_width, "big"))
+            else:
+                end = position + field_width * count
+                if end > len(payload):
+                    raise CorruptedData("Block is too short")
+                values = [
+                    payload[offset : offset + field_width]
+                    for offset in range(position, end, field_width)
+                ]
+                position = end
+            columns.append(values)
+    except (IndexError, OverflowError) as exc:
+        raise CorruptedData("Invalid block") from exc
+    if position != len(payload):
+        raise CorruptedData("Unexpected trailing bytes in block")
+    return b"".join(b"".join(fields) for fields in zip(*columns))
+
+
+class Encoder:
+    """Streaming encoder writing compressed IDs into a binary file.
+
+    IDs are buffered until a block is full. Encoder must be closed (or used as a
+    context manager) in order to write the last block and the block index.
+    """
+
+    def __init__(
+        self,
+        output: t.BinaryIO,
+        kind: t.Union[str, Kind],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        self.kind = Kind(kind)
+        self.width = sum(field_width for field_width, _ in _layout(self.kind))
+        self.block_size = block_size
+        self._output = output
+        self._pending = bytearray()
+        self._offsets: t.List[int] = []
+        self._count = 0
+        self._position = output.write(
+            HEADER.pack(MAGIC, VERSION, KIND_TAGS[self.kind], block_size)
+        )
+        self._closed = False
+
+    def write(self, values: t.Sequence[t.Any]) -> None:
+        """Write IDs (objects returned by a generator of the same kind)."""
+        self.write_packed(pack_values(self.kind, values))
+
+    def write_packed(self, data: t.Union[bytes, bytearray, memoryview]) -> None:
+        """Write IDs in binary form, packed back to back."""
+        if self._closed:
+            raise ValueError("Encoder is closed")
+        if len(data) % self.width:
+            raise ValueError(f"Data length is not a multiple of {self.width}")
+        self._pending += data
+        block_bytes = self.block_size * self.width
+        if len(self._pending) < block_bytes:
+            return
+        view = memoryview(self._pending)
+        end = len(view) - len(view) % block_bytes
+        for start in range(0, end, block_bytes):
+            self._write_block(bytes(view[start : start + block_bytes]))
+        view.release()
+        del self._pending[:end]
+
+    def _write_block(self, packed: bytes) -> None:
+        count = len(packed) // self.width
+        payload = encode_block(self.kind, packed)
+        frame = bytearray()
+        _append_varint(frame, count)
+        _append_varint(frame, len(payload))
+        self._offsets.append(self._position)
+        self._position += self._output.write(frame) + self._output.write(payload)
+        self._count += count
+
+    @property
+    def count(self) -> int:
+        """Number of IDs written so far, including buffered IDs."""
+        return self._count + len(self._pending) // self.width
+
+    def close(self) -> None:
+        """Write the last block, the block index and the footer."""
+        if self._closed:
+            return
+        if self._pending:
+            self._write_block(bytes(self._pending))
+            self._pending.clear()
+        self._closed = True
+        index = b"".join(INDEX_ENTRY.pack(offset) for offset in self._offsets)
+        self._output.write(b"\x00" + index)
+        self._output.write(FOOTER.pack(self._count, len(self._offsets), MAGIC))
+
+    def __enter__(self) -> "Encoder":
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        self.close()
+
+
+def _read_header(data: bytes) -> t.Tuple[Kind, int]:
+    if len(data) < HEADER.size:
+        raise CorruptedData("Data is too short")
+    magic, version, tag, block_size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise CorruptedData("Invalid header")
+    kind = TAG_KINDS.get(tag)
+    if kind is None or kind not in LAYOUTS or block_size <= 0:
+        raise CorruptedData("Invalid header")
+    return kind, block_size
+
+
+class Decoder:
+    """Streaming decoder reading compressed IDs from a binary file.
+
+    Blocks are read and decoded one at a time, so the whole data never has to
+    fit in memory.
+    """
+
+    def __init__(self, stream: t.BinaryIO) -> None:
+        self._stream = stream
+        self.kind, self.block_size = _read_header(stream.read(HEADER.size))
+
+    def iter_packed(self) -> t.Iterator[bytes]:
+        """Iterate over decoded blocks of IDs in binary form, packed back to back."""
+        stream = self._stream
+        while True:
+            count = _read_stream_varint(stream)
+            if count is None:
+                raise CorruptedData("Unexpected end of data")
+            if count == 0:
+                return
+            size = _read_stream_varint(stream)
+            if size is None:
+                raise CorruptedData("Unexpected end of data")
+            payload = stream.read(size)
+            if len(payload) != size:
+                raise CorruptedData("Unexpected end of data")
+            yield decode_block(self.kind, payload, count)
+
+    def iter_blocks(self) -> t.Iterator[t.List[t.Any]]:
+        """Iterate over decoded blocks of IDs."""
+        width = sum(field_width for field_width, _ in LAYOUTS[self.kind])
+        for packed in self.iter_packed():
+            yield unpack_values(self.kind, packed, len(packed) // width)
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        for block in self.iter_blocks():
+            yield from block
+
+
+class CompressedIDs(t.Sequence[t.Any]):
+    """Random access to compressed IDs.
+
+    `data` can be any bytes-like object, such as a memory-mapped file. Accessing
+    an ID only decodes the block holding it. The last decoded block is cached.
+    """
+
+    def __init__(self, data: t.Union[bytes, bytearray, memoryview, t.Any]) -> None:
+        self._data = data
+        self.kind, self.block_size = _read_header(bytes(data[: HEADER.size]))
+        if len(data) < HEADER.size + 1 + FOOTER.size:
+            raise CorruptedData("Data is too short")
+        self._count, blocks, magic = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        index_start = len(data) - FOOTER.size - blocks * INDEX_ENTRY.size
+        if magic != MAGIC or index_start <= HEADER.size:
+            raise CorruptedData("Invalid footer")
+        self._offsets = [
+            INDEX_ENTRY.unpack_from(data, index_start + i * INDEX_ENTRY.size)[0]
+            for i in range(blocks)
+        ]
+        self._cache: t.Tuple[int, t.List[t.Any]] = (-1, [])
+
+    def block(self, number: int) -> t.List[t.Any]:
+        """Decode a single block of IDs."""
+        if self._cache[0] == number:
+            return self._cache[1]
+        try:
+            position = self._offsets[number]
+        except IndexError:
+            raise IndexError(f"Block index out of range: {number}") from None
+        try:
+            count, position = _read_varint(self._data, position)
+            size, position = _read_varint(self._data, position)
+        except IndexError as exc:
+            raise CorruptedData("Unexpected end of data") from exc
+        payload = bytes(self._data[position : position + size])
+        packed = decode_block(self.kind, payload, count)
+        values = unpack_values(self.kind, packed, count)
+        self._cache = (number, values)
+        return values
+
+    def __len__(self) -> int:
+        return int(self._count)
+
+    @t.overload
+    def __getitem__(self, index: int) -> t.Any: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[t.Any]: ...
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ID index out of range")
+        number, position = divmod(index, self.block_size)
+        return self.block(number)[position]
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        for number in range(len(self._offsets)):
+            yield from self.block(number)
+
+
+def compress(
+    kind: t.Union[str, Kind],
+    values: t.Sequence[t.Any],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> bytes:
+    """Compress IDs of a single kind."""
+    output = io.BytesIO()
+    with Encoder(output, kind, block_size) as encoder:
+        encoder.write(values)
+    return output.getvalue()
+
+
+def decompress(data: t.Union[bytes, bytearray, memoryview]) -> t.List[t.Any]:
+    """Decompress IDs compressed by `compress()` or an `Encoder`."""
+    return list(Decoder(io.BytesIO(data)))
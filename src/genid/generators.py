@@ -1,16 +1,31 @@
 import abc
 import enum
+import functools
+import os
+import struct
 import threading
 import typing as t
-from secrets import token_hex
-from time import time, time_ns
-from uuid import UUID, uuid1, uuid4
+import weakref
+from uuid import UUID, uuid1
 
+from .clock import SYSTEM_CLOCK, Clock
+from .codecs import BASE16, Codec
+from .feistel import FeistelPermutation
+from .hilo import DEFAULT_BLOCK_SIZE, BlockAllocator
+from .ksuid import KSUID
+from .ksuid.constants import EPOCH as KSUID_EPOCH
 from .nanoid import DEFAULT_ALPHABET, DEFAULT_SIZE, nanoid
 from .nuid import NUID
+from .nuid import TOTAL_LENGTH as NUID_LENGTH
 from .objectid import ObjectID
+from .rng import Rng, get_randbytes
+from .typeid import TypeID, encode_suffix, uuid7_bytes, validate_prefix
 from .ulid import ULID
 
+DEFAULT_CHUNK_SIZE = 1024
+# Number of trace or span IDs drawn at once from random bytes
+DEFAULT_POOL_SIZE = 1024
+
 T = t.TypeVar("T")
 GeneratorT = t.TypeVar("GeneratorT", bound="IDGenerator[t.Any]")
 
@@ -23,6 +38,12 @@ class IDGenerator(t.Generic[T], metaclass=abc.ABCMeta):
     to return a string based on generated id.
     """
 
+    __slots__ = ("_count", "_counter_lock", "__weakref__")
+
+    # True when `unsafe_create_id()` and `unsafe_create_ids()` can be called
+    # concurrently. Lock is then only held while incrementing the counter.
+    _concurrent_create = False
+
     def __init__(self) -> None:
         self._count = 0
         self._counter_lock = threading.Lock()
@@ -32,11 +53,43 @@ class IDGenerator(t.Generic[T], metaclass=abc.ABCMeta):
         """Get a new ID. Object type can depend on implementation."""
         raise NotImplementedError
 
-    @staticmethod
-    def id_to_string(value: t.Any) -> str:
+    def unsafe_create_ids(self, count: int) -> t.List[T]:
+        """Get several new IDs. Implementations can override this method
+        when IDs can be generated faster in batches.
+        """
+        create = self.unsafe_create_id
+        return [create() for _ in range(count)]
+
+    def id_to_string(self, value: T) -> str:
         """Transform ID into string."""
         return str(value)
 
+    def ids_to_strings(self, values: t.List[T]) -> t.List[str]:
+        """Transform several IDs into strings."""
+        return list(map(self.id_to_string, values))
+
+    def id_to_bytes(self, value: T) -> bytes:
+        """Transform ID into bytes. Returns ID string encoded as ASCII by default."""
+        return self.id_to_string(value).encode()
+
+    def ids_to_bytes(self, values: t.List[T]) -> bytes:
+        """Transform several IDs into bytes and concatenate them."""
+        return b"".join(map(self.id_to_bytes, values))
+
+    @property
+    def id_width(self) -> t.Optional[int]:
+        """Number of bytes written by `fill_into()` for each ID.
+        None when IDs do not have a fixed width.
+        """
+        return None
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        """Write `count` new IDs into `view` starting at `offset`. Implementations
+        can override this method when IDs can be written without intermediate objects.
+        """
+        end = offset + count * t.cast(int, self.id_width)
+        view[offset:end] = self.ids_to_bytes(self.unsafe_create_ids(count))
+
     def unsafe_revert(self) -> None:
         """Revert side effect of last ID generation. Does nothing by default."""
         pass
@@ -45,21 +98,89 @@ class IDGenerator(t.Generic[T], metaclass=abc.ABCMeta):
         """Get a tuple holding new ID index and new ID as an object.
         Object type can depend on implementation.
         """
-        with self._counter_lock:
+        if self._concurrent_create:
             _id = self.unsafe_create_id()
-            _index = self._count
-            if idx is not None and _index != idx:
+            with self._counter_lock:
+                _index = self._count
+                if idx is None or _index == idx:
+                    self._count += 1
+                    return _index, _id
+        else:
+            with self._counter_lock:
+                _id = self.unsafe_create_id()
+                _index = self._count
+                if idx is None or _index == idx:
+                    self._count += 1
+                    return _index, _id
                 self.unsafe_revert()
-                raise IndexError(
-                    f"Cannot create ID with wrong index. Expected: {idx}. Got: {_index}"
-                )
-            self._count += 1
-        return _index, _id
+        raise IndexError(
+            f"Cannot create ID with wrong index. Expected: {idx}. Got: {_index}"
+        )
+
+    def new_ids_at_index(self, count: int) -> t.Tuple[int, t.List[T]]:
+        """Get a tuple holding index of first new ID and a list of `count` new IDs.
+        Object type can depend on implementation.
+        """
+        if self._concurrent_create:
+            _ids = self.unsafe_create_ids(count)
+            with self._counter_lock:
+                _index = self._count
+                self._count += count
+            return _index, _ids
+        with self._counter_lock:
+            _ids = self.unsafe_create_ids(count)
+            _index = self._count
+            self._count += count
+        return _index, _ids
+
+    def fill_into(
+        self, buffer: t.Any, count: t.Optional[int] = None, offset: int = 0
+    ) -> int:
+        """Write new IDs in binary form into a writable buffer.
+
+        IDs are written back to back starting at byte `offset`, each ID using
+        `id_width` bytes. When `count` is None, as many IDs as possible are written.
+        Returns the number of IDs written. Raises ValueError for empty IDs, or when
+        `count` IDs do not fit into the buffer.
+        """
+        width = self.id_width
+        if width is None:
+            raise TypeError(f"{type(self).__name__} does not generate fixed-width IDs")
+        if width == 0:
+            raise ValueError(f"{type(self).__name__} generates empty IDs")
+        view = memoryview(buffer)
+        if view.readonly:
+            raise TypeError("Buffer must be writable")
+        view = view.cast("B")
+        available = (len(view) - offset) // width if offset >= 0 else -1
+        if count is None:
+            count = max(available, 0)
+        elif count < 0 or count > available:
+            raise ValueError(
+                f"Cannot write {count} IDs of {width} bytes at offset {offset} "
+                f"into a buffer of {len(view)} bytes"
+            )
+        if not count:
+            return 0
+        if self._concurrent_create:
+            self.unsafe_fill_into(view, offset, count)
+            with self._counter_lock:
+                self._count += count
+            return count
+        with self._counter_lock:
+            self.unsafe_fill_into(view, offset, count)
+            self._count += count
+        return count
+
+    def new_many(self, count: int) -> t.List[str]:
+        """Get a list of `count` new IDs as strings."""
+        _, _ids = self.new_ids_at_index(count)
+        return self.ids_to_strings(_ids)
 
     def new(self) -> str:
         """Get a new ID as a string."""
         _, _id = self.new_id_at_index()
-        return str(_id)
+        return self.id_to_string(_id)
 
     def new_at_index(self, index: t.Optional[int] = None) -> t.Tuple[int, str]:
         """Get a tuple holding new ID index and new ID as string."""
@@ -70,6 +191,51 @@ class IDGenerator(t.Generic[T], metaclass=abc.ABCMeta):
         """Return total number of ID produced since generator was created."""
         return self._count
 
+    def iter_chunks(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> t.Iterator[t.Tuple[int, t.List[str]]]:
+        """Iterate over chunks of new IDs as strings.
+
+        Each chunk is a tuple holding the index of the first ID and a list of
+        `chunk_size` IDs generated at once. Chunks are generated lazily.
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+        while True:
+            index, ids = self.new_ids_at_index(chunk_size)
+            yield index, self.ids_to_strings(ids)
+
+    def iter_ids(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> t.Generator[str, None, None]:
+        """Iterate over new IDs as strings.
+
+        IDs are generated lazily by chunks of `chunk_size` IDs. When iteration
+        stops early (for example within `zip()` or `itertools.islice()`), IDs
+        left in the last chunk are reverted using `unsafe_revert()` when no other
+        ID was generated since, so that incremental generators do not skip them.
+        """
+        for index, chunk in self.iter_chunks(chunk_size):
+            consumed = 0
+            try:
+                for value in chunk:
+                    consumed += 1
+                    yield value
+            finally:
+                if consumed < len(chunk):
+                    self._revert_ids(index + len(chunk), len(chunk) - consumed)
+
+    def _revert_ids(self, end: int, count: int) -> None:
+        """Revert the last `count` IDs, when the last generated ID has index
+        `end - 1`.
+        """
+        with self._counter_lock:
+            if self._count != end:
+                return
+            for _ in range(count):
+                self.unsafe_revert()
+            self._count -= count
+
     def __iter__(self: GeneratorT) -> GeneratorT:
         return self
 
@@ -77,11 +243,76 @@ class IDGenerator(t.Generic[T], metaclass=abc.ABCMeta):
         return self.new_at_index()
 
 
+class WrappedIDGenerator(IDGenerator[T]):
+    """Base class for generators wrapping another generator.
+
+    Conversions and `unsafe_revert()` are delegated to the wrapped generator.
+    IDs can be created concurrently when the wrapped generator allows it, so
+    subclasses must only hold thread safe state or set `_concurrent_create`
+    to False.
+    """
+
+    __slots__ = ("_generator", "_concurrent_create")
+
+    def __init__(self, generator: IDGenerator[T]) -> None:
+        super().__init__()
+        self._generator = generator
+        self._concurrent_create = generator._concurrent_create
+
+    @property
+    def generator(self) -> IDGenerator[T]:
+        """The wrapped generator."""
+        return self._generator
+
+    def unsafe_revert(self) -> None:
+        self._generator.unsafe_revert()
+
+    def id_to_string(self, value: T) -> str:
+        return self._generator.id_to_string(value)
+
+    def ids_to_strings(self, values: t.List[T]) -> t.List[str]:
+        return self._generator.ids_to_strings(values)
+
+    def id_to_bytes(self, value: T) -> bytes:
+        return self._generator.id_to_bytes(value)
+
+    def ids_to_bytes(self, values: t.List[T]) -> bytes:
+        return self._generator.ids_to_bytes(values)
+
+    @property
+    def id_width(self) -> t.Optional[int]:
+        return self._generator.id_width
+
+
+class _IntegerIDGenerator(IDGenerator[int]):
+    """Base class for generators producing non-negative 64 bits integers."""
+
+    __slots__ = ()
+
+    def id_to_bytes(self, value: int) -> bytes:
+        """Transform ID into 8 bytes (big endian)."""
+        return value.to_bytes(8, "big")
+
+    def ids_to_bytes(self, values: t.List[int]) -> bytes:
+        return struct.pack(f">{len(values)}Q", *values)
+
+    @property
+    def id_width(self) -> int:
+        return 8
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        struct.pack_into(f">{count}Q", view, offset, *self.unsafe_create_ids(count))
+
+
 class ConstantIDGenerator(IDGenerator[str]):
     """An ID Generator which always return the same value.
     Can be useful within unit tests.
     """
 
+    __slots__ = ("_value",)
+
+    _concurrent_create = True
+
     def __init__(self, value: str) -> None:
         super().__init__()
         self._value = value
@@ -89,14 +320,40 @@ class ConstantIDGenerator(IDGenerator[str]):
     def unsafe_create_id(self) -> str:
         return self._value
 
+    @property
+    def id_width(self) -> int:
+        return len(self._value.encode())
+
 
 class ObjectIDGenerator(IDGenerator[ObjectID]):
     """Bson ObjectId generator"""
 
+    __slots__ = ("_clock",)
+
+    # ObjectId counter is protected by its own lock
+    _concurrent_create = True
+
+    def __init__(self, clock: t.Optional[Clock] = None) -> None:
+        super().__init__()
+        self._clock = clock
+
     def unsafe_create_id(self) -> ObjectID:
         """Create a new ObjectId"""
+        if self._clock:
+            return ObjectID.generate(self._clock.time_s())
         return ObjectID()
 
+    def id_to_bytes(self, value: ObjectID) -> bytes:
+        return value.binary
+
+    @property
+    def id_width(self) -> int:
+        return 12
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        timestamp = self._clock.time_s() if self._clock else None
+        ObjectID.generate_into(view, offset, count, timestamp)
+
     def unsafe_revert(self) -> None:
         """ObjectIDGenerator does not decrement _inc in case of revert because counter
         all ObjectId share the same counter (regardless of module importing it).
@@ -104,26 +361,89 @@ class ObjectIDGenerator(IDGenerator[ObjectID]):
         pass
 
 
+@functools.lru_cache(maxsize=64)
+def _nanoid_table(alphabet: str) -> t.Optional[bytes]:
+    """When alphabet length is a power of two, each random byte maps to a single
+    character without bias. Tables are shared by generators using the same alphabet.
+    """
+    try:
+        return Codec(alphabet).byte_table()
+    except ValueError:
+        return None
+
+
 class NanoIDGenerator(IDGenerator[str]):
-    """NanoID generator."""
+    """NanoID generator.
+
+    Random bytes are read from the operating system CSPRNG unless `rng` is
+    provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ("_alphabet", "_size", "_randbytes", "_ascii", "_table")
+
+    _concurrent_create = True
 
     def __init__(
         self,
         alphabet: str = DEFAULT_ALPHABET,
         size: int = DEFAULT_SIZE,
+        rng: Rng = None,
     ) -> None:
         super().__init__()
         self._alphabet = alphabet
         self._size = size
+        self._randbytes = get_randbytes(rng)
+        self._ascii = alphabet.isascii()
+        self._table = _nanoid_table(alphabet)
+
+    @property
+    def alphabet(self) -> str:
+        """Alphabet of generated IDs."""
+        return self._alphabet
+
+    @property
+    def size(self) -> int:
+        """Number of characters of generated IDs."""
+        return self._size
 
     def unsafe_create_id(self) -> str:
-        return nanoid(self._alphabet, self._size)
+        return nanoid(self._alphabet, self._size, self._randbytes)
+
+    @property
+    def id_width(self) -> t.Optional[int]:
+        return self._size if self._ascii else None
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        if self._table is None:
+            return super().unsafe_fill_into(view, offset, count)
+        end = offset + self._size * count
+        view[offset:end] = self._randbytes(self._size * count).translate(self._table)
 
 
 class NUIDGenerator(IDGenerator[bytearray]):
+    """NUID generator.
+
+    Each thread uses its own NUID instance (and thus its own random prefix),
+    so that threads never contend on NUID state. Forked processes also use
+    new NUID instances.
+    """
+
+    __slots__ = ("_local",)
+
+    _concurrent_create = True
+
     def __init__(self) -> None:
         super().__init__()
-        self._nuid = NUID()
+        self._local = threading.local()
+        _nuid_generators.add(self)
+
+    @property
+    def _nuid(self) -> NUID:
+        try:
+            return t.cast(NUID, self._local.nuid)
+        except AttributeError:
+            nuid = self._local.nuid = NUID()
+            return nuid
 
     def unsafe_create_id(self) -> bytearray:
         return self._nuid.next()
@@ -132,73 +452,605 @@ class NUIDGenerator(IDGenerator[bytearray]):
     def id_to_string(value: bytearray) -> str:
         return value.decode()
 
+    @staticmethod
+    def id_to_bytes(value: bytearray) -> bytes:
+        return bytes(value)
+
+    @property
+    def id_width(self) -> int:
+        return NUID_LENGTH
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        self._nuid.next_into(view, offset, count)
+
+
+# NUID instances copied into forked processes must not be reused, otherwise
+# child processes would generate the same NUIDs as their parent
+_nuid_generators: "weakref.WeakSet[NUIDGenerator]" = weakref.WeakSet()
+
+
+def _reset_nuid_generators() -> None:
+    for gen in list(_nuid_generators):
+        gen._local = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_nuid_generators)
+
 
 class UUID1Generator(IDGenerator[UUID]):
     """UUID1 generator"""
 
+    __slots__ = ()
+
     def unsafe_create_id(self) -> UUID:
         return uuid1()
 
+    def id_to_bytes(self, value: UUID) -> bytes:
+        return value.bytes
+
+    @property
+    def id_width(self) -> int:
+        return 16
+
 
 class UUID4Generator(IDGenerator[UUID]):
-    """UUID4 generator"""
+    """UUID4 generator.
+
+    Random bytes are read from the operating system CSPRNG unless `rng` is
+    provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ("_randbytes",)
+
+    _concurrent_create = True
+
+    def __init__(self, rng: Rng = None) -> None:
+        super().__init__()
+        self._randbytes = get_randbytes(rng)
 
     def unsafe_create_id(self) -> UUID:
-        return uuid4()
+        return UUID(bytes=self._randbytes(16), version=4)
+
+    def unsafe_create_ids(self, count: int) -> t.List[UUID]:
+        random_bytes = self._randbytes(16 * count)
+        return [
+            UUID(bytes=random_bytes[offset : offset + 16], version=4)
+            for offset in range(0, 16 * count, 16)
+        ]
+
+    def id_to_bytes(self, value: UUID) -> bytes:
+        return value.bytes
+
+    @property
+    def id_width(self) -> int:
+        return 16
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        end = offset + 16 * count
+        view[offset:end] = self._randbytes(16 * count)
+        for position in range(offset, end, 16):
+            # Set version to 4 and variant to RFC 4122
+            view[position + 6] = view[position + 6] & 0x0F | 0x40
+            view[position + 8] = view[position + 8] & 0x3F | 0x80
 
 
 class ULIDGenerator(IDGenerator[ULID]):
-    """ULID generator"""
+    """ULID generator.
+
+    Random bytes are read from the operating system CSPRNG unless `rng` is
+    provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ("_clock", "_rng", "_randbytes")
+
+    _concurrent_create = True
+
+    def __init__(self, clock: t.Optional[Clock] = None, rng: Rng = None) -> None:
+        super().__init__()
+        self._clock = clock
+        self._rng = rng
+        self._randbytes = get_randbytes(rng)
 
     def unsafe_create_id(self) -> ULID:
+        if self._rng is not None:
+            milliseconds = (self._clock or SYSTEM_CLOCK).time_ms()
+            return ULID(milliseconds.to_bytes(6, "big") + self._randbytes(10))
+        if self._clock:
+            return ULID.from_timestamp(self._clock.time_ms())
         return ULID()
 
+    def id_to_bytes(self, value: ULID) -> bytes:
+        return value.bytes
+
+    @property
+    def id_width(self) -> int:
+        return 16
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        milliseconds = self._clock.time_ms() if self._clock else None
+        ULID.generate_into(view, offset, count, milliseconds, self._randbytes)
 
-class IncrementalIDGenerator(IDGenerator[int]):
-    """Incremental integer generator"""
+
+class KSUIDGenerator(IDGenerator[KSUID]):
+    """KSUID generator.
+
+    Random bytes are read from the operating system CSPRNG unless `rng` is
+    provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ("_clock", "_rng", "_randbytes")
+
+    _concurrent_create = True
+
+    def __init__(self, clock: t.Optional[Clock] = None, rng: Rng = None) -> None:
+        super().__init__()
+        self._clock = clock
+        self._rng = rng
+        self._randbytes = get_randbytes(rng)
+
+    def unsafe_create_id(self) -> KSUID:
+        if self._rng is not None:
+            seconds = (self._clock or SYSTEM_CLOCK).time_s()
+            return KSUID(
+                (seconds - KSUID_EPOCH).to_bytes(4, "big") + self._randbytes(16)
+            )
+        if self._clock:
+            return KSUID.from_timestamp(self._clock.time_s())
+        return KSUID()
+
+    def id_to_bytes(self, value: KSUID) -> bytes:
+        return value.bytes
+
+    @property
+    def id_width(self) -> int:
+        return 20
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        timestamp = self._clock.time_s() if self._clock else None
+        KSUID.generate_into(view, offset, count, timestamp, self._randbytes)
+
+
+class TypeIDGenerator(IDGenerator[TypeID]):
+    """TypeID generator.
+
+    Generated TypeIDs share the same `prefix`, which is validated and
+    pre-encoded once. Random bytes are read from the operating system CSPRNG
+    unless `rng` is provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ("_prefix", "_head", "_clock", "_randbytes")
+
+    _concurrent_create = True
 
     def __init__(
-        self, offset: t.Optional[int] = None, bound: t.Optional[int] = None
+        self, prefix: str = "", clock: t.Optional[Clock] = None, rng: Rng = None
+    ) -> None:
+        super().__init__()
+        self._prefix = validate_prefix(prefix)
+        self._head = f"{prefix}_" if prefix else ""
+        self._clock = clock or SYSTEM_CLOCK
+        self._randbytes = get_randbytes(rng)
+
+    @property
+    def prefix(self) -> str:
+        """The type prefix of generated TypeIDs."""
+        return self._prefix
+
+    def unsafe_create_id(self) -> TypeID:
+        return self._new_typeid(uuid7_bytes(self._clock.time_ms(), self._randbytes(10)))
+
+    def unsafe_create_ids(self, count: int) -> t.List[TypeID]:
+        milliseconds = self._clock.time_ms()
+        random_bytes = self._randbytes(10 * count)
+        new = self._new_typeid
+        return [
+            new(uuid7_bytes(milliseconds, random_bytes[offset : offset + 10]))
+            for offset in range(0, 10 * count, 10)
+        ]
+
+    def _new_typeid(self, value: bytes) -> TypeID:
+        typeid = TypeID.__new__(TypeID)
+        typeid.prefix = self._prefix
+        typeid.bytes = value
+        return typeid
+
+    def id_to_string(self, value: TypeID) -> str:
+        return self._head + encode_suffix(value.bytes)
+
+    def ids_to_strings(self, values: t.List[TypeID]) -> t.List[str]:
+        head = self._head
+        return [head + encode_suffix(value.bytes) for value in values]
+
+    def id_to_bytes(self, value: TypeID) -> bytes:
+        """Transform TypeID into the 16 bytes of its UUID. Prefix is not included."""
+        return value.bytes
+
+    @property
+    def id_width(self) -> int:
+        return 16
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        timestamp = self._clock.time_ms().to_bytes(6, "big")
+        end = offset + 16 * count
+        view[offset:end] = self._randbytes(16 * count)
+        for position in range(offset, end, 16):
+            view[position : position + 6] = timestamp
+            # Set version to 7 and variant to RFC 4122
+            view[position + 6] = view[position + 6] & 0x0F | 0x70
+            view[position + 8] = view[position + 8] & 0x3F | 0x80
+
+
+class IncrementalIDGenerator(_IntegerIDGenerator):
+    """Incremental integer generator.
+
+    When `state_file` is provided, integers are reserved by blocks of
+    `block_size` values, and the end of the last reserved block is persisted
+    into the state file. Generation resumes after the last reserved block when
+    generator is created again, and several processes can share the same state
+    file to generate disjoint integers.
+
+    When `key` is provided, integers are permuted using a keyed Feistel network
+    over `bits` bits (or over `[0, bound)` when `bound` is provided, `bound`
+    being at most `2**bits`), so that generated IDs are unique but not
+    sequential. Use `permutation.decode()` to retrieve the counter value of an
+    ID (see [`genid.feistel`][genid.feistel]). Without `bound`, ValueError is
+    raised once all `2**bits` values were generated.
+    """
+
+    __slots__ = (
+        "_inc",
+        "_bound",
+        "permutation",
+        "_allocator",
+        "_block_start",
+        "_block_end",
+    )
+
+    def __init__(
+        self,
+        offset: t.Optional[int] = None,
+        bound: t.Optional[int] = None,
+        state_file: t.Union[str, "os.PathLike[str]", None] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        key: t.Union[bytes, str, None] = None,
+        bits: int = 64,
     ) -> None:
         super().__init__()
         self._inc = offset or 0
         self._bound = bound
+        self.permutation: t.Optional[FeistelPermutation] = None
+        if key is not None:
+            self.permutation = FeistelPermutation(key, bits, bound or None)
+        self._allocator: t.Optional[BlockAllocator] = None
+        self._block_start = self._block_end = 0
+        if state_file is not None:
+            self._allocator = BlockAllocator(
+                state_file, block_size=block_size, offset=self._inc, bound=bound
+            )
+
+    @property
+    def counter(self) -> int:
+        """Next integer of the counter, before permutation. A generator created
+        with this `offset` resumes where this generator stopped.
+        """
+        return self._inc
+
+    @property
+    def persistent(self) -> bool:
+        """Whether the counter is saved into a state file."""
+        return self._allocator is not None
 
     def unsafe_create_id(self) -> int:
-        if self._bound and self._inc >= self._bound:
+        if self._allocator:
+            if self._inc >= self._block_end:
+                self._block_start, self._block_end = self._allocator.reserve()
+                self._inc = self._block_start
+        elif self._bound and self._inc >= self._bound:
             self._inc = 0
+        if self.permutation and self._inc >= self.permutation.size:
+            self._exhausted()
         _id = self._inc
         self._inc += 1
+        if self.permutation:
+            return self.permutation.encode(_id)
         return _id
 
+    def unsafe_create_ids(self, count: int) -> t.List[int]:
+        start = self._inc
+        if self._allocator or (self._bound and start + count > self._bound):
+            return super().unsafe_create_ids(count)
+        if self.permutation:
+            if start + count > self.permutation.size:
+                self._exhausted()
+            self._inc = start + count
+            return self.permutation.encode_range(start, start + count)
+        self._inc = start + count
+        return list(range(start, start + count))
+
+    def _exhausted(self) -> t.NoReturn:
+        bits = t.cast(FeistelPermutation, self.permutation).bits
+        raise ValueError(
+            f"Counter exhausted for bits={bits}: all {1 << bits} values were generated"
+        )
+
     def unsafe_revert(self) -> None:
-        if self._inc:
+        if self._allocator:
+            if self._inc > self._block_start:
+                self._inc -= 1
+        elif self._inc:
             self._inc -= 1
 
+    def close(self) -> None:
+        """Release state file when generator is persistent. Integers left in
+        current block are lost.
+        """
+        if self._allocator:
+            self._allocator.close()
+
 
 class SecretIDGenerator(IDGenerator[str]):
-    """Secret ID generator"""
+    """Secret ID generator.
+
+    Random bytes are read from the operating system CSPRNG unless `rng` is
+    provided (see [`genid.rng`][genid.rng]). Secrets generated with a
+    non-cryptographic random source are predictable.
+    """
+
+    __slots__ = ("_length", "_randbytes")
 
-    def __init__(self, length: int = 16) -> None:
+    _concurrent_create = True
+
+    def __init__(self, length: int = 16, rng: Rng = None) -> None:
         super().__init__()
         self._length = length
+        self._randbytes = get_randbytes(rng)
+
+    @property
+    def length(self) -> int:
+        """Number of random bytes of generated secrets."""
+        return self._length
 
     def unsafe_create_id(self) -> str:
-        return token_hex(self._length)
+        return BASE16.encode(self._randbytes(self._length))
+
+    def unsafe_create_ids(self, count: int) -> t.List[str]:
+        return BASE16.encode_many(self._randbytes(self._length * count), self._length)
+
+    @property
+    def id_width(self) -> int:
+        return 2 * self._length
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        end = offset + 2 * self._length * count
+        view[offset:end] = BASE16.encode(self._randbytes(self._length * count)).encode()
+
+
+class _RandomIntIDGenerator(IDGenerator[int]):
+    """Base class for generators of non-zero random integers of `_width` bytes,
+    written as `2 * _width` lowercase hexadecimal digits.
+
+    Integers are drawn from random bytes by pools of `pool_size` integers, and
+    popped from the pool, which is thread safe without locking.
+    """
+
+    __slots__ = ("_randbytes", "_pool_size", "_pool")
 
+    _concurrent_create = True
+    _width: int
+    _format: str
 
-class TimestampGenerator(IDGenerator[int]):
+    def __init__(self, rng: Rng = None, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        super().__init__()
+        if pool_size <= 0:
+            raise ValueError("Pool size must be a positive integer")
+        self._randbytes = get_randbytes(rng)
+        self._pool_size = pool_size
+        self._pool: t.List[int] = []
+        _random_int_generators.add(self)
+
+    @abc.abstractmethod
+    def _unpack(self, data: bytes, count: int) -> t.List[int]:
+        """Unpack `count` integers from `_width * count` random bytes."""
+        raise NotImplementedError
+
+    def _draw(self, count: int) -> t.List[int]:
+        values = self._unpack(self._randbytes(self._width * count), count)
+        # All zero IDs are invalid
+        while 0 in values:
+            values.remove(0)
+            values.extend(self._unpack(self._randbytes(self._width), 1))
+        return values
+
+    def unsafe_create_id(self) -> int:
+        try:
+            return self._pool.pop()
+        except IndexError:
+            pool = self._draw(self._pool_size)
+            value = pool.pop()
+            # A concurrent refill may replace this pool, its values are dropped
+            self._pool = pool
+            return value
+
+    def unsafe_create_ids(self, count: int) -> t.List[int]:
+        return self._draw(count)
+
+    def id_to_string(self, value: int) -> str:
+        return self._format % value
+
+    def ids_to_strings(self, values: t.List[int]) -> t.List[str]:
+        # Slicing the hexadecimal form of packed IDs is faster than formatting
+        # each integer
+        data, size = self.ids_to_bytes(values).hex(), 2 * self._width
+        return [data[start : start + size] for start in range(0, len(data), size)]
+
+    def id_to_bytes(self, value: int) -> bytes:
+        return value.to_bytes(self._width, "big")
+
+    @property
+    def id_width(self) -> int:
+        return self._width
+
+    def unsafe_fill_into(self, view: memoryview, offset: int, count: int) -> None:
+        width = self._width
+        data = self._randbytes(width * count)
+        view[offset : offset + width * count] = data
+        zero = bytes(width)
+        if zero not in data:
+            return
+        for position in range(0, len(data), width):
+            if data[position : position + width] == zero:
+                start = offset + position
+                view[start : start + width] = self.id_to_bytes(self._draw(1)[0])
+
+
+class TraceIDGenerator(_RandomIntIDGenerator):
+    """W3C trace context (and OpenTelemetry) trace ID generator.
+
+    Trace IDs are random non-zero 128 bits integers, written as 32 lowercase
+    hexadecimal digits. Random bytes are read from the operating system CSPRNG
+    unless `rng` is provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ()
+
+    _width = 16
+    _format = "%032x"
+
+    def _unpack(self, data: bytes, count: int) -> t.List[int]:
+        halves = iter(struct.unpack(f">{2 * count}Q", data))
+        return [high << 64 | low for high, low in zip(halves, halves)]
+
+    def ids_to_bytes(self, values: t.List[int]) -> bytes:
+        return b"".join([value.to_bytes(16, "big") for value in values])
+
+
+class SpanIDGenerator(_RandomIntIDGenerator):
+    """W3C trace context (and OpenTelemetry) span ID generator.
+
+    Span IDs are random non-zero 64 bits integers, written as 16 lowercase
+    hexadecimal digits. Random bytes are read from the operating system CSPRNG
+    unless `rng` is provided (see [`genid.rng`][genid.rng]).
+    """
+
+    __slots__ = ()
+
+    _width = 8
+    _format = "%016x"
+
+    def _unpack(self, data: bytes, count: int) -> t.List[int]:
+        return list(struct.unpack(f">{count}Q", data))
+
+    def ids_to_bytes(self, values: t.List[int]) -> bytes:
+        return struct.pack(f">{len(values)}Q", *values)
+
+
+# Pools copied into forked processes must not be reused, otherwise child
+# processes would generate the same IDs as their parent
+_random_int_generators: "weakref.WeakSet[_RandomIntIDGenerator]" = weakref.WeakSet()
+
+
+def _reset_random_int_generators() -> None:
+    for gen in list(_random_int_generators):
+        gen._pool = []
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_random_int_generators)
+
+
+class TimestampGenerator(_IntegerIDGenerator):
     """Unix timestamp (seconds since unix epoch) generator"""
 
+    __slots__ = ("_clock",)
+
+    _concurrent_create = True
+
+    def __init__(self, clock: t.Optional[Clock] = None) -> None:
+        super().__init__()
+        self._clock = clock or SYSTEM_CLOCK
+
     def unsafe_create_id(self) -> int:
-        return int(time())
+        return self._clock.time_s()
+
+
+class NanosecondTimestampGenerator(_IntegerIDGenerator):
+    """Nanosecond timestamp generator.
 
+    When `monotonic` is True, the generator acts as a hybrid logical clock:
+    the `logical_bits` lowest bits of the timestamp are reserved for a logical
+    counter, which is incremented when the physical clock stalls or goes
+    backward. Generated values are then strictly increasing, and remain within
+    `logical_bits` bits of physical time as long as less than
+    `2 ** logical_bits` values are generated per `2 ** logical_bits` nanoseconds.
+    """
 
-class NanosecondTimestampGenerator(IDGenerator[int]):
-    """Nanosecond timestamp generator"""
+    __slots__ = (
+        "_clock",
+        "_monotonic",
+        "_concurrent_create",
+        "_physical_mask",
+        "_last",
+        "_previous",
+    )
+
+    def __init__(
+        self,
+        clock: t.Optional[Clock] = None,
+        monotonic: bool = False,
+        logical_bits: int = 8,
+    ) -> None:
+        super().__init__()
+        if not 0 <= logical_bits < 32:
+            raise ValueError("Logical bits must be between 0 and 31")
+        self._clock = clock or SYSTEM_CLOCK
+        self._monotonic = monotonic
+        self._concurrent_create = not monotonic
+        self._physical_mask = ~((1 << logical_bits) - 1)
+        self._last = self._previous = -1
 
     def unsafe_create_id(self) -> int:
-        return time_ns()
+        if not self._monotonic:
+            return self._clock.time_ns()
+        value = self._clock.time_ns() & self._physical_mask
+        last = self._last
+        if value <= last:
+            value = last + 1
+        self._previous = last
+        self._last = value
+        return value
+
+    def unsafe_create_ids(self, count: int) -> t.List[int]:
+        if not self._monotonic:
+            return super().unsafe_create_ids(count)
+        return list(self._unsafe_reserve(count))
+
+    def _unsafe_reserve(self, count: int) -> range:
+        start = self._clock.time_ns() & self._physical_mask
+        if start <= self._last:
+            start = self._last + 1
+        self._previous = self._last = start + count - 1
+        return range(start, start + count)
+
+    def unsafe_revert(self) -> None:
+        if self._monotonic:
+            self._last = self._previous
+
+    def reserve(self, count: int) -> t.Tuple[int, range]:
+        """Reserve a contiguous range of `count` strictly increasing values.
+
+        Returns a tuple holding the index of the first value and the range of values.
+        This method is only available in monotonic mode.
+        """
+        if not self._monotonic:
+            raise ValueError("Cannot reserve values when monotonic mode is disabled")
+        if count <= 0:
+            raise ValueError("Count must be a positive integer")
+        with self._counter_lock:
+            values = self._unsafe_reserve(count)
+            index = self._count
+            self._count += count
+        return index, values
 
 
 class Kind(str, enum.Enum):
@@ -209,10 +1061,14 @@ class Kind(str, enum.Enum):
     UUID1 = "uuid1"
     UUID4 = "uuid4"
     ULID = "ulid"
+    KSUID = "ksuid"
+    TYPEID = "typeid"
     INCREMENTAL = "incremental"
     SECRET = "secret"
     TIMESTAMP = "timestamp"
     NSTIMESTAMP = "nstimestamp"
+    TRACE_ID = "traceid"
+    SPAN_ID = "spanid"
 
 
 def generator(
@@ -220,14 +1076,19 @@ def generator(
         t.Literal[
             "constant",
             "nanoid",
+            "nuid",
             "objectid",
             "uuid1",
             "uuid4",
             "ulid",
+            "ksuid",
+            "typeid",
             "incremental",
             "secret",
             "timestamp",
             "nstimestamp",
+            "traceid",
+            "spanid",
         ],
         Kind,
     ],
@@ -244,10 +1105,14 @@ def generator(
     - `"uuid1"`
     - `"uuid4"`
     - `"ulid"`
+    - `"ksuid"`
+    - `"typeid"`
     - `"incremental"`
     - `"secret"`
     - `"timestamp"`
     - `"nstimestamp"`
+    - `"traceid"`
+    - `"spanid"`
     """
     # Validate kind
     kind = Kind(kind)
@@ -265,6 +1130,10 @@ def generator(
         return UUID4Generator(**kwargs)
     if kind == Kind.ULID:
         return ULIDGenerator(**kwargs)
+    if kind == Kind.KSUID:
+        return KSUIDGenerator(**kwargs)
+    if kind == Kind.TYPEID:
+        return TypeIDGenerator(**kwargs)
     if kind == Kind.INCREMENTAL:
         return IncrementalIDGenerator(**kwargs)
     if kind == Kind.SECRET:
@@ -273,4 +1142,8 @@ def generator(
         return TimestampGenerator(**kwargs)
     if kind == Kind.NSTIMESTAMP:
         return NanosecondTimestampGenerator(**kwargs)
+    if kind == Kind.TRACE_ID:
+        return TraceIDGenerator(**kwargs)
+    if kind == Kind.SPAN_ID:
+        return SpanIDGenerator(**kwargs)
     raise ValueError(f"Invalid ID kind: {kind}")
@@ -0,0 +1,124 @@
+"""Persistent hi/lo block allocation for integer identifiers.
+
+A [`BlockAllocator`][genid.hilo.BlockAllocator] reserves blocks of consecutive
+integers and records the high-water mark (the end of the last reserved block)
+in a small memory-mapped state file. The state file is flushed to disk once per
+block, so identifiers can be generated in memory within a block, and generation
+resumes after the last reserved block when the process restarts.
+
+Several processes on the same host can share a state file: the file is locked
+while a block is reserved, so each process receives disjoint blocks.
+
+The state file holds 16 bytes: an 8-byte magic string followed by the
+high-water mark as an unsigned 64-bit little-endian integer.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import typing as t
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, STATE_SIZE)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, STATE_SIZE)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+MAGIC = b"GENIDHWM"
+STATE_FORMAT = "<8sQ"
+STATE_SIZE = struct.calcsize(STATE_FORMAT)
+DEFAULT_BLOCK_SIZE = 1000
+
+
+class InvalidStateFile(ValueError):
+    """Raised when a state file does not hold a valid high-water mark."""
+
+
+class BlockAllocator:
+    """Reserve blocks of integers and persist high-water mark into a file.
+
+    Arguments:
+        path: path to the state file. File is created when it does not exist.
+        block_size: number of integers reserved at once.
+        offset: first integer reserved when state file is created.
+        bound: integers are always lower than bound. When bound is reached,
+            reservation starts again from 0.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        offset: int = 0,
+        bound: t.Optional[int] = None,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        self.path = os.fspath(path)
+        self.block_size = block_size
+        self.bound = bound
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(self._fd)
+            try:
+                size = os.fstat(self._fd).st_size
+                if size == 0:
+                    os.write(self._fd, struct.pack(STATE_FORMAT, MAGIC, offset))
+                    os.fsync(self._fd)
+                elif size < STATE_SIZE:
+                    raise InvalidStateFile(f"Invalid state file: {self.path}")
+                self._mmap = mmap.mmap(self._fd, STATE_SIZE)
+            finally:
+                _unlock(self._fd)
+            magic, _ = struct.unpack_from(STATE_FORMAT, self._mmap)
+            if magic != MAGIC:
+                self._mmap.close()
+                raise InvalidStateFile(f"Invalid state file: {self.path}")
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @property
+    def high_water_mark(self) -> int:
+        """End of the last reserved block (exclusive)."""
+        return int(struct.unpack_from(STATE_FORMAT, self._mmap)[1])
+
+    def reserve(self) -> t.Tuple[int, int]:
+        """Reserve a new block. Return block start (inclusive) and end (exclusive)."""
+        _lock(self._fd)
+        try:
+            start = struct.unpack_from(STATE_FORMAT, self._mmap)[1]
+            if self.bound and start >= self.bound:
+                start = 0
+            end = start + self.block_size
+            if self.bound and end > self.bound:
+                end = self.bound
+            struct.pack_into(STATE_FORMAT, self._mmap, 0, MAGIC, end)
+            self._mmap.flush()
+        finally:
+            _unlock(self._fd)
+        return start, end
+
+    def close(self) -> None:
+        """Release memory map and file descriptor."""
+        if self._fd < 0:
+            return
+        self._mmap.close()
+        os.close(self._fd)
+        self._fd = -1
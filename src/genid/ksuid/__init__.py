@@ -0,0 +1,159 @@
+"""K-Sortable Unique IDentifiers.
+
+See the [KSUID specification](https://github.com/segmentio/ksuid) for more details.
+"""
+
+import functools
+import os
+import time
+import typing as t
+from datetime import datetime, timezone
+
+from . import base62, constants
+
+
+@functools.total_ordering
+class KSUID:
+    """The :class:`KSUID` object consists of a timestamp part of 32 bits and of 128 random bits.
+
+    .. code-block:: text
+
+       0ujtsYcgvSTl8PAuAdqWYSMnLOv
+      |---------------------------|
+       Timestamp and payload encoded
+       together in base62
+
+    The timestamp part holds the number of seconds elapsed since the KSUID epoch
+    (2014-05-13T16:53:20Z). To encode the object you usually convert it to a string:
+
+        >>> ksuid = KSUID()
+        >>> str(ksuid)
+        '2OXGrHj6wX2hSs6ZGuLuqjOLYle'
+    """
+
+    __slots__ = ("bytes", "_str")
+
+    def __init__(self, value: t.Optional[bytes] = None) -> None:
+        if value is None:
+            value = int.to_bytes(
+                int(time.time()) - constants.EPOCH, constants.TIMESTAMP_LEN, "big"
+            ) + os.urandom(constants.PAYLOAD_LEN)
+        elif len(value) != constants.BYTES_LEN:
+            raise ValueError("KSUID has to be exactly 20 bytes long.")
+        self.bytes = value
+        self._str: t.Optional[str] = None
+
+    @staticmethod
+    def generate_into(
+        buffer: t.Any,
+        offset: int = 0,
+        count: int = 1,
+        timestamp: t.Optional[int] = None,
+        randbytes: t.Callable[[int], bytes] = os.urandom,
+    ) -> None:
+        """Write `count` new KSUIDs (20 bytes each) into a writable buffer.
+
+        All KSUIDs share the same timestamp part (a unix timestamp in seconds),
+        which defaults to current time. Random bytes are read using `randbytes`
+        function. No :class:`KSUID`-object is created.
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        prefix = int.to_bytes(
+            timestamp - constants.EPOCH, constants.TIMESTAMP_LEN, "big"
+        )
+        view = memoryview(buffer).cast("B")
+        end = offset + constants.BYTES_LEN * count
+        view[offset:end] = randbytes(constants.BYTES_LEN * count)
+        for position in range(offset, end, constants.BYTES_LEN):
+            view[position : position + constants.TIMESTAMP_LEN] = prefix
+
+    @classmethod
+    def from_datetime(cls, value: datetime) -> "KSUID":
+        """Create a new :class:`KSUID`-object from a :class:`datetime`."""
+        return cls.from_timestamp(value.timestamp())
+
+    @classmethod
+    def from_timestamp(cls, value: t.Union[int, float]) -> "KSUID":
+        """Create a new :class:`KSUID`-object from a unix timestamp in seconds."""
+        if isinstance(value, (int, float)):
+            timestamp = int.to_bytes(
+                int(value) - constants.EPOCH, constants.TIMESTAMP_LEN, "big"
+            )
+            return cls(timestamp + os.urandom(constants.PAYLOAD_LEN))
+        raise TypeError(f"Expected int or float value, not {type(value)}")
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "KSUID":
+        """Create a new :class:`KSUID`-object from sequence of 20 bytes."""
+        if isinstance(value, bytes):
+            return cls(value)
+        raise TypeError(f"Expected bytes value, not {type(value)}")
+
+    @classmethod
+    def from_str(cls, value: str) -> "KSUID":
+        """Create a new :class:`KSUID`-object from a 27 char long string representation."""
+        if isinstance(value, str):
+            ksuid = cls(base62.decode(value))
+            ksuid._str = value
+            return ksuid
+        raise TypeError(f"Expected str value, not {type(value)}")
+
+    parse = from_str
+
+    @classmethod
+    def from_int(cls, value: int) -> "KSUID":
+        """Create a new :class:`KSUID`-object from an `int`."""
+        if isinstance(value, int):
+            return cls(int.to_bytes(value, constants.BYTES_LEN, "big"))
+        raise TypeError(f"Expected int value, not {type(value)}")
+
+    @property
+    def timestamp(self) -> int:
+        """The timestamp part as unix epoch time in seconds."""
+        return (
+            int.from_bytes(self.bytes[: constants.TIMESTAMP_LEN], "big")
+            + constants.EPOCH
+        )
+
+    @property
+    def datetime(self) -> datetime:
+        """Return the timestamp part as timezone-aware :class:`datetime` in UTC."""
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
+
+    @property
+    def payload(self) -> bytes:
+        """The 16 random bytes of the KSUID."""
+        return self.bytes[constants.TIMESTAMP_LEN :]
+
+    def __repr__(self) -> str:
+        return f"KSUID({self!s})"
+
+    def __str__(self) -> str:
+        """Encode this object as a 27 character string sequence."""
+        if self._str is None:
+            self._str = base62.encode(self.bytes)
+        return self._str
+
+    def __int__(self) -> int:
+        """Encode this object as an integer."""
+        return int.from_bytes(self.bytes, "big")
+
+    def __hash__(self) -> int:
+        return hash(self.bytes)
+
+    def __reduce__(self) -> t.Tuple[t.Type["KSUID"], t.Tuple[bytes]]:
+        """Pickle this object as its 20 bytes."""
+        return (KSUID, (self.bytes,))
+
+    # KSUIDs are only compared to KSUIDs, so that equal objects always have
+    # equal hashes. Use `str()`, `int()` or `.bytes` to compare other forms.
+    def __lt__(self, other: t.Any) -> bool:
+        if isinstance(other, KSUID):
+            return self.bytes < other.bytes
+        return NotImplemented
+
+    def __eq__(self, other: t.Any) -> bool:
+        if isinstance(other, KSUID):
+            return self.bytes == other.bytes
+        return NotImplemented
@@ -0,0 +1,55 @@
+import typing as t
+
+from ..codecs import BASE62
+from . import constants
+
+# KSUIDs are encoded and decoded by the shared base62 codec
+ENCODE: str = BASE62.alphabet
+ENCODE_PAIRS: t.Sequence[str] = BASE62.pairs
+
+MAX_VALUE = (1 << (8 * constants.BYTES_LEN)) - 1
+
+
+def encode_int(value: int) -> str:
+    """Encode an integer as a 27 characters base62 string."""
+    return BASE62.encode_int(value, constants.REPR_LEN)
+
+
+def encode(binary: bytes) -> str:
+    if len(binary) != constants.BYTES_LEN:
+        raise ValueError("KSUID has to be exactly 20 bytes long.")
+    return BASE62.encode(binary)
+
+
+def decode_int(encoded: str) -> int:
+    """Decode a 27 characters base62 string into an integer."""
+    if len(encoded) != constants.REPR_LEN:
+        raise ValueError("Encoded KSUID has to be exactly 27 characters long.")
+    try:
+        value = BASE62.decode_int(encoded)
+    except ValueError:
+        raise ValueError(f"Invalid base62 string: {encoded!r}") from None
+    if value > MAX_VALUE:
+        raise ValueError(f"Encoded KSUID is out of range: {encoded!r}")
+    return value
+
+
+def decode(encoded: str) -> bytes:
+    return decode_int(encoded).to_bytes(constants.BYTES_LEN, "big")
+
+
+def encode_many(buffer: t.Union[bytes, bytearray, memoryview]) -> t.List[str]:
+    """Encode a buffer holding several packed 20 bytes KSUIDs."""
+    try:
+        return BASE62.encode_many(buffer, constants.BYTES_LEN)
+    except ValueError:
+        raise ValueError("Buffer length must be a multiple of 20 bytes.") from None
+
+
+def decode_many(encoded: t.Iterable[str]) -> bytearray:
+    """Decode several KSUID strings into a buffer of packed 20 bytes KSUIDs."""
+    size = constants.BYTES_LEN
+    buffer = bytearray()
+    for value in encoded:
+        buffer += decode_int(value).to_bytes(size, "big")
+    return buffer
@@ -0,0 +1,8 @@
+# KSUID timestamps are seconds since 2014-05-13T16:53:20Z
+EPOCH = 1400000000
+
+TIMESTAMP_LEN = 4
+PAYLOAD_LEN = 16
+BYTES_LEN = TIMESTAMP_LEN + PAYLOAD_LEN
+
+REPR_LEN = 27
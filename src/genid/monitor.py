@@ -0,0 +1,263 @@
+"""Probabilistic collision monitoring for ID generators.
+
+A [`MonitoredIDGenerator`][genid.monitor.MonitoredIDGenerator] wraps any
+[`IDGenerator`][genid.IDGenerator] and feeds each generated ID into a
+[`RotatingBloomFilter`][genid.monitor.RotatingBloomFilter]. A hit in the
+filter is a *suspected* duplicate: either a real collision, or a false positive
+whose probability is bounded by the configured error rate.
+
+Filters are split block Bloom filters: each value sets one bit in each of the
+eight 64-bit lanes of a single 512-bit block. This needs more bits per value
+than a classic Bloom filter for the same error rate, but costs a single hash
+and a single block update per value:
+
+| Error rate | Bits per ID | Memory for `capacity=1_000_000` |
+|------------|-------------|---------------------------------|
+| `1e-2`     | 11.6        | 2.9MB                           |
+| `1e-4`     | 26.6        | 6.6MB                           |
+| `1e-6`     | 58.5        | 14.6MB                          |
+
+Memory does not depend on the number of generated IDs. Per-ID overhead is one
+hash and one 64-byte block update, usually between one and three microseconds
+on CPython (see `benchmarks/bench_monitor.py`).
+
+Values are hashed using the builtin `hash()` function, so filters are only
+meaningful within the process which created them.
+"""
+
+import math
+import typing as t
+
+from .generators import IDGenerator, T, WrappedIDGenerator
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+BLOCK_BYTES = 64
+LANE_BITS = 64
+LANES = 8
+
+# Precomputed single bit masks for each lane of a 512-bit block
+_L0, _L1, _L2, _L3, _L4, _L5, _L6, _L7 = [
+    [1 << (lane * LANE_BITS + bit) for bit in range(LANE_BITS)] for lane in range(LANES)
+]
+
+
+def _false_positive_rate(load: float) -> float:
+    """False positive rate of a split block Bloom filter holding
+    `load` values per block on average.
+    """
+    rate = 0.0
+    probability = math.exp(-load)
+    for count in range(int(load + 12 * math.sqrt(load) + 32)):
+        if count:
+            probability *= load / count
+        rate += probability * (1 - (1 - 1 / LANE_BITS) ** count) ** LANES
+    return rate
+
+
+def _num_blocks(capacity: int, error_rate: float) -> int:
+    """Find the smallest number of blocks satisfying error rate."""
+    low, high = 1, capacity
+    while _false_positive_rate(capacity / high) > error_rate:
+        high *= 2
+    while low < high:
+        mid = (low + high) // 2
+        if _false_positive_rate(capacity / mid) > error_rate:
+            low = mid + 1
+        else:
+            high = mid
+    return high
+
+
+class BloomFilter:
+    """A fixed-size split block Bloom filter over `str` or `bytes` values.
+
+    The number of blocks is derived from the expected number of values
+    (`capacity`) and the target false positive rate (`error_rate`).
+    """
+
+    __slots__ = ("capacity", "error_rate", "num_blocks", "count", "_blocks")
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6) -> None:
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_blocks = _num_blocks(capacity, error_rate)
+        self.count = 0
+        self._blocks = bytearray(self.num_blocks * BLOCK_BYTES)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the filter in bytes."""
+        return len(self._blocks)
+
+    def locate(self, value: t.Union[str, bytes]) -> t.Tuple[int, int]:
+        """Return the offset of the block holding a value and its bit mask."""
+        h = hash(value) & MASK_64
+        offset = ((h * self.num_blocks) >> 64) * BLOCK_BYTES
+        mask = (
+            _L0[h & 63]
+            | _L1[(h >> 6) & 63]
+            | _L2[(h >> 12) & 63]
+            | _L3[(h >> 18) & 63]
+            | _L4[(h >> 24) & 63]
+            | _L5[(h >> 30) & 63]
+            | _L6[(h >> 36) & 63]
+            | _L7[(h >> 42) & 63]
+        )
+        return offset, mask
+
+    def contains_location(self, offset: int, mask: int) -> bool:
+        """Check whether all bits of mask are set in block."""
+        block = int.from_bytes(self._blocks[offset : offset + BLOCK_BYTES], "little")
+        return block & mask == mask
+
+    def add_location(self, offset: int, mask: int) -> bool:
+        """Set bits of mask in block. Return True when all bits were already set."""
+        blocks = self._blocks
+        block = int.from_bytes(blocks[offset : offset + BLOCK_BYTES], "little")
+        if block & mask == mask:
+            return True
+        blocks[offset : offset + BLOCK_BYTES] = (block | mask).to_bytes(
+            BLOCK_BYTES, "little"
+        )
+        self.count += 1
+        return False
+
+    def add(self, value: t.Union[str, bytes]) -> bool:
+        """Add a value. Return True when value was (probably) already present."""
+        return self.add_location(*self.locate(value))
+
+    def clear(self) -> None:
+        """Remove all values from the filter without releasing memory."""
+        self._blocks[:] = bytes(len(self._blocks))
+        self.count = 0
+
+    def __contains__(self, value: t.Union[str, bytes]) -> bool:
+        return self.contains_location(*self.locate(value))
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class RotatingBloomFilter:
+    """A memory-bounded Bloom filter remembering the most recent values.
+
+    Values are inserted into a current generation. Once the current generation
+    holds `capacity` values, the previous generation is cleared and becomes the
+    current one. Lookups check both generations, so the filter always remembers
+    at least the last `capacity` values, and at most the last `2 * capacity`.
+    """
+
+    __slots__ = ("capacity", "error_rate", "rotations", "_current", "_previous")
+
+    def __init__(self, capacity: int, error_rate: float = 1e-6) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rotations = 0
+        # Each generation gets half of the error budget because lookups
+        # are performed against both generations
+        self._current = BloomFilter(capacity, error_rate / 2)
+        self._previous = BloomFilter(capacity, error_rate / 2)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of both generations in bytes."""
+        return self._current.nbytes + self._previous.nbytes
+
+    def add(self, value: t.Union[str, bytes]) -> bool:
+        """Add a value. Return True when value was (probably) already seen."""
+        current = self._current
+        if current.count >= self.capacity:
+            self.rotate()
+            current = self._current
+        offset, mask = current.locate(value)
+        if current.add_location(offset, mask):
+            return True
+        return self._previous.contains_location(offset, mask)
+
+    def rotate(self) -> None:
+        """Drop the previous generation and start a new one."""
+        self._previous, self._current = self._current, self._previous
+        self._current.clear()
+        self.rotations += 1
+
+    def clear(self) -> None:
+        """Remove all values from both generations."""
+        self._current.clear()
+        self._previous.clear()
+
+    def __contains__(self, value: t.Union[str, bytes]) -> bool:
+        offset, mask = self._current.locate(value)
+        return self._current.contains_location(
+            offset, mask
+        ) or self._previous.contains_location(offset, mask)
+
+    def __len__(self) -> int:
+        return self._current.count + self._previous.count
+
+
+class MonitoredIDGenerator(WrappedIDGenerator[T]):
+    """An ID generator counting suspected collisions of another generator.
+
+    Each generated ID is added to a rotating Bloom filter. When the filter
+    reports that the ID was already seen, the suspected collision is counted,
+    `on_collision` callback is called, and a new ID is generated when
+    `regenerate` is True (at most `max_attempts` times).
+
+    Note that suspected collisions include false positives, whose probability
+    for a single ID is bounded by `error_rate`. Reverted IDs are not removed
+    from the Bloom filter.
+    """
+
+    __slots__ = (
+        "_filter",
+        "_regenerate",
+        "_max_attempts",
+        "_on_collision",
+        "_collisions",
+    )
+
+    def __init__(
+        self,
+        generator: IDGenerator[T],
+        capacity: int = 1_000_000,
+        error_rate: float = 1e-6,
+        regenerate: bool = False,
+        max_attempts: int = 3,
+        on_collision: t.Optional[t.Callable[[str], None]] = None,
+    ) -> None:
+        super().__init__(generator)
+        # Bloom filters are not thread safe
+        self._concurrent_create = False
+        self._filter = RotatingBloomFilter(capacity, error_rate)
+        self._regenerate = regenerate
+        self._max_attempts = max_attempts
+        self._on_collision = on_collision
+        self._collisions = 0
+
+    @property
+    def filter(self) -> RotatingBloomFilter:
+        """The Bloom filter holding recently generated IDs."""
+        return self._filter
+
+    def suspected_collisions(self) -> int:
+        """Return number of suspected collisions since generator was created."""
+        return self._collisions
+
+    def unsafe_create_id(self) -> T:
+        generator = self._generator
+        attempts = 0
+        while True:
+            _id = generator.unsafe_create_id()
+            value = generator.id_to_string(_id)
+            if not self._filter.add(value):
+                return _id
+            self._collisions += 1
+            attempts += 1
+            if self._on_collision:
+                self._on_collision(value)
+            if not self._regenerate or attempts >= self._max_attempts:
+                return _id
@@ -16,8 +16,9 @@
 # limitations under the License.
 """Taken from https://github.com/puyuan/py-nanoid"""
 import string
+import typing as t
 from math import ceil, log
-from secrets import token_hex
+from secrets import token_bytes
 
 # Using default alphabet and default size
 # Assuming one id is generated every second
@@ -27,11 +28,16 @@ DEFAULT_SIZE = 21
 LOG2 = log(2)
 
 
-def nanoid(alphabet: str = DEFAULT_ALPHABET, size: int = DEFAULT_SIZE) -> str:
+def nanoid(
+    alphabet: str = DEFAULT_ALPHABET,
+    size: int = DEFAULT_SIZE,
+    randbytes: t.Callable[[int], bytes] = token_bytes,
+) -> str:
     """Implementation taken from https://github.com/puyuan/py-nanoid
 
     This is functionally equivalent to calling secrets.choice(alphabet) until generated string
     is of desired size, but it is 10~15x faster than calling secrets.choice.
+    Random bytes are read using `randbytes` function.
     """
     alphabet_len = len(alphabet)
 
@@ -42,7 +48,7 @@ def nanoid(alphabet: str = DEFAULT_ALPHABET, size: int = DEFAULT_SIZE) -> str:
 
     _id = ""
     while True:
-        random_bytes = token_hex(step).encode()
+        random_bytes = randbytes(step)
 
         for i in range(step):
             random_byte = random_bytes[i] & mask
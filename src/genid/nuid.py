@@ -16,12 +16,15 @@
 
 from __future__ import annotations
 
+import typing as t
 from random import Random
 from secrets import randbelow, token_bytes
 from sys import maxsize as MaxInt
 
-DIGITS = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-BASE = 62
+from .codecs import BASE62
+
+DIGITS = BASE62.alphabet.encode()
+BASE = BASE62.base
 PREFIX_LENGTH = 12
 SEQ_LENGTH = 10
 MAX_SEQ = 839299365868340224  # BASE**10
@@ -29,6 +32,12 @@ MIN_INC = 33
 MAX_INC = 333
 INC = MAX_INC - MIN_INC
 TOTAL_LENGTH = PREFIX_LENGTH + SEQ_LENGTH
+# Pairs of digits used to write sequences without intermediate objects
+DIGIT_PAIRS = BASE62.byte_pairs
+BASE_PAIR = BASE * BASE
+BASE_PAIR_2 = BASE_PAIR**2
+BASE_PAIR_3 = BASE_PAIR**3
+BASE_PAIR_4 = BASE_PAIR**4
 
 
 class NUID:
@@ -53,15 +62,28 @@ class NUID:
             self.randomize_prefix()
             self.reset_sequential()
 
+        # Sequence is written as 5 pairs of digits, without intermediate bytearray
         current = self._seq
-        prefix = self._prefix[:]
-        suffix = bytearray(SEQ_LENGTH)
-        for i in reversed(range(SEQ_LENGTH)):
-            suffix[i] = DIGITS[int(current) % BASE]
-            current //= BASE
+        pairs = DIGIT_PAIRS
+        return self._prefix + b"".join(
+            (
+                pairs[current // BASE_PAIR_4 % BASE_PAIR],
+                pairs[current // BASE_PAIR_3 % BASE_PAIR],
+                pairs[current // BASE_PAIR_2 % BASE_PAIR],
+                pairs[current // BASE_PAIR % BASE_PAIR],
+                pairs[current % BASE_PAIR],
+            )
+        )
 
-        prefix.extend(suffix)
-        return prefix
+    def next_into(self, buffer: t.Any, offset: int = 0, count: int = 1) -> None:
+        """
+        next_into writes `count` unique identifiers into a writable buffer,
+        starting at `offset`. Each identifier is 22 bytes long.
+        """
+        view = memoryview(buffer).cast("B")
+        new = self.next
+        for position in range(offset, offset + TOTAL_LENGTH * count, TOTAL_LENGTH):
+            view[position : position + TOTAL_LENGTH] = new()
 
     def randomize_prefix(self) -> None:
         random_bytes = token_bytes(PREFIX_LENGTH)
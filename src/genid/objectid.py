@@ -19,7 +19,6 @@
 Taken from https://github.com/py-bson/bson
 """
 
-import binascii
 import calendar
 import datetime
 import os
@@ -30,6 +29,8 @@ import threading
 import time
 import typing as t
 
+from .codecs import BASE16
+
 ZERO = datetime.timedelta(0)
 
 
@@ -98,6 +99,10 @@ def _raise_invalid_id(oid: t.Any) -> None:
     )
 
 
+# 4 bytes timestamp, 3 bytes machine, 2 bytes pid and 3 bytes counter
+_OBJECTID_STRUCT = struct.Struct(">i3sHBH")
+
+
 class ObjectID(object):
     """A MongoDB ObjectId."""
 
@@ -142,6 +147,48 @@ class ObjectID(object):
         else:
             self.__validate(oid)
 
+    @classmethod
+    def generate(cls, timestamp: t.Optional[int] = None) -> "ObjectID":
+        """Create a new unique ObjectId with a specific generation time.
+        :Parameters:
+          - `timestamp` (optional): number of seconds since the Unix epoch.
+            Defaults to current time.
+        """
+        oid = cls.__new__(cls)
+        oid.__generate(timestamp)
+        return oid
+
+    @classmethod
+    def generate_into(
+        cls,
+        buffer: t.Any,
+        offset: int = 0,
+        count: int = 1,
+        timestamp: t.Optional[int] = None,
+    ) -> None:
+        """Write `count` new unique ObjectIds (12 bytes each) into a writable buffer.
+        No ObjectId instance is created.
+        :Parameters:
+          - `buffer`: an object supporting the writable buffer protocol.
+          - `offset` (optional): position of the first ObjectId within buffer.
+          - `count` (optional): number of ObjectIds to write.
+          - `timestamp` (optional): number of seconds since the Unix epoch.
+            Defaults to current time.
+        """
+        if timestamp is None:
+            timestamp = int(time.time())
+        with ObjectID._inc_lock:
+            inc = ObjectID._inc
+            ObjectID._inc = (inc + count) % 0xFFFFFF
+        machine = ObjectID._machine_bytes
+        pid = os.getpid() % 0xFFFF
+        pack_into = _OBJECTID_STRUCT.pack_into
+        for position in range(offset, offset + 12 * count, 12):
+            pack_into(
+                buffer, position, timestamp, machine, pid, inc >> 16, inc & 0xFFFF
+            )
+            inc = (inc + 1) % 0xFFFFFF
+
     @classmethod
     def from_datetime(cls, generation_time: datetime.datetime) -> "ObjectID":
         """Create a dummy ObjectId instance with a specific generation time.
@@ -187,11 +234,13 @@ class ObjectID(object):
         except (InvalidId, TypeError):
             return False
 
-    def __generate(self) -> None:
+    def __generate(self, timestamp: t.Optional[int] = None) -> None:
         """Generate a new value for this ObjectId."""
 
         # 4 bytes current time
-        oid = struct.pack(">i", int(time.time()))
+        if timestamp is None:
+            timestamp = int(time.time())
+        oid = struct.pack(">i", timestamp)
 
         # 3 bytes machine
         oid += ObjectID._machine_bytes
@@ -220,7 +269,7 @@ class ObjectID(object):
         elif isinstance(oid, str):
             if len(oid) == 24:
                 try:
-                    self.__id = bytes.fromhex(oid)
+                    self.__id = BASE16.decode(oid, 12)
                 except (TypeError, ValueError):
                     _raise_invalid_id(oid)
             else:
@@ -247,7 +296,7 @@ class ObjectID(object):
         return datetime.datetime.fromtimestamp(timestamp, utc)
 
     def __str__(self) -> str:
-        return binascii.hexlify(self.__id).decode()
+        return BASE16.encode(self.__id)
 
     def __repr__(self) -> str:
         return f"ObjectId('{str(self)}')"
@@ -285,3 +334,18 @@ class ObjectID(object):
     def __hash__(self) -> int:
         """Get a hash value for this :class:`ObjectId`."""
         return hash(self.__id)
+
+    def __reduce__(self) -> t.Tuple[t.Type["ObjectID"], t.Tuple[bytes]]:
+        """Pickle this :class:`ObjectId` as its 12 bytes."""
+        return (ObjectID, (self.__id,))
+
+
+def _reset_counter() -> None:
+    # Forked processes start with a new counter and lock, so that they do not
+    # depend on the process ID alone to generate distinct ObjectIDs
+    ObjectID._inc = random.randint(0, 0xFFFFFF)
+    ObjectID._inc_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_counter)
@@ -0,0 +1,53 @@
+"""OpenTelemetry ID generator using trace and span ID generators.
+
+[`OpenTelemetryIdGenerator`][genid.opentelemetry.OpenTelemetryIdGenerator]
+generates trace IDs and span IDs of an OpenTelemetry `TracerProvider` using a
+[`TraceIDGenerator`][genid.generators.TraceIDGenerator] and a
+[`SpanIDGenerator`][genid.generators.SpanIDGenerator]:
+
+```python
+from opentelemetry.sdk.trace import TracerProvider
+from genid.opentelemetry import OpenTelemetryIdGenerator
+
+provider = TracerProvider(id_generator=OpenTelemetryIdGenerator())
+```
+
+IDs are drawn from the operating system CSPRNG by pools of `pool_size` IDs,
+instead of calling `random.getrandbits()` for each ID like the default
+`RandomIdGenerator` of the SDK.
+
+`opentelemetry-sdk` is an optional dependency, which can be installed using the
+`opentelemetry` extra.
+"""
+
+from opentelemetry.sdk.trace.id_generator import IdGenerator
+
+from .generators import DEFAULT_POOL_SIZE, SpanIDGenerator, TraceIDGenerator
+from .rng import BlockRandom, Rng
+
+
+class OpenTelemetryIdGenerator(IdGenerator):
+    """OpenTelemetry ID generator of random non-zero trace and span IDs.
+
+    Arguments:
+        rng: random source (see [`genid.rng`][genid.rng]). Defaults to the
+            operating system CSPRNG.
+        pool_size: number of IDs drawn at once from random bytes.
+    """
+
+    def __init__(self, rng: Rng = None, pool_size: int = DEFAULT_POOL_SIZE) -> None:
+        # Both generators share a single random source, so that a seed does not
+        # produce trace IDs and span IDs made of the same bytes
+        if rng is not None and not isinstance(rng, BlockRandom):
+            rng = BlockRandom(rng)
+        self.trace_ids = TraceIDGenerator(rng, pool_size)
+        self.span_ids = SpanIDGenerator(rng, pool_size)
+
+    def generate_trace_id(self) -> int:
+        return self.trace_ids.unsafe_create_id()
+
+    def generate_span_id(self) -> int:
+        return self.span_ids.unsafe_create_id()
+
+    def is_trace_id_random(self) -> bool:
+        return True
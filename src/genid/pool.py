@@ -0,0 +1,294 @@
+"""Pool of ID generators shared by many tenants.
+
+A [`GeneratorPool`][genid.pool.GeneratorPool] holds one generator per tenant and
+generator configuration. Generators are created lazily using
+[`generator()`][genid.generators.generator] and the least recently used
+generators are evicted when the pool is full, or when they were not used for
+`max_idle` seconds. Memory usage is bounded by the number of active tenants,
+whatever the total number of tenants.
+
+```python
+from genid.pool import GeneratorPool
+
+pool = GeneratorPool(max_size=10_000, max_idle=300)
+order_id = pool.new("tenant-1", "incremental")
+token = pool.new("tenant-2", "nanoid", size=32)
+```
+
+Incremental generators are stateful: when an incremental generator is evicted,
+the next integer it would have generated is saved, and the generator created
+again for the same tenant resumes from this integer. States are kept in memory
+by default. Use `save_state` and `load_state` to persist them elsewhere (for
+example in a database): at most `max_states` states are kept in memory.
+Persistent incremental generators (created with a `state_file`) save their own
+state, and are closed when evicted.
+"""
+
+import collections
+import sys
+import threading
+import typing as t
+
+from .clock import SYSTEM_CLOCK, Clock
+from .generators import IDGenerator, IncrementalIDGenerator, Kind, generator
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_MAX_STATES = 65536
+# Kinds whose generators must not generate IDs once their state was saved
+STATEFUL_KINDS = frozenset([Kind.INCREMENTAL])
+
+# Tenant, kind and sorted generator options
+PoolKey = t.Tuple[t.Hashable, Kind, t.Tuple[t.Tuple[str, t.Any], ...]]
+State = t.Dict[str, t.Any]
+R = t.TypeVar("R")
+
+
+class PoolStats(t.NamedTuple):
+    """Statistics of a generator pool."""
+
+    size: int
+    """Number of generators in the pool."""
+    hits: int
+    """Number of requests served by an existing generator."""
+    misses: int
+    """Number of generators created."""
+    evictions: int
+    """Number of generators evicted."""
+    footprint: int
+    """Approximate memory used by the pool, in bytes."""
+    dropped_states: int
+    """Number of states dropped from memory because `max_states` was reached."""
+
+
+def generator_state(gen: IDGenerator[t.Any]) -> t.Optional[State]:
+    """Return the options which create a generator resuming where `gen` stopped,
+    or None when generator does not need to save its state.
+    """
+    if isinstance(gen, IncrementalIDGenerator) and not gen.persistent:
+        return {"offset": gen.counter}
+    return None
+
+
+def footprint(gen: IDGenerator[t.Any]) -> int:
+    """Shallow size of a generator in bytes: the generator and its lock.
+    Objects referenced by the generator (such as options, clocks, random sources
+    and lookup tables) are not included, since they are usually shared.
+    """
+    return sys.getsizeof(gen) + sys.getsizeof(gen._counter_lock)
+
+
+class _Entry:
+    """A generator of the pool and the time it was last used in milliseconds.
+    Stateful generators also hold the lock acquired to generate IDs.
+    """
+
+    __slots__ = ("generator", "last_used", "lock", "evicted")
+
+    def __init__(self, gen: IDGenerator[t.Any], last_used: int, stateful: bool) -> None:
+        self.generator = gen
+        self.last_used = last_used
+        self.lock = threading.Lock() if stateful else None
+        self.evicted = False
+
+
+class GeneratorPool:
+    """Lazily created generators keyed by tenant, kind and options, evicted
+    in least recently used order.
+
+    Arguments:
+        max_size: maximum number of generators held by the pool.
+        max_idle: evict generators which were not used for `max_idle` seconds.
+        save_state: called with the key and the state of stateful generators
+            when they are evicted. States are kept in memory when not provided.
+        load_state: called with the key of stateful generators before they are
+            created. Returns the state saved by `save_state`, or None.
+        clock: clock used to measure idle time.
+        max_states: maximum number of states kept in memory when `save_state` is
+            not provided. The least recently saved states are dropped first, and
+            generators created again after their state was dropped start from
+            their options.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_idle: t.Optional[float] = None,
+        save_state: t.Optional[t.Callable[[PoolKey, State], None]] = None,
+        load_state: t.Optional[t.Callable[[PoolKey], t.Optional[State]]] = None,
+        clock: t.Optional[Clock] = None,
+        max_states: int = DEFAULT_MAX_STATES,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("Pool size must be a positive integer")
+        if max_states < 0:
+            raise ValueError("Maximum number of states must be a non-negative integer")
+        if (save_state is None) != (load_state is None):
+            raise ValueError("save_state and load_state must be provided together")
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_states = max_states
+        # States from least to most recently saved
+        self._states: "collections.OrderedDict[PoolKey, State]" = (
+            collections.OrderedDict()
+        )
+        self._save_state = save_state or self._keep_state
+        self._load_state = load_state or self._pop_state
+        self._clock = clock or SYSTEM_CLOCK
+        # Protects entries and statistics. IDs are generated outside of this lock
+        self._lock = threading.Lock()
+        # Entries from least to most recently used
+        self._entries: "collections.OrderedDict[PoolKey, _Entry]" = (
+            collections.OrderedDict()
+        )
+        self._hits = self._misses = self._evictions = self._dropped_states = 0
+
+    def _keep_state(self, key: PoolKey, state: State) -> None:
+        states = self._states
+        states[key] = state
+        states.move_to_end(key)
+        while len(states) > self.max_states:
+            states.popitem(last=False)
+            self._dropped_states += 1
+
+    def _pop_state(self, key: PoolKey) -> t.Optional[State]:
+        return self._states.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: PoolKey) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def key(tenant: t.Hashable, kind: t.Union[str, Kind], **options: t.Any) -> PoolKey:
+        """Return the key of the generator of a tenant. Options must be hashable."""
+        return (tenant, Kind(kind), tuple(sorted(options.items())))
+
+    def _evict(self, key: PoolKey, entry: _Entry) -> None:
+        del self._entries[key]
+        self._evictions += 1
+        if entry.lock is None:
+            return
+        # Wait for IDs being generated, so that the saved state follows them
+        with entry.lock:
+            entry.evicted = True
+            gen = entry.generator
+            state = generator_state(gen)
+            if state is not None:
+                self._save_state(key, state)
+            if isinstance(gen, IncrementalIDGenerator):
+                gen.close()
+
+    def _evict_idle(self, now: int) -> None:
+        if self.max_idle is None:
+            return
+        cutoff = now - int(self.max_idle * 1000)
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry.last_used >= cutoff:
+                return
+            self._evict(key, entry)
+
+    def _get(self, key: PoolKey) -> _Entry:
+        now = self._clock.time_ms() if self.max_idle is not None else 0
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            entry.last_used = now
+            self._entries.move_to_end(key)
+            self._evict_idle(now)
+            return entry
+        self._misses += 1
+        self._evict_idle(now)
+        while len(self._entries) >= self.max_size:
+            self._evict(*next(iter(self._entries.items())))
+        tenant, kind, options = key
+        kwargs = dict(options)
+        stateful = kind in STATEFUL_KINDS
+        if stateful:
+            kwargs.update(self._load_state(key) or {})
+        entry = _Entry(generator(kind, **kwargs), now, stateful)
+        self._entries[key] = entry
+        return entry
+
+    def _generate(
+        self, key: PoolKey, generate: t.Callable[[IDGenerator[t.Any]], R]
+    ) -> R:
+        while True:
+            with self._lock:
+                entry = self._get(key)
+            if entry.lock is None:
+                return generate(entry.generator)
+            # Stateful generators generate under the lock of their entry, so that
+            # they cannot be evicted (and their state saved) concurrently
+            with entry.lock:
+                if not entry.evicted:
+                    return generate(entry.generator)
+            # Generator was evicted after it was retrieved: create it again
+
+    def get(
+        self, tenant: t.Hashable, kind: t.Union[str, Kind], **options: t.Any
+    ) -> IDGenerator[t.Any]:
+        """Return the generator of a tenant, creating it when needed.
+
+        Generators of stateful kinds must not be used after they are evicted:
+        use `new()` and `new_many()` to generate their IDs.
+        """
+        key = self.key(tenant, kind, **options)
+        with self._lock:
+            return self._get(key).generator
+
+    def new(
+        self, tenant: t.Hashable, kind: t.Union[str, Kind], **options: t.Any
+    ) -> str:
+        """Get a new ID as a string from the generator of a tenant."""
+        return self._generate(self.key(tenant, kind, **options), IDGenerator.new)
+
+    def new_many(
+        self,
+        tenant: t.Hashable,
+        kind: t.Union[str, Kind],
+        count: int,
+        **options: t.Any,
+    ) -> t.List[str]:
+        """Get a list of `count` new IDs as strings from the generator of a tenant."""
+        return self._generate(
+            self.key(tenant, kind, **options), lambda gen: gen.new_many(count)
+        )
+
+    def evict_idle(self) -> None:
+        """Evict generators which were not used for `max_idle` seconds."""
+        with self._lock:
+            self._evict_idle(self._clock.time_ms())
+
+    def clear(self) -> None:
+        """Evict all generators, saving states of stateful generators."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                self._evict(key, entry)
+
+    def footprint(self) -> int:
+        """Approximate memory used by the pool, in bytes: generators, their locks
+        and pool entries (see [`footprint()`][genid.pool.footprint]).
+        """
+        with self._lock:
+            return sys.getsizeof(self._entries) + sum(
+                footprint(entry.generator)
+                + sys.getsizeof(key)
+                + sys.getsizeof(entry)
+                + (sys.getsizeof(entry.lock) if entry.lock else 0)
+                for key, entry in self._entries.items()
+            )
+
+    def stats(self) -> PoolStats:
+        """Return statistics of the pool."""
+        size = self.footprint()
+        return PoolStats(
+            len(self._entries),
+            self._hits,
+            self._misses,
+            self._evictions,
+            size,
+            self._dropped_states,
+        )
@@ -0,0 +1,374 @@
+"""Persistent registry of issued IDs.
+
+An [`IDRegistry`][genid.registry.IDRegistry] records issued IDs, so that IDs
+which were never issued (for example forged secrets) can be rejected without
+querying a database. It is made of two files:
+
+- An append-only log (`path`) holding each issued ID and the time it was issued.
+- A memory-mapped hash index (`path` + `.index`) used for membership checks.
+
+A registry must only be opened by a single process at once: it holds an
+exclusive lock on a third file (`path` + `.lock`) while it is open. Threads of
+this process can share it.
+
+The index is an open addressing hash table with linear probing. Each 16 bytes
+slot holds a 64 bits fingerprint of an ID (a BLAKE2b hash keyed with a random
+salt stored in the index header) and the time the ID was issued in
+milliseconds. A membership check costs a single hash and usually a single slot
+read, whatever the number of IDs, and the index survives restarts. The index is
+grown when it is 75% full, and can be rebuilt from the log at any time. IDs are
+written to the log before the index, so that the index does not hold IDs missing
+from the log when the process crashes.
+
+Fingerprints are 64 bits long, so the probability that an ID which was never
+issued is accepted is about `n / 2**64` for `n` registered IDs.
+
+A [`RegisteredIDGenerator`][genid.registry.RegisteredIDGenerator] wraps any
+generator and records each generated ID:
+
+```python
+from genid import generator
+from genid.registry import IDRegistry, RegisteredIDGenerator
+
+registry = IDRegistry("/var/lib/myapp/issued", max_age=30 * 24 * 3600)
+gen = RegisteredIDGenerator(generator("secret"), registry)
+token = gen.new()
+assert token in registry
+```
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+import typing as t
+
+from .clock import SYSTEM_CLOCK, Clock
+from .generators import IDGenerator, T, WrappedIDGenerator
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+
+MAGIC = b"GIDX"
+VERSION = 1
+# Magic, version, number of slots, number of IDs, salt
+INDEX_HEADER = struct.Struct("<4sBxxxQQ16s")
+INDEX_HEADER_SIZE = 64
+SLOT = struct.Struct("<QQ")
+# Issued time in milliseconds and length of the ID
+LOG_RECORD = struct.Struct("<QH")
+DEFAULT_SLOTS = 1 << 16
+MAX_LOAD = 0.75
+
+
+class InvalidIndex(ValueError):
+    """Raised when an index file is not a valid registry index."""
+
+
+class RegistryLocked(RuntimeError):
+    """Raised when a registry is already open."""
+
+
+def _as_bytes(value: t.Union[str, bytes]) -> bytes:
+    return value.encode() if isinstance(value, str) else bytes(value)
+
+
+class _Index:
+    """Memory-mapped open addressing hash table of fingerprints."""
+
+    def __init__(self, path: str, slots: int = DEFAULT_SLOTS) -> None:
+        self.path = path
+        if not os.path.exists(path):
+            self._create(path, slots, os.urandom(16))
+        self._file = open(path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        magic, version, self.slots, self.count, self.salt = INDEX_HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise InvalidIndex(f"Invalid registry index: {path}")
+        self.mask = self.slots - 1
+        # Copying a keyed hash state is cheaper than keying a new hash
+        self._hash = hashlib.blake2b(key=self.salt, digest_size=8)
+
+    @staticmethod
+    def _create(path: str, slots: int, salt: bytes) -> None:
+        size = INDEX_HEADER_SIZE + SLOT.size * slots
+        with open(path, "wb") as index:
+            index.write(INDEX_HEADER.pack(MAGIC, VERSION, slots, 0, salt))
+            index.truncate(size)
+
+    def fingerprint(self, value: bytes) -> int:
+        state = self._hash.copy()
+        state.update(value)
+        # Zero marks empty slots
+        return int.from_bytes(state.digest(), "little") or 1
+
+    def lookup(self, fingerprint: int) -> t.Optional[int]:
+        """Return issued time of fingerprint, or None when not found."""
+        buffer, mask, unpack = self._mmap, self.mask, SLOT.unpack_from
+        slot = fingerprint & mask
+        while True:
+            found, issued = unpack(buffer, INDEX_HEADER_SIZE + SLOT.size * slot)
+            if found == fingerprint:
+                return t.cast(int, issued)
+            if not found:
+                return None
+            slot = (slot + 1) & mask
+
+    def insert(self, fingerprint: int, issued: int) -> None:
+        buffer, mask = self._mmap, self.mask
+        slot = fingerprint & mask
+        while True:
+            offset = INDEX_HEADER_SIZE + SLOT.size * slot
+            found, _ = SLOT.unpack_from(buffer, offset)
+            if found == fingerprint:
+                SLOT.pack_into(buffer, offset, fingerprint, issued)
+                return
+            if not found:
+                SLOT.pack_into(buffer, offset, fingerprint, issued)
+                self.count += 1
+                INDEX_HEADER.pack_into(
+                    buffer, 0, MAGIC, VERSION, self.slots, self.count, self.salt
+                )
+                return
+            slot = (slot + 1) & mask
+
+    def entries(self) -> t.List[t.Tuple[int, int]]:
+        """Return fingerprints and issued times of all IDs."""
+        with memoryview(self._mmap) as view, view[INDEX_HEADER_SIZE:] as slots:
+            return [entry for entry in SLOT.iter_unpack(slots) if entry[0]]
+
+    def flush(self) -> None:
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+
+class IDRegistry:
+    """Persistent registry of issued IDs.
+
+    IDs older than `max_age` seconds are considered expired: they are not
+    reported as issued anymore, and are removed from files by `compact()`.
+    """
+
+    def __init__(
+        self,
+        path: t.Union[str, "os.PathLike[str]"],
+        max_age: t.Optional[float] = None,
+        slots: int = DEFAULT_SLOTS,
+        clock: t.Optional[Clock] = None,
+    ) -> None:
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError("Number of slots must be a power of 2")
+        self.path = os.fspath(path)
+        self.index_path = self.path + ".index"
+        self.lock_path = self.path + ".lock"
+        self.max_age = max_age
+        self._clock = clock or SYSTEM_CLOCK
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if not _try_lock(self._lock_fd):
+            os.close(self._lock_fd)
+            raise RegistryLocked(f"Registry is already open: {self.path}")
+        try:
+            rebuild = os.path.exists(self.path) and not os.path.exists(self.index_path)
+            self._index = _Index(self.index_path, slots)
+            self._log = open(self.path, "ab")
+        except BaseException:
+            os.close(self._lock_fd)
+            raise
+        if rebuild:
+            self.rebuild_index()
+
+    def __len__(self) -> int:
+        """Number of registered IDs, including expired IDs not compacted yet."""
+        return t.cast(int, self._index.count)
+
+    def _cutoff(self) -> int:
+        if self.max_age is None:
+            return 0
+        return self._clock.time_ms() - int(self.max_age * 1000)
+
+    def _grow(self, slots: int) -> None:
+        self._replace_index(self._index.entries(), slots)
+
+    def _replace_index(self, entries: t.List[t.Tuple[int, int]], slots: int) -> None:
+        salt = self._index.salt
+        temporary = self.index_path + ".tmp"
+        _Index._create(temporary, slots, salt)
+        index = _Index(temporary)
+        for fingerprint, issued in entries:
+            index.insert(fingerprint, issued)
+        index.close()
+        self._index.close()
+        os.replace(temporary, self.index_path)
+        self._index = _Index(self.index_path)
+
+    def _add(self, values: t.List[bytes], issued: int) -> None:
+        slots = self._index.slots
+        while self._index.count + len(values) > slots * MAX_LOAD:
+            slots *= 2
+        if slots != self._index.slots:
+            self._grow(slots)
+        # Records are written out of the log buffer before IDs are inserted into
+        # the memory-mapped index, so that a crash never leaves IDs in the index only
+        self._log.write(
+            b"".join(LOG_RECORD.pack(issued, len(value)) + value for value in values)
+        )
+        self._log.flush()
+        index = self._index
+        fingerprint, insert = index.fingerprint, index.insert
+        for value in values:
+            insert(fingerprint(value), issued)
+
+    def add(self, value: t.Union[str, bytes]) -> None:
+        """Register an issued ID."""
+        with self._lock:
+            self._add([_as_bytes(value)], self._clock.time_ms())
+
+    def add_many(self, values: t.Iterable[t.Union[str, bytes]]) -> None:
+        """Register several issued IDs."""
+        data = [_as_bytes(value) for value in values]
+        with self._lock:
+            self._add(data, self._clock.time_ms())
+
+    def issued_at(self, value: t.Union[str, bytes]) -> t.Optional[int]:
+        """Return the time an ID was issued as epoch time in milliseconds,
+        or None when ID was not issued or is expired.
+        """
+        with self._lock:
+            index = self._index
+            issued = index.lookup(index.fingerprint(_as_bytes(value)))
+        if issued is None or issued < self._cutoff():
+            return None
+        return issued
+
+    def __contains__(self, value: t.Union[str, bytes]) -> bool:
+        return self.issued_at(value) is not None
+
+    def _read_log(self) -> t.Iterator[t.Tuple[int, bytes]]:
+        self._log.flush()
+        with open(self.path, "rb") as log:
+            data = log.read()
+        offset = 0
+        while offset + LOG_RECORD.size <= len(data):
+            issued, length = LOG_RECORD.unpack_from(data, offset)
+            offset += LOG_RECORD.size
+            yield issued, data[offset : offset + length]
+            offset += length
+
+    def _slots_for(self, count: int) -> int:
+        slots = DEFAULT_SLOTS
+        while count > slots * MAX_LOAD / 2:
+            slots *= 2
+        return slots
+
+    def rebuild_index(self) -> None:
+        """Rebuild the index from the log."""
+        with self._lock:
+            records = list(self._read_log())
+            fingerprint = self._index.fingerprint
+            entries = [(fingerprint(value), issued) for issued, value in records]
+            self._replace_index(entries, self._slots_for(len(entries)))
+
+    def compact(self) -> int:
+        """Remove expired IDs from the log and the index.
+        Returns the number of IDs removed.
+        """
+        with self._lock:
+            cutoff = self._cutoff()
+            records = list(self._read_log())
+            kept = [(issued, value) for issued, value in records if issued >= cutoff]
+            temporary = self.path + ".tmp"
+            with open(temporary, "wb") as log:
+                log.write(
+                    b"".join(
+                        LOG_RECORD.pack(issued, len(value)) + value
+                        for issued, value in kept
+                    )
+                )
+            self._log.close()
+            os.replace(temporary, self.path)
+            self._log = open(self.path, "ab")
+            fingerprint = self._index.fingerprint
+            entries = [(fingerprint(value), issued) for issued, value in kept]
+            self._replace_index(entries, self._slots_for(len(entries)))
+            return len(records) - len(kept)
+
+    def flush(self) -> None:
+        """Write pending changes to disk."""
+        with self._lock:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+            self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close registry files."""
+        self.flush()
+        self._log.close()
+        self._index.close()
+        os.close(self._lock_fd)
+
+    def __enter__(self) -> "IDRegistry":
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+
+class RegisteredIDGenerator(WrappedIDGenerator[T]):
+    """An ID generator recording each ID generated by another generator
+    into an [`IDRegistry`][genid.registry.IDRegistry].
+
+    IDs are registered when they are generated, so IDs reverted by
+    `new_at_index()` stay registered.
+    """
+
+    __slots__ = ("_registry",)
+
+    def __init__(self, generator: IDGenerator[T], registry: IDRegistry) -> None:
+        super().__init__(generator)
+        self._registry = registry
+
+    @property
+    def registry(self) -> IDRegistry:
+        """The registry holding issued IDs."""
+        return self._registry
+
+    def is_issued(self, value: t.Union[str, bytes]) -> bool:
+        """Return True when ID was issued and is not expired."""
+        return value in self._registry
+
+    def unsafe_create_id(self) -> T:
+        _id = self._generator.unsafe_create_id()
+        self._registry.add(self._generator.id_to_string(_id))
+        return _id
+
+    def unsafe_create_ids(self, count: int) -> t.List[T]:
+        ids = self._generator.unsafe_create_ids(count)
+        self._registry.add_many(self._generator.ids_to_strings(ids))
+        return ids
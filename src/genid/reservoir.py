@@ -0,0 +1,311 @@
+"""Cross-process reservoir of IDs stored in shared memory.
+
+A [`Reservoir`][genid.reservoir.Reservoir] is a ring buffer of fixed-width IDs
+stored in a `multiprocessing.shared_memory` block. A single producer process
+generates IDs directly into the ring using
+[`IDGenerator.fill_into()`][genid.generators.IDGenerator.fill_into], and
+consumers in other processes pop IDs or whole blocks of IDs, so that IDs are
+generated by a single generator (preserving ordering of ULIDs and ObjectIDs)
+outside of consumers critical path:
+
+```python
+import multiprocessing
+from genid.reservoir import Reservoir
+
+def worker(reservoir: Reservoir) -> None:
+    for _ in range(1000):
+        new_id = reservoir.pop()
+
+with Reservoir.create("ulid", capacity=65536) as reservoir:
+    stop = multiprocessing.Event()
+    producer = multiprocessing.Process(target=reservoir.produce, args=(stop,))
+    producer.start()
+    workers = [multiprocessing.Process(target=worker, args=(reservoir,)) for _ in range(4)]
+    ...
+```
+
+The shared memory block starts with a header, followed by the write cursor, the
+read cursor, consumer statistics and the TypeID prefix, each on its own cache
+line, then by the ring itself. Cursors are counts of IDs ever written or read.
+The reservoir is not lock-free: Python does not expose atomic operations on
+shared memory, so cursors are updated while holding a lock shared by the
+producer and consumers. The producer only holds the lock to publish the write
+cursor once IDs are written, and consumers to copy IDs and move the read cursor.
+"""
+
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.synchronize
+import os
+import struct
+import sys
+import time
+import typing as t
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .generators import IDGenerator, Kind, TypeIDGenerator, generator
+from .serialize import KIND_TAGS, TAG_KINDS, WIDTHS, unpack_values
+from .typeid import TypeID, validate_prefix
+
+MAGIC = b"GIDR"
+# Magic, kind tag, prefix length, width and capacity
+HEADER = struct.Struct("<4sBBxxII")
+CURSOR = struct.Struct("<Q")
+STATS = struct.Struct("<QQQ")
+WRITE_CURSOR_OFFSET = 64
+READ_CURSOR_OFFSET = 128
+STATS_OFFSET = 192
+PREFIX_OFFSET = 256
+DATA_OFFSET = 320
+DEFAULT_CAPACITY = 65536
+POLL_INTERVAL = 0.0001
+# Before Python 3.13, every process attaching POSIX shared memory registers it
+# with its resource tracker, which destroys it when the process exits
+TRACKED_ATTACH = os.name == "posix" and sys.version_info < (3, 13)
+
+
+class ReservoirEmpty(Exception):
+    """Raised when IDs could not be popped before timeout."""
+
+
+class ReservoirStats(t.NamedTuple):
+    """Statistics of a reservoir.
+
+    `low_watermark` is the lowest number of IDs available seen by a consumer, and
+    `starved` is the number of pops which had to wait for the producer.
+    """
+
+    capacity: int
+    produced: int
+    consumed: int
+    available: int
+    low_watermark: int
+    starved: int
+
+
+def decode_ids(kind: Kind, data: bytes, count: int, prefix: str = "") -> t.List[t.Any]:
+    """Decode `count` IDs written back to back by `IDGenerator.fill_into()`.
+    TypeIDs are created with the given `prefix`.
+    """
+    if kind in WIDTHS:
+        return unpack_values(kind, data, count)
+    width = len(data) // count if count else 0
+    chunks = [data[start : start + width] for start in range(0, len(data), width)]
+    if kind == Kind.TYPEID:
+        return [TypeID(prefix, chunk) for chunk in chunks]
+    return [chunk.decode() for chunk in chunks]
+
+
+class Reservoir:
+    """Ring buffer of fixed-width IDs stored in shared memory.
+
+    Use [`Reservoir.create()`][genid.reservoir.Reservoir.create] to create a new
+    reservoir. Reservoirs can be passed as arguments to `multiprocessing` processes.
+    """
+
+    def __init__(
+        self,
+        shm: SharedMemory,
+        lock: multiprocessing.synchronize.Lock,
+        owner: bool = False,
+    ) -> None:
+        buf = t.cast(memoryview, shm.buf)
+        magic, tag, prefix_length, width, capacity = HEADER.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError(f"Shared memory {shm.name!r} is not an ID reservoir")
+        self.shm = shm
+        self.buf = buf
+        self.lock = lock
+        self.owner = owner
+        self.kind = TAG_KINDS[tag]
+        self.prefix = bytes(buf[PREFIX_OFFSET : PREFIX_OFFSET + prefix_length]).decode()
+        self.width: int = width
+        self.capacity: int = capacity
+        self.size = DATA_OFFSET + width * capacity
+
+    @classmethod
+    def create(
+        cls,
+        kind: t.Union[str, Kind],
+        capacity: int = DEFAULT_CAPACITY,
+        width: t.Optional[int] = None,
+        name: t.Optional[str] = None,
+        context: t.Optional[multiprocessing.context.BaseContext] = None,
+        prefix: str = "",
+    ) -> "Reservoir":
+        """Create a new reservoir holding up to `capacity` IDs of given kind.
+
+        `width` must be provided for kinds whose width depends on generator
+        options (for example `nanoid` with a custom size). `prefix` is the
+        prefix of `typeid` IDs, which is not stored in the ring. `context` is
+        the multiprocessing context used to start processes sharing the reservoir.
+        """
+        kind = Kind(kind)
+        if capacity <= 0:
+            raise ValueError("Reservoir capacity must be a positive integer")
+        if prefix and kind != Kind.TYPEID:
+            raise ValueError("Only typeid reservoirs accept a prefix")
+        encoded_prefix = validate_prefix(prefix).encode()
+        if width is None:
+            width = WIDTHS.get(kind) or generator(kind).id_width
+            if width is None:
+                raise TypeError(f"Kind {kind.value!r} does not have a fixed width")
+        lock = (context or multiprocessing.get_context()).Lock()
+        shm = SharedMemory(name, create=True, size=DATA_OFFSET + width * capacity)
+        buf = t.cast(memoryview, shm.buf)
+        HEADER.pack_into(
+            buf, 0, MAGIC, KIND_TAGS[kind], len(encoded_prefix), width, capacity
+        )
+        buf[PREFIX_OFFSET : PREFIX_OFFSET + len(encoded_prefix)] = encoded_prefix
+        return cls(shm, lock, owner=True)
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (_attach, (self.shm.name, self.lock))
+
+    def _cursor(self, offset: int) -> int:
+        return t.cast(int, CURSOR.unpack_from(self.buf, offset)[0])
+
+    def available(self) -> int:
+        """Return the number of IDs available."""
+        return self._cursor(WRITE_CURSOR_OFFSET) - self._cursor(READ_CURSOR_OFFSET)
+
+    def stats(self) -> ReservoirStats:
+        """Return reservoir statistics."""
+        produced = self._cursor(WRITE_CURSOR_OFFSET)
+        consumed = self._cursor(READ_CURSOR_OFFSET)
+        pops, low_watermark, starved = STATS.unpack_from(self.buf, STATS_OFFSET)
+        return ReservoirStats(
+            capacity=self.capacity,
+            produced=produced,
+            consumed=consumed,
+            available=produced - consumed,
+            low_watermark=low_watermark if pops else self.capacity,
+            starved=starved,
+        )
+
+    def fill(self, gen: IDGenerator[t.Any]) -> int:
+        """Write IDs into free slots. Must only be called by a single producer.
+        Returns the number of IDs written.
+        """
+        if gen.id_width != self.width:
+            raise ValueError(f"Generator must write IDs of {self.width} bytes")
+        if isinstance(gen, TypeIDGenerator) and gen.prefix != self.prefix:
+            raise ValueError(f"Generator must use TypeID prefix {self.prefix!r}")
+        written = self._cursor(WRITE_CURSOR_OFFSET)
+        free = self.capacity - (written - self._cursor(READ_CURSOR_OFFSET))
+        if free <= 0:
+            return 0
+        slot = written % self.capacity
+        head = min(free, self.capacity - slot)
+        gen.fill_into(self.buf, head, DATA_OFFSET + slot * self.width)
+        if free > head:
+            gen.fill_into(self.buf, free - head, DATA_OFFSET)
+        # IDs are visible to consumers only once the write cursor is updated
+        with self.lock:
+            CURSOR.pack_into(self.buf, WRITE_CURSOR_OFFSET, written + free)
+        return free
+
+    def produce(
+        self,
+        stop: t.Any,
+        gen: t.Optional[IDGenerator[t.Any]] = None,
+        low_watermark: float = 0.5,
+    ) -> None:
+        """Refill the reservoir until `stop` (a `multiprocessing.Event`) is set.
+
+        The reservoir is refilled once less than `low_watermark * capacity` IDs
+        are available. A generator of the reservoir kind is created when `gen`
+        is None.
+        """
+        if gen is None:
+            options = {"prefix": self.prefix} if self.prefix else {}
+            gen = generator(self.kind, **options)
+        threshold = int(self.capacity * low_watermark)
+        self.fill(gen)
+        while not stop.is_set():
+            if self.available() <= threshold:
+                self.fill(gen)
+            else:
+                time.sleep(POLL_INTERVAL)
+
+    def _claim(self, count: int, timeout: t.Optional[float]) -> bytes:
+        if not 0 < count <= self.capacity:
+            raise ValueError(
+                f"Cannot pop {count} IDs from a reservoir of {self.capacity}"
+            )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        buf = self.buf
+        while True:
+            with self.lock:
+                read = self._cursor(READ_CURSOR_OFFSET)
+                available = self._cursor(WRITE_CURSOR_OFFSET) - read
+                if available >= count:
+                    start = DATA_OFFSET + read % self.capacity * self.width
+                    end = start + count * self.width
+                    if end <= self.size:
+                        data = bytes(buf[start:end])
+                    else:
+                        wrapped = end - self.size + DATA_OFFSET
+                        data = bytes(buf[start : self.size]) + bytes(
+                            buf[DATA_OFFSET:wrapped]
+                        )
+                    CURSOR.pack_into(buf, READ_CURSOR_OFFSET, read + count)
+                    pops, low, starved = STATS.unpack_from(buf, STATS_OFFSET)
+                    STATS.pack_into(
+                        buf,
+                        STATS_OFFSET,
+                        pops + 1,
+                        min(low, available) if pops else available,
+                        starved + waited,
+                    )
+                    return data
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ReservoirEmpty(f"Failed to pop {count} IDs before timeout")
+            waited = True
+            time.sleep(POLL_INTERVAL)
+
+    def pop_block(self, count: int, timeout: t.Optional[float] = None) -> bytes:
+        """Pop `count` IDs in binary form, concatenated back to back.
+        Wait until enough IDs are available, or raise `ReservoirEmpty` on timeout.
+        """
+        return self._claim(count, timeout)
+
+    def pop_many(self, count: int, timeout: t.Optional[float] = None) -> t.List[t.Any]:
+        """Pop `count` IDs."""
+        return decode_ids(self.kind, self._claim(count, timeout), count, self.prefix)
+
+    def pop(self, timeout: t.Optional[float] = None) -> t.Any:
+        """Pop a single ID."""
+        return decode_ids(self.kind, self._claim(1, timeout), 1, self.prefix)[0]
+
+    def close(self) -> None:
+        """Close access to shared memory. The owner also destroys shared memory."""
+        self.shm.close()
+        if self.owner:
+            if TRACKED_ATTACH:
+                # Processes sharing the resource tracker of the owner may have
+                # unregistered the shared memory when attaching it
+                resource_tracker.register(
+                    self.shm._name, "shared_memory"  # type: ignore[attr-defined]
+                )
+            self.shm.unlink()
+
+    def __enter__(self) -> "Reservoir":
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+
+def _attach(name: str, lock: multiprocessing.synchronize.Lock) -> Reservoir:
+    # Shared memory is only destroyed by its owner
+    if sys.version_info >= (3, 13):
+        return Reservoir(SharedMemory(name, track=False), lock)
+    shm = SharedMemory(name)
+    if TRACKED_ATTACH:
+        resource_tracker.unregister(
+            shm._name, "shared_memory"  # type: ignore[attr-defined]
+        )
+    return Reservoir(shm, lock)
@@ -0,0 +1,96 @@
+"""Random sources used by random-based ID generators.
+
+Random-based generators (`nanoid`, `uuid4`, `ulid`, `ksuid`, `secret`, `traceid`
+and `spanid`) read random bytes from the operating system CSPRNG by default. They
+also accept an optional `rng` argument, which opts into a fast non-cryptographic
+random source:
+
+- an `int` is used as a seed for a new `random.Random` instance.
+- any object providing a `getrandbits(k)` method (such as `random.Random`) is
+  used as a bit generator.
+- a [`BlockRandom`][genid.rng.BlockRandom] instance is used as is.
+
+Random bytes are drawn from the bit generator by large blocks, so generation is
+much faster than with the CSPRNG, and output is reproducible from a seed.
+
+> Warning: IDs generated with a non-cryptographic random source are predictable. Do not use them for secrets, tokens or any security-sensitive identifiers.
+"""
+
+import os
+import random
+import threading
+import typing as t
+
+DEFAULT_BLOCK_SIZE = 65536
+
+RandBytes = t.Callable[[int], bytes]
+
+
+class BitGenerator(t.Protocol):
+    """A random engine able to produce an integer with `k` random bits."""
+
+    def getrandbits(self, k: int) -> int: ...  # pragma: no cover
+
+
+class BlockRandom:
+    """A non-cryptographic random source drawing bytes by blocks of `block_size` bytes.
+
+    A random source can be shared between threads: bytes returned to concurrent
+    callers never overlap.
+
+    Arguments:
+        rng: a seed or a bit generator. A new `random.Random` instance is used by default.
+        block_size: number of random bytes drawn from the bit generator at once.
+    """
+
+    def __init__(
+        self,
+        rng: t.Union[int, BitGenerator, None] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+        if rng is None or isinstance(rng, int):
+            rng = random.Random(rng)
+        self._getrandbits = rng.getrandbits
+        self._block_size = block_size
+        self._block = b""
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def randbytes(self, n: int) -> bytes:
+        """Return `n` random bytes."""
+        with self._lock:
+            position = self._position
+            end = position + n
+            if end <= len(self._block):
+                self._position = end
+                return self._block[position:end]
+            remaining = self._block[position:]
+            missing = n - len(remaining)
+            if missing >= self._block_size:
+                self._block, self._position = b"", 0
+                return remaining + self._draw(missing)
+            self._block = self._draw(self._block_size)
+            self._position = missing
+            return remaining + self._block[:missing]
+
+    __call__ = randbytes
+
+    def _draw(self, n: int) -> bytes:
+        return self._getrandbits(8 * n).to_bytes(n, "little")
+
+
+Rng = t.Union[int, BitGenerator, BlockRandom, None]
+
+
+def get_randbytes(rng: Rng = None) -> RandBytes:
+    """Return a function generating random bytes from `rng`.
+
+    `os.urandom` is returned when `rng` is None.
+    """
+    if rng is None:
+        return os.urandom
+    if isinstance(rng, BlockRandom):
+        return rng.randbytes
+    return BlockRandom(rng).randbytes
@@ -0,0 +1,217 @@
+"""Compact binary serialization of ID batches.
+
+A batch holds IDs of a single kind. It is serialized as a 5 bytes header (the kind
+tag as an unsigned byte and the number of IDs as an unsigned 32 bits big endian
+integer), followed by the IDs packed back to back. Fixed-width IDs are written in
+the binary form of their generator (see `IDGenerator.ids_to_bytes()`):
+
+- `objectid`: 12 bytes.
+- `uuid1`, `uuid4` and `ulid`: 16 bytes.
+- `ksuid`: 20 bytes.
+- `nuid`: 22 ASCII bytes.
+- `incremental`, `timestamp`, `nstimestamp` and `spanid`: 8 bytes big endian
+  integers.
+- `traceid`: 16 bytes big endian integers.
+- `constant`, `nanoid`, `secret` and `typeid`: UTF-8 strings, each prefixed by its
+  length as an unsigned 16 bits big endian integer.
+
+Optional [msgpack](https://msgpack.org) hooks are also provided, so that
+`ObjectID`, `ULID`, `KSUID` and `UUID` objects are packed as raw bytes within
+msgpack extension types rather than strings:
+
+```python
+import msgpack
+from genid.serialize import msgpack_default, msgpack_ext_hook
+
+data = msgpack.packb(payload, default=msgpack_default)
+payload = msgpack.unpackb(data, ext_hook=msgpack_ext_hook)
+```
+
+`msgpack` is an optional dependency, which can be installed using the `msgpack` extra.
+"""
+
+import struct
+import typing as t
+from uuid import UUID
+
+from .generators import Kind, generator
+from .ksuid import KSUID
+from .objectid import ObjectID
+from .typeid import TypeID
+from .ulid import ULID
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    import msgpack
+
+HEADER = struct.Struct(">BI")
+LENGTH = struct.Struct(">H")
+MAX_COUNT = 0xFFFFFFFF
+
+KIND_TAGS = {
+    Kind.CONSTANT: 0,
+    Kind.NANOID: 1,
+    Kind.NUID: 2,
+    Kind.OBJECTID: 3,
+    Kind.UUID1: 4,
+    Kind.UUID4: 5,
+    Kind.ULID: 6,
+    Kind.KSUID: 7,
+    Kind.INCREMENTAL: 8,
+    Kind.SECRET: 9,
+    Kind.TIMESTAMP: 10,
+    Kind.NSTIMESTAMP: 11,
+    Kind.TYPEID: 12,
+    Kind.TRACE_ID: 13,
+    Kind.SPAN_ID: 14,
+}
+TAG_KINDS = {tag: kind for kind, tag in KIND_TAGS.items()}
+
+# Kinds whose binary form does not depend on generator options
+FIXED_WIDTH_KINDS = (
+    Kind.NUID,
+    Kind.OBJECTID,
+    Kind.UUID1,
+    Kind.UUID4,
+    Kind.ULID,
+    Kind.KSUID,
+    Kind.INCREMENTAL,
+    Kind.TIMESTAMP,
+    Kind.NSTIMESTAMP,
+    Kind.TRACE_ID,
+    Kind.SPAN_ID,
+)
+# Generators writing IDs of fixed-width kinds in binary form, and their widths
+_BINARY_GENERATORS = {kind: generator(kind) for kind in FIXED_WIDTH_KINDS}
+WIDTHS: t.Dict[Kind, int] = {
+    kind: t.cast(int, gen.id_width) for kind, gen in _BINARY_GENERATORS.items()
+}
+INTEGER_KINDS = (Kind.INCREMENTAL, Kind.TIMESTAMP, Kind.NSTIMESTAMP, Kind.SPAN_ID)
+
+# msgpack extension type codes
+EXT_OBJECTID = 1
+EXT_ULID = 2
+EXT_KSUID = 3
+EXT_UUID = 4
+
+
+class InvalidBatch(ValueError):
+    """Raised when bytes do not hold a valid batch of IDs."""
+
+
+def pack_values(kind: Kind, values: t.Sequence[t.Any]) -> bytes:
+    """Pack IDs of a single kind back to back, without header."""
+    gen = _BINARY_GENERATORS.get(kind)
+    if gen is not None:
+        return gen.ids_to_bytes(t.cast(t.List[t.Any], values))
+    chunks: t.List[bytes] = []
+    for value in values:
+        raw = str(value).encode()
+        chunks.append(LENGTH.pack(len(raw)))
+        chunks.append(raw)
+    return b"".join(chunks)
+
+
+def pack_ids(kind: t.Union[str, Kind], values: t.Sequence[t.Any]) -> bytes:
+    """Serialize a batch of IDs of a single kind.
+
+    IDs are expected to be objects returned by a generator of the same kind
+    (for example `ObjectID` objects for the `objectid` kind).
+    """
+    kind = Kind(kind)
+    if len(values) > MAX_COUNT:
+        raise ValueError(f"Cannot pack more than {MAX_COUNT} IDs in a single batch")
+    header = HEADER.pack(KIND_TAGS[kind], len(values))
+    return header + pack_values(kind, values)
+
+
+def unpack_ids(
+    data: t.Union[bytes, bytearray, memoryview],
+) -> t.Tuple[Kind, t.List[t.Any]]:
+    """Deserialize a batch of IDs. Return a tuple holding IDs kind and IDs."""
+    data = bytes(data)
+    if len(data) < HEADER.size:
+        raise InvalidBatch("Batch is too short")
+    tag, count = HEADER.unpack_from(data)
+    kind = TAG_KINDS.get(tag)
+    if kind is None:
+        raise InvalidBatch(f"Invalid kind tag: {tag}")
+    return kind, unpack_values(kind, data, count, HEADER.size)
+
+
+def unpack_values(
+    kind: Kind, data: bytes, count: int, offset: int = 0
+) -> t.List[t.Any]:
+    """Unpack `count` IDs of a single kind packed by `pack_values()`.
+    IDs must fill `data` from `offset` to its end.
+    """
+    width = WIDTHS.get(kind)
+    if width is None:
+        strings = _unpack_strings(data, offset, count)
+        if kind == Kind.TYPEID:
+            return [TypeID.from_str(value) for value in strings]
+        return strings
+    end = offset + width * count
+    if len(data) != end:
+        raise InvalidBatch(f"Expected {count} IDs of {width} bytes")
+    if kind in INTEGER_KINDS:
+        return list(struct.unpack_from(f">{count}Q", data, offset))
+    chunks = [data[start : start + width] for start in range(offset, end, width)]
+    if kind == Kind.TRACE_ID:
+        return [int.from_bytes(chunk, "big") for chunk in chunks]
+    if kind == Kind.OBJECTID:
+        return [ObjectID(chunk) for chunk in chunks]
+    if kind == Kind.ULID:
+        return [ULID(chunk) for chunk in chunks]
+    if kind == Kind.KSUID:
+        return [KSUID(chunk) for chunk in chunks]
+    if kind == Kind.NUID:
+        return [bytearray(chunk) for chunk in chunks]
+    return [UUID(bytes=chunk) for chunk in chunks]
+
+
+def _unpack_strings(data: bytes, offset: int, count: int) -> t.List[str]:
+    values: t.List[str] = []
+    try:
+        for _ in range(count):
+            (length,) = LENGTH.unpack_from(data, offset)
+            offset += LENGTH.size
+            end = offset + length
+            if end > len(data):
+                raise InvalidBatch("Batch is too short")
+            values.append(data[offset:end].decode())
+            offset = end
+    except struct.error as exc:
+        raise InvalidBatch("Batch is too short") from exc
+    if offset != len(data):
+        raise InvalidBatch("Unexpected trailing bytes")
+    return values
+
+
+def msgpack_default(obj: t.Any) -> "msgpack.ExtType":
+    """msgpack `default` hook packing IDs as extension types holding raw bytes."""
+    import msgpack
+
+    if isinstance(obj, ObjectID):
+        return msgpack.ExtType(EXT_OBJECTID, obj.binary)
+    if isinstance(obj, ULID):
+        return msgpack.ExtType(EXT_ULID, obj.bytes)
+    if isinstance(obj, KSUID):
+        return msgpack.ExtType(EXT_KSUID, obj.bytes)
+    if isinstance(obj, UUID):
+        return msgpack.ExtType(EXT_UUID, obj.bytes)
+    raise TypeError(f"Cannot serialize {obj!r}")
+
+
+def msgpack_ext_hook(code: int, data: bytes) -> t.Any:
+    """msgpack `ext_hook` unpacking IDs packed by `msgpack_default`."""
+    if code == EXT_OBJECTID:
+        return ObjectID(data)
+    if code == EXT_ULID:
+        return ULID(data)
+    if code == EXT_KSUID:
+        return KSUID(data)
+    if code == EXT_UUID:
+        return UUID(bytes=data)
+    import msgpack
+
+    return msgpack.ExtType(code, data)
@@ -0,0 +1,294 @@
+"""Local ID allocation server.
+
+An [`IDServer`][genid.server.IDServer] runs a single ID generator behind an
+asyncio Unix domain socket or TCP server, so that several processes (possibly
+not written in Python) on the same host can share a generator, for example an
+incremental generator.
+
+The protocol is made of requests and responses sent back to back over a single
+connection:
+
+- A request is the number of IDs to lease, as an unsigned 32 bits big endian integer.
+- A response starts with a status (an unsigned byte, `0` on success and `1` on
+  error), followed by the length of the payload in bytes as an unsigned 32 bits big
+  endian integer. On success, the payload is a batch of IDs serialized by
+  [`pack_ids()`][genid.serialize.pack_ids]. On error, the payload is an UTF-8
+  error message.
+
+An [`IDClient`][genid.server.IDClient] leases blocks of IDs with a single
+round-trip, and leases the next block in a background thread before the current
+block is exhausted:
+
+```python
+from genid.server import IDClient
+
+with IDClient("/tmp/genid.sock", lease_size=1024) as client:
+    new_id = client.new()
+```
+
+A server can be started from the command line:
+
+```console
+python -m genid.server --kind incremental --unix /tmp/genid.sock
+```
+"""
+
+import argparse
+import asyncio
+import queue
+import socket
+import struct
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .generators import IDGenerator, Kind, generator
+from .serialize import pack_ids, unpack_ids
+
+REQUEST = struct.Struct(">I")
+RESPONSE = struct.Struct(">BI")
+STATUS_OK = 0
+STATUS_ERROR = 1
+MAX_LEASE = 65536
+
+Address = t.Union[str, t.Tuple[str, int]]
+
+
+class LeaseError(Exception):
+    """Raised when a server refuses to lease IDs."""
+
+
+class IDServer:
+    """Serve IDs generated by a single generator to local clients."""
+
+    def __init__(
+        self,
+        kind: t.Union[str, Kind],
+        gen: t.Optional[IDGenerator[t.Any]] = None,
+        max_lease: int = MAX_LEASE,
+    ) -> None:
+        self.kind = Kind(kind)
+        self.generator = gen if gen is not None else generator(self.kind)
+        self.max_lease = max_lease
+
+    def lease(self, count: int) -> t.Tuple[int, bytes]:
+        """Return a response status and payload for a request of `count` IDs."""
+        if not 0 < count <= self.max_lease:
+            message = f"Number of IDs must be between 1 and {self.max_lease}"
+            return STATUS_ERROR, message.encode()
+        try:
+            _, ids = self.generator.new_ids_at_index(count)
+            return STATUS_OK, pack_ids(self.kind, ids)
+        except Exception as exc:
+            return STATUS_ERROR, f"Failed to generate IDs: {exc}".encode()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests received on a connection until it is closed."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    request = await reader.readexactly(REQUEST.size)
+                except asyncio.IncompleteReadError:
+                    break
+                (count,) = REQUEST.unpack(request)
+                # IDs are generated in a worker thread, so that large leases do
+                # not block other connections
+                status, payload = await loop.run_in_executor(None, self.lease, count)
+                writer.write(RESPONSE.pack(status, len(payload)) + payload)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start_unix(self, path: str) -> asyncio.base_events.Server:
+        """Start serving on a Unix domain socket."""
+        return await asyncio.start_unix_server(self.handle, path)
+
+    async def start_tcp(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.base_events.Server:
+        """Start serving on a TCP socket. Use port 0 to pick a free port."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        read = sock.recv_into(view[received:])
+        if read == 0:
+            raise ConnectionResetError("Connection closed by server")
+        received += read
+    return bytes(buffer)
+
+
+class IDClient:
+    """Lease IDs from an [`IDServer`][genid.server.IDServer].
+
+    `address` is either the path of a Unix domain socket, or a `(host, port)` tuple.
+    IDs are leased by blocks of `lease_size` IDs. The next block is leased in
+    the background once less than `prefetch * lease_size` IDs remain in the current
+    block. Up to `pool_size` connections are kept open, and broken connections are
+    replaced transparently up to `retries` times per request.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        lease_size: int = 1024,
+        prefetch: float = 0.5,
+        pool_size: int = 4,
+        timeout: t.Optional[float] = 5.0,
+        retries: int = 3,
+    ) -> None:
+        if not 0 < lease_size <= MAX_LEASE:
+            raise ValueError(f"Lease size must be between 1 and {MAX_LEASE}")
+        self.address = address
+        self.lease_size = lease_size
+        self.low_watermark = int(lease_size * prefetch)
+        self.timeout = timeout
+        self.retries = retries
+        self._pool: "queue.LifoQueue[socket.socket]" = queue.LifoQueue(pool_size)
+        self._ids: t.Deque[t.Any] = deque()
+        self._lock = threading.Lock()
+        self._pending: t.Optional["Future[t.Tuple[Kind, t.List[t.Any]]]"] = None
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="genid-prefetch")
+
+    def _connect(self) -> socket.socket:
+        if isinstance(self.address, str):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _acquire(self) -> socket.socket:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, sock: socket.socket) -> None:
+        try:
+            self._pool.put_nowait(sock)
+        except queue.Full:
+            sock.close()
+
+    def _request(self, count: int) -> t.Tuple[int, bytes]:
+        sock = self._acquire()
+        try:
+            sock.sendall(REQUEST.pack(count))
+            status, length = RESPONSE.unpack(_recv_exactly(sock, RESPONSE.size))
+            payload = _recv_exactly(sock, length)
+        except BaseException:
+            sock.close()
+            raise
+        self._release(sock)
+        return status, payload
+
+    def lease(self, count: int) -> t.Tuple[Kind, t.List[t.Any]]:
+        """Lease `count` IDs with a single round-trip.
+        Return a tuple holding IDs kind and IDs.
+        """
+        attempt = 0
+        while True:
+            try:
+                status, payload = self._request(count)
+                break
+            except OSError:
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+        if status != STATUS_OK:
+            raise LeaseError(payload.decode())
+        return unpack_ids(payload)
+
+    def _take_pending(self) -> "Future[t.Tuple[Kind, t.List[t.Any]]]":
+        pending = self._pending
+        if pending is None:
+            pending = self._executor.submit(self.lease, self.lease_size)
+        self._pending = None
+        return pending
+
+    def new(self) -> t.Any:
+        """Return a new ID, leasing a new block of IDs when needed."""
+        with self._lock:
+            if not self._ids:
+                self._ids.extend(self._take_pending().result()[1])
+            value = self._ids.popleft()
+            if len(self._ids) <= self.low_watermark and self._pending is None:
+                self._pending = self._executor.submit(self.lease, self.lease_size)
+            return value
+
+    def new_many(self, count: int) -> t.List[t.Any]:
+        """Return `count` new IDs."""
+        with self._lock:
+            values: t.List[t.Any] = []
+            while len(values) < count:
+                if not self._ids:
+                    self._ids.extend(self._take_pending().result()[1])
+                take = min(count - len(values), len(self._ids))
+                values.extend(self._ids.popleft() for _ in range(take))
+            if len(self._ids) <= self.low_watermark and self._pending is None:
+                self._pending = self._executor.submit(self.lease, self.lease_size)
+            return values
+
+    def close(self) -> None:
+        """Stop prefetching and close all connections."""
+        self._executor.shutdown(wait=True)
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "IDClient":
+        return self
+
+    def __exit__(self, *_: t.Any) -> None:
+        self.close()
+
+
+async def serve(server: IDServer, address: Address) -> None:
+    """Serve IDs forever on the given address."""
+    if isinstance(address, str):
+        listener = await server.start_unix(address)
+    else:
+        listener = await server.start_tcp(*address)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        "genid.server", description="Serve IDs to local processes"
+    )
+    parser.add_argument(
+        "--kind", default="incremental", choices=[k.value for k in Kind]
+    )
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--unix", help="path of the Unix domain socket")
+    group.add_argument("--port", type=int, help="TCP port")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host")
+    args = parser.parse_args()
+    address: Address = args.unix if args.unix else (args.host, args.port)
+    try:
+        asyncio.run(serve(IDServer(args.kind), address))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
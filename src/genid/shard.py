@@ -0,0 +1,168 @@
+"""Shard routing computed directly from IDs.
+
+[`shard_of()`][genid.shard.shard_of] and [`shard_many()`][genid.shard.shard_many]
+compute a stable shard number from the string or binary form of IDs, without
+creating ID objects. Only the part of the ID which varies between IDs is used,
+so that time-based IDs generated at the same moment are spread over all shards:
+
+- `ulid` and `typeid`: the last 80 bits (randomness).
+- `ksuid`: the 128 bits payload.
+- `uuid1`: the `time_low` and `time_mid` fields (the clock sequence and node
+  fields are constant within a process).
+- `uuid4`: the last 64 bits.
+- `objectid`: the machine, process and counter bytes.
+- `incremental`, `timestamp` and `nstimestamp`: the integer value.
+- `traceid` and `spanid`: the last 64 bits.
+- other kinds: the whole string.
+
+The string and binary forms of an ID are always routed to the same shard. Keys are
+mixed using the splitmix64 finalizer, then mapped to a shard either by
+multiply-shift reduction (the default), or by jump consistent hashing when
+`consistent` is True, so that only `1/n` of the keys move when a shard is added.
+"""
+
+import typing as t
+
+from .codecs import BASE32
+from .generators import Kind
+from .ksuid import base62
+
+IDValue = t.Union[str, bytes, bytearray, memoryview, int]
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def mix64(key: int) -> int:
+    """Mix the bits of an integer into a well distributed 64 bits integer."""
+    while key > MASK64:
+        key = (key & MASK64) ^ (key >> 64)
+    key = (key ^ (key >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    key = (key ^ (key >> 27)) * 0x94D049BB133111EB & MASK64
+    return key ^ (key >> 31)
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Jump consistent hash of a 64 bits key into `buckets` buckets.
+
+    See "A Fast, Minimal Memory, Consistent Hash Algorithm" by Lamping and Veach.
+    """
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & MASK64
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def _binary(
+    value: t.Union[bytes, bytearray, memoryview, int],
+) -> t.Union[bytes, bytearray, memoryview]:
+    if isinstance(value, int):
+        raise TypeError(f"Expected str or bytes value, not {type(value)}")
+    return value
+
+
+def _ulid_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return BASE32.decode_int(value[-16:])
+    return int.from_bytes(_binary(value)[6:16], "big")
+
+
+def _ksuid_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return base62.decode_int(value) & ((1 << 128) - 1)
+    return int.from_bytes(_binary(value)[4:20], "big")
+
+
+def _uuid_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return int(value[-17:].replace("-", ""), 16)
+    return int.from_bytes(_binary(value)[8:16], "big")
+
+
+def _uuid1_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return int(value[:8] + value[9:13], 16)
+    return int.from_bytes(_binary(value)[0:6], "big")
+
+
+def _objectid_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return int(value[8:], 16)
+    return int.from_bytes(_binary(value)[4:12], "big")
+
+
+def _integer_key(value: IDValue) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value)
+    return int.from_bytes(value, "big")
+
+
+def _hex_key(value: IDValue) -> int:
+    # Lowest 64 bits, which are random for trace IDs and span IDs
+    if isinstance(value, int):
+        return value & MASK64
+    if isinstance(value, str):
+        return int(value[-16:], 16)
+    return int.from_bytes(_binary(value)[-8:], "big")
+
+
+def _string_key(value: IDValue) -> int:
+    if isinstance(value, str):
+        return int.from_bytes(value.encode(), "big")
+    return int.from_bytes(_binary(value), "big")
+
+
+KEYS: t.Dict[Kind, t.Callable[[IDValue], int]] = {
+    Kind.ULID: _ulid_key,
+    Kind.TYPEID: _ulid_key,
+    Kind.KSUID: _ksuid_key,
+    Kind.UUID1: _uuid1_key,
+    Kind.UUID4: _uuid_key,
+    Kind.OBJECTID: _objectid_key,
+    Kind.INCREMENTAL: _integer_key,
+    Kind.TIMESTAMP: _integer_key,
+    Kind.NSTIMESTAMP: _integer_key,
+    Kind.TRACE_ID: _hex_key,
+    Kind.SPAN_ID: _hex_key,
+}
+
+
+def shard_key(kind: t.Union[str, Kind], value: IDValue) -> int:
+    """Return the 64 bits key used to route an ID to a shard."""
+    return mix64(KEYS.get(Kind(kind), _string_key)(value))
+
+
+def shard_of(
+    kind: t.Union[str, Kind],
+    value: IDValue,
+    n_shards: int,
+    consistent: bool = False,
+) -> int:
+    """Return the shard number (between 0 and `n_shards - 1`) of an ID.
+
+    `value` can be the string or the binary form of an ID of the given kind.
+    """
+    if n_shards <= 0:
+        raise ValueError("Number of shards must be a positive integer")
+    key = shard_key(kind, value)
+    if consistent:
+        return jump_hash(key, n_shards)
+    return (key * n_shards) >> 64
+
+
+def shard_many(
+    kind: t.Union[str, Kind],
+    values: t.Iterable[IDValue],
+    n_shards: int,
+    consistent: bool = False,
+) -> t.List[int]:
+    """Return the shard numbers of several IDs of the same kind."""
+    if n_shards <= 0:
+        raise ValueError("Number of shards must be a positive integer")
+    get_key = KEYS.get(Kind(kind), _string_key)
+    if consistent:
+        return [jump_hash(mix64(get_key(value)), n_shards) for value in values]
+    return [(mix64(get_key(value)) * n_shards) >> 64 for value in values]
@@ -0,0 +1,236 @@
+"""SQLAlchemy column types storing IDs in binary form.
+
+IDs stored as text use 24 to 36 bytes per value, and so do their index entries.
+The column types of this module store IDs as fixed-width binary values instead
+(`BLOB` on SQLite, `BYTEA` on PostgreSQL, `BINARY(n)` on MySQL):
+
+- [`ULIDType`][genid.sqlalchemy.ULIDType]: 16 bytes.
+- [`UUIDType`][genid.sqlalchemy.UUIDType]: 16 bytes.
+- [`ObjectIDType`][genid.sqlalchemy.ObjectIDType]: 12 bytes.
+- [`KSUIDType`][genid.sqlalchemy.KSUIDType]: 20 bytes.
+
+Bound parameters can be ID objects, strings or bytes. Loaded values are ID
+objects wrapping the stored bytes: strings are only computed when IDs are
+formatted.
+
+```python
+import sqlalchemy as sa
+from genid.sqlalchemy import ULIDType
+
+metadata = sa.MetaData()
+events = sa.Table(
+    "events",
+    metadata,
+    sa.Column("id", ULIDType(), primary_key=True),
+    sa.Column("name", sa.String),
+)
+```
+
+[`bulk_insert()`][genid.sqlalchemy.bulk_insert] inserts rows by batches, using
+a new ID generated by a generator for each row.
+
+`sqlalchemy` (2.0 or later) is an optional dependency, which can be installed
+using the `sqlalchemy` extra.
+"""
+
+import abc
+import itertools
+import typing as t
+import uuid
+
+from sqlalchemy import LargeBinary, Table
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.types import BINARY, TypeDecorator, TypeEngine
+
+from .generators import (
+    IDGenerator,
+    KSUIDGenerator,
+    ObjectIDGenerator,
+    T,
+    ULIDGenerator,
+    UUID1Generator,
+    UUID4Generator,
+    WrappedIDGenerator,
+)
+from .ksuid import KSUID
+from .objectid import ObjectID
+from .ulid import ULID
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class _BinaryIDType(TypeDecorator[T], metaclass=abc.ABCMeta):
+    """Base class of ID types stored as `size` bytes."""
+
+    impl = LargeBinary
+    size: int
+    # Generators whose IDs can be written into columns of this type
+    generators: t.Tuple[t.Type[IDGenerator[t.Any]], ...]
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[t.Any]:
+        if dialect.name in ("mysql", "mariadb"):
+            return dialect.type_descriptor(BINARY(self.size))
+        return dialect.type_descriptor(LargeBinary(self.size))
+
+    @abc.abstractmethod
+    def dump(self, value: t.Any) -> bytes:
+        """Return the binary form of an ID object, string or bytes."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def load(self, value: bytes) -> T:
+        """Return the ID object of a binary value."""
+        raise NotImplementedError
+
+    def process_bind_param(self, value: t.Any, dialect: Dialect) -> t.Optional[bytes]:
+        if value is None:
+            return None
+        return self.dump(value)
+
+    def process_result_value(
+        self, value: t.Optional[bytes], dialect: Dialect
+    ) -> t.Optional[T]:
+        if value is None:
+            return None
+        # Some drivers (such as psycopg) return memoryviews
+        return self.load(value if type(value) is bytes else bytes(value))
+
+
+class ULIDType(_BinaryIDType[ULID]):
+    """ULIDs stored as 16 bytes. Binary order matches time order."""
+
+    size = 16
+    generators = (ULIDGenerator,)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> t.Type[ULID]:
+        return ULID
+
+    def dump(self, value: t.Union[ULID, str, bytes]) -> bytes:
+        if isinstance(value, ULID):
+            return value.bytes
+        if isinstance(value, str):
+            return ULID.from_str(value).bytes
+        return ULID(bytes(value)).bytes
+
+    def load(self, value: bytes) -> ULID:
+        return ULID(value)
+
+
+class UUIDType(_BinaryIDType[uuid.UUID]):
+    """UUIDs stored as 16 bytes."""
+
+    size = 16
+    generators = (UUID1Generator, UUID4Generator)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> t.Type[uuid.UUID]:
+        return uuid.UUID
+
+    def dump(self, value: t.Union[uuid.UUID, str, bytes]) -> bytes:
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        if isinstance(value, str):
+            return uuid.UUID(value).bytes
+        return uuid.UUID(bytes=bytes(value)).bytes
+
+    def load(self, value: bytes) -> uuid.UUID:
+        return uuid.UUID(bytes=value)
+
+
+class ObjectIDType(_BinaryIDType[ObjectID]):
+    """ObjectIDs stored as 12 bytes. Binary order matches time order."""
+
+    size = 12
+    generators = (ObjectIDGenerator,)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> t.Type[ObjectID]:
+        return ObjectID
+
+    def dump(self, value: t.Union[ObjectID, str, bytes]) -> bytes:
+        if isinstance(value, ObjectID):
+            return value.binary
+        return ObjectID(value if isinstance(value, str) else bytes(value)).binary
+
+    def load(self, value: bytes) -> ObjectID:
+        return ObjectID(value)
+
+
+class KSUIDType(_BinaryIDType[KSUID]):
+    """KSUIDs stored as 20 bytes. Binary order matches time order."""
+
+    size = 20
+    generators = (KSUIDGenerator,)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> t.Type[KSUID]:
+        return KSUID
+
+    def dump(self, value: t.Union[KSUID, str, bytes]) -> bytes:
+        if isinstance(value, KSUID):
+            return value.bytes
+        if isinstance(value, str):
+            return KSUID.from_str(value).bytes
+        return KSUID(bytes(value)).bytes
+
+    def load(self, value: bytes) -> KSUID:
+        return KSUID(value)
+
+
+def _new_ids(
+    gen: IDGenerator[t.Any], column_type: TypeEngine[t.Any], count: int
+) -> t.List[t.Any]:
+    """Generate `count` new IDs, in the form expected by the column."""
+    if not isinstance(column_type, _BinaryIDType):
+        return gen.new_many(count)
+    width = column_type.size
+    if gen.id_width != width:
+        raise ValueError(f"{type(gen).__name__} does not generate IDs of {width} bytes")
+    inner = gen
+    while isinstance(inner, WrappedIDGenerator):
+        inner = inner.generator
+    if not isinstance(inner, column_type.generators):
+        raise ValueError(
+            f"{type(inner).__name__} does not generate IDs of "
+            f"{type(column_type).__name__} columns"
+        )
+    buffer = bytearray(width * count)
+    gen.fill_into(buffer)
+    data = bytes(buffer)
+    return [data[offset : offset + width] for offset in range(0, len(data), width)]
+
+
+def bulk_insert(
+    connection: Connection,
+    table: Table,
+    rows: t.Iterable[t.Mapping[str, t.Any]],
+    generator: IDGenerator[t.Any],
+    column: str = "id",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Insert rows using a new ID for each row, and return the number of rows.
+
+    Rows are inserted by batches of `batch_size` rows, each batch using a single
+    `executemany()` call. IDs of a batch are generated at once: generators of
+    fixed-width IDs write binary IDs for columns using one of the types of this
+    module, and other columns receive IDs as strings.
+    """
+    if batch_size <= 0:
+        raise ValueError("Batch size must be a positive integer")
+    statement = table.insert()
+    column_type = table.c[column].type
+    iterator = iter(rows)
+    count = 0
+    while True:
+        batch = [dict(row) for row in itertools.islice(iterator, batch_size)]
+        if not batch:
+            return count
+        for row, _id in zip(batch, _new_ids(generator, column_type, len(batch))):
+            row[column] = _id
+        connection.execute(statement, batch)
+        count += len(batch)
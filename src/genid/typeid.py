@@ -0,0 +1,186 @@
+"""Type-safe, K-sortable, globally unique identifiers.
+
+See the [TypeID specification](https://github.com/jetify-com/typeid) for more details.
+
+A TypeID is made of a type prefix and of a UUIDv7 suffix encoded in lowercase
+Crockford base32, separated by an underscore:
+
+```text
+user_01h455vb4pex5vsknk084sn02q
+|--|  |------------------------|
+type    UUIDv7 encoded in base32
+```
+
+The suffix uses the same encoding as ULIDs, so TypeIDs of the same type are
+ordered by generation time, both in binary and string forms.
+"""
+
+import functools
+import os
+import re
+import time
+import typing as t
+import uuid
+
+from .codecs import BASE32_LOWER
+
+MAX_PREFIX_LEN = 63
+SUFFIX_LEN = 26
+BYTES_LEN = 16
+
+ALPHABET = BASE32_LOWER.alphabet
+
+PREFIX_PATTERN = r"[a-z](?:[a-z_]{0,61}[a-z])?"
+SUFFIX_PATTERN = r"[0-7][0-9a-hjkmnp-tv-z]{25}"
+# Prefix and suffix are validated together within a single match
+TYPEID_REGEX = re.compile(rf"(?:({PREFIX_PATTERN})_)?({SUFFIX_PATTERN})")
+PREFIX_REGEX = re.compile(PREFIX_PATTERN)
+
+
+class InvalidTypeID(ValueError):
+    """Raised when a string is not a valid TypeID."""
+
+
+def validate_prefix(prefix: str) -> str:
+    """Return prefix when it is a valid TypeID prefix, else raise a `ValueError`."""
+    if prefix and not PREFIX_REGEX.fullmatch(prefix):
+        raise ValueError(
+            f"Invalid TypeID prefix: {prefix!r}. A prefix must be at most "
+            f"{MAX_PREFIX_LEN} lowercase letters or underscores, "
+            "starting and ending with a letter"
+        )
+    return prefix
+
+
+def uuid7_bytes(milliseconds: int, random_bytes: bytes) -> bytes:
+    """Build a UUIDv7 from a unix timestamp in milliseconds and 10 random bytes."""
+    return bytes(
+        (
+            *milliseconds.to_bytes(6, "big"),
+            0x70 | random_bytes[0] & 0x0F,
+            random_bytes[1],
+            0x80 | random_bytes[2] & 0x3F,
+            *random_bytes[3:10],
+        )
+    )
+
+
+def encode_suffix(value: bytes) -> str:
+    """Encode 16 bytes as a 26 characters lowercase base32 string."""
+    return BASE32_LOWER.encode(value)
+
+
+def decode_suffix(suffix: str) -> bytes:
+    """Decode a 26 characters lowercase base32 string into 16 bytes.
+    Suffix is expected to be validated already.
+    """
+    return BASE32_LOWER.decode(suffix, BYTES_LEN)
+
+
+@functools.total_ordering
+class TypeID:
+    """The :class:`TypeID` object consists of a type prefix and of a 128 bits UUIDv7.
+
+    By default, a new TypeID is created with the current time and random bits:
+
+        >>> typeid = TypeID("user")
+        >>> str(typeid)
+        'user_01h455vb4pex5vsknk084sn02q'
+    """
+
+    __slots__ = ("prefix", "bytes")
+
+    def __init__(self, prefix: str = "", value: t.Optional[bytes] = None) -> None:
+        validate_prefix(prefix)
+        if value is None:
+            value = uuid7_bytes(time.time_ns() // 1_000_000, os.urandom(10))
+        elif len(value) != BYTES_LEN:
+            raise ValueError("TypeID has to be exactly 16 bytes long.")
+        self.prefix = prefix
+        self.bytes = value
+
+    @classmethod
+    def from_str(cls, value: str, prefix: t.Optional[str] = None) -> "TypeID":
+        """Create a new :class:`TypeID`-object from its string representation.
+
+        When `prefix` is provided, the prefix of the string must be equal to `prefix`.
+        """
+        match = TYPEID_REGEX.fullmatch(value)
+        if match is None:
+            raise InvalidTypeID(f"Invalid TypeID: {value!r}")
+        found, suffix = match.groups()
+        found = found or ""
+        if prefix is not None and found != prefix:
+            raise InvalidTypeID(f"Expected TypeID prefix {prefix!r}, got {found!r}")
+        typeid = cls.__new__(cls)
+        typeid.prefix = found
+        typeid.bytes = decode_suffix(suffix)
+        return typeid
+
+    parse = from_str
+
+    @classmethod
+    def from_uuid(cls, value: uuid.UUID, prefix: str = "") -> "TypeID":
+        """Create a new :class:`TypeID`-object from a :class:`uuid.UUID`."""
+        return cls(prefix, value.bytes)
+
+    @property
+    def suffix(self) -> str:
+        """The UUID encoded as a 26 characters lowercase base32 string."""
+        return encode_suffix(self.bytes)
+
+    @property
+    def uuid(self) -> uuid.UUID:
+        """The UUID part of the TypeID."""
+        return uuid.UUID(bytes=self.bytes)
+
+    @property
+    def milliseconds(self) -> int:
+        """The UUIDv7 timestamp as epoch time in milliseconds."""
+        return int.from_bytes(self.bytes[:6], "big")
+
+    def __str__(self) -> str:
+        if self.prefix:
+            return f"{self.prefix}_{encode_suffix(self.bytes)}"
+        return encode_suffix(self.bytes)
+
+    def __repr__(self) -> str:
+        return f"TypeID({str(self)!r})"
+
+    def __hash__(self) -> int:
+        return hash((self.prefix, self.bytes))
+
+    def __reduce__(self) -> t.Tuple[t.Type["TypeID"], t.Tuple[str, bytes]]:
+        return (TypeID, (self.prefix, self.bytes))
+
+    def __lt__(self, other: t.Any) -> bool:
+        if isinstance(other, TypeID):
+            return (self.prefix, self.bytes) < (other.prefix, other.bytes)
+        return NotImplemented
+
+    def __eq__(self, other: t.Any) -> bool:
+        if isinstance(other, TypeID):
+            return self.prefix == other.prefix and self.bytes == other.bytes
+        return NotImplemented
+
+
+def parse_many(values: t.Iterable[str], prefix: str) -> t.List[TypeID]:
+    """Parse several TypeIDs which must all have the given prefix."""
+    regex = re.compile(
+        rf"{re.escape(validate_prefix(prefix))}_({SUFFIX_PATTERN})"
+        if prefix
+        else f"({SUFFIX_PATTERN})"
+    )
+    match = regex.fullmatch
+    decode = decode_suffix
+    new = TypeID.__new__
+    typeids: t.List[TypeID] = []
+    for value in values:
+        found = match(value)
+        if found is None:
+            raise InvalidTypeID(f"Invalid TypeID with prefix {prefix!r}: {value!r}")
+        typeid = new(TypeID)
+        typeid.prefix = prefix
+        typeid.bytes = decode(found.group(1))
+        typeids.append(typeid)
+    return typeids
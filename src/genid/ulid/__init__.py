@@ -44,14 +44,42 @@ class ULID:
         '01E75PVKXA3GFABX1M1J9NZZNF'
     """
 
+    __slots__ = ("bytes",)
+
     def __init__(self, value: t.Optional[bytes] = None) -> None:
         if value is not None and len(value) != constants.BYTES_LEN:
             raise ValueError("ULID has to be exactly 16 bytes long.")
         if value:
             self.bytes = value
         else:
-            _id = ULID.from_timestamp(time.time())
-            self.bytes = _id.bytes
+            self.bytes = int.to_bytes(
+                time.time_ns() // constants.NANOSECS_IN_MILLISECS,
+                constants.TIMESTAMP_LEN,
+                "big",
+            ) + os.urandom(constants.RANDOMNESS_LEN)
+
+    @staticmethod
+    def generate_into(
+        buffer: t.Any,
+        offset: int = 0,
+        count: int = 1,
+        milliseconds: t.Optional[int] = None,
+        randbytes: t.Callable[[int], bytes] = os.urandom,
+    ) -> None:
+        """Write `count` new ULIDs (16 bytes each) into a writable buffer.
+
+        All ULIDs share the same timestamp part, which defaults to current time.
+        Random bytes are read using `randbytes` function.
+        No :class:`ULID`-object is created.
+        """
+        if milliseconds is None:
+            milliseconds = time.time_ns() // constants.NANOSECS_IN_MILLISECS
+        timestamp = int.to_bytes(milliseconds, constants.TIMESTAMP_LEN, "big")
+        view = memoryview(buffer).cast("B")
+        end = offset + constants.BYTES_LEN * count
+        view[offset:end] = randbytes(constants.BYTES_LEN * count)
+        for position in range(offset, end, constants.BYTES_LEN):
+            view[position : position + constants.TIMESTAMP_LEN] = timestamp
 
     @classmethod
     def from_datetime(cls, value: datetime) -> "ULID":
@@ -182,24 +210,21 @@ class ULID:
         """Encode this object as an integer."""
         return int.from_bytes(self.bytes, byteorder="big")
 
+    def __hash__(self) -> int:
+        return hash(self.bytes)
+
+    def __reduce__(self) -> t.Tuple[t.Type["ULID"], t.Tuple[bytes]]:
+        """Pickle this object as its 16 bytes."""
+        return (ULID, (self.bytes,))
+
+    # ULIDs are only compared to ULIDs, so that equal objects always have
+    # equal hashes. Use `str()`, `int()` or `.bytes` to compare other forms.
     def __lt__(self, other: t.Any) -> bool:
         if isinstance(other, ULID):
             return self.bytes < other.bytes
-        elif isinstance(other, int):
-            return int(self) < other
-        elif isinstance(other, bytes):
-            return self.bytes < other
-        elif isinstance(other, str):
-            return str(self) < other
         return NotImplemented
 
     def __eq__(self, other: t.Any) -> bool:
         if isinstance(other, ULID):
             return self.bytes == other.bytes
-        elif isinstance(other, int):
-            return int(self) == other
-        elif isinstance(other, bytes):
-            return self.bytes == other
-        elif isinstance(other, str):
-            return str(self) == other
         return NotImplemented
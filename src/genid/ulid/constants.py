@@ -1,4 +1,5 @@
 MILLISECS_IN_SECS = 1000
+NANOSECS_IN_MILLISECS = 1_000_000
 
 TIMESTAMP_LEN = 6
 RANDOMNESS_LEN = 10
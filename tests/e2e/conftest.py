@@ -15,10 +15,14 @@ from genid.generators import generator as _generator
         "uuid1",
         "uuid4",
         "ulid",
+        "ksuid",
+        "typeid",
         "incremental",
         "secret",
         "timestamp",
         "nstimestamp",
+        "traceid",
+        "spanid",
     ]
 )
 def generator(request: SubRequest) -> IDGenerator[t.Any]:
@@ -0,0 +1,106 @@
+"""Allocation budgets of ID generation.
+
+Budgets were measured on CPython 3.11 using `python benchmarks/bench_memory.py`.
+A test fails when generating an ID allocates more than its budget (with some
+headroom for measurement noise), so that allocations removed from hot paths are
+not silently reintroduced. Update budgets when allocations are reduced.
+
+Allocations differ between interpreter versions, so tests are skipped on other
+versions than the one budgets were measured on.
+"""
+
+import gc
+import sys
+import tracemalloc
+import typing as t
+
+import pytest
+
+from genid.generators import Kind, generator
+
+# Interpreter version budgets were measured on
+BUDGETS_VERSION = (3, 11)
+# Headroom applied to peak memory budgets
+TOLERANCE = 1.25
+
+pytestmark = pytest.mark.skipif(
+    sys.implementation.name != "cpython" or sys.version_info[:2] != BUDGETS_VERSION,
+    reason="Allocation budgets were measured on CPython 3.11",
+)
+
+# kind: (new() peak bytes, new_id_at_index() peak bytes, objects kept per ID)
+BUDGETS: t.Dict[Kind, t.Tuple[int, int, int]] = {
+    Kind.NANOID: (214, 214, 1),
+    Kind.NUID: (259, 259, 2),
+    Kind.OBJECTID: (267, 267, 2),
+    Kind.UUID1: (543, 325, 2),
+    Kind.UUID4: (543, 265, 2),
+    Kind.ULID: (233, 233, 2),
+    Kind.KSUID: (405, 245, 2),
+    Kind.TYPEID: (359, 359, 2),
+    Kind.INCREMENTAL: (149, 144, 1),
+    Kind.SECRET: (225, 225, 1),
+    Kind.TIMESTAMP: (176, 176, 1),
+    Kind.NSTIMESTAMP: (180, 180, 1),
+    Kind.TRACE_ID: (164, 144, 1),
+    Kind.SPAN_ID: (144, 144, 1),
+}
+
+
+@pytest.fixture(autouse=True)
+def no_tracing() -> None:
+    # Tracers such as coverage allocate memory on each function call
+    if sys.gettrace() is not None:
+        pytest.skip("Allocations cannot be measured while tracing")
+
+
+def peak_memory(func: t.Callable[[], t.Any], repeat: int = 20) -> int:
+    """Return the lowest peak of memory allocated by a single call to `func`."""
+    func()
+    peaks: t.List[int] = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        try:
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return min(peaks)
+
+
+def kept_objects(func: t.Callable[[], t.Any], number: int = 1000) -> float:
+    """Return the number of memory blocks kept alive by each result of `func`."""
+    results: t.List[t.Any] = [None] * number
+    func()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for idx in range(number):
+            results[idx] = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(exclude).compare_to(
+        before.filter_traces(exclude), "filename"
+    )
+    return sum(stat.count_diff for stat in stats) / number
+
+
+@pytest.mark.parametrize("kind", list(BUDGETS))
+def test_new_allocations(kind: Kind) -> None:
+    gen = generator(kind)
+    budget, _, _ = BUDGETS[kind]
+    assert peak_memory(gen.new) <= budget * TOLERANCE
+    # Only the returned string is kept
+    assert round(kept_objects(gen.new)) <= 1
+
+
+@pytest.mark.parametrize("kind", list(BUDGETS))
+def test_new_id_at_index_allocations(kind: Kind) -> None:
+    gen = generator(kind)
+    _, budget, objects = BUDGETS[kind]
+    assert peak_memory(gen.new_id_at_index) <= budget * TOLERANCE
+    # Tuple and index are kept in addition to ID objects
+    assert round(kept_objects(gen.new_id_at_index)) <= objects + 2
@@ -0,0 +1,165 @@
+import json
+import typing as t
+import uuid
+from pathlib import Path
+
+import pytest
+
+from genid.cli import main
+from genid.ulid import ULID
+
+
+def test_cli_text(tmp_path: Path) -> None:
+    output = tmp_path / "ids.txt"
+    assert (
+        main(["-k", "ulid", "-n", "1000", "-o", str(output), "--chunk-size", "64"]) == 0
+    )
+    lines = output.read_text().splitlines()
+    assert len(lines) == 1000
+    assert len(set(lines)) == 1000
+    assert all(str(ULID.from_str(line)) == line for line in lines)
+
+
+def test_cli_csv(tmp_path: Path) -> None:
+    output = tmp_path / "ids.csv"
+    main(
+        [
+            "-k",
+            "incremental",
+            "--offset",
+            "10",
+            "-n",
+            "3",
+            "-f",
+            "csv",
+            "-o",
+            str(output),
+        ]
+    )
+    assert output.read_text() == "index,id\n0,10\n1,11\n2,12\n"
+
+
+def test_cli_jsonl(tmp_path: Path) -> None:
+    output = tmp_path / "ids.jsonl"
+    main(
+        [
+            "-k",
+            "constant",
+            "--value",
+            'a"b',
+            "-n",
+            "2",
+            "-f",
+            "jsonl",
+            "-o",
+            str(output),
+        ]
+    )
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert lines == [{"index": 0, "id": 'a"b'}, {"index": 1, "id": 'a"b'}]
+
+
+def test_cli_binary(tmp_path: Path) -> None:
+    output = tmp_path / "ids.bin"
+    main(["-k", "uuid4", "-n", "100", "-f", "binary", "-o", str(output)])
+    data = output.read_bytes()
+    assert len(data) == 1600
+    assert all(
+        uuid.UUID(bytes=data[i : i + 16]).version == 4 for i in range(0, 1600, 16)
+    )
+
+
+@pytest.mark.parametrize("kind, width", [("nuid", 22), ("incremental", 8)])
+def test_cli_binary_chunks(tmp_path: Path, kind: str, width: int) -> None:
+    output = tmp_path / "ids.bin"
+    main(
+        [
+            "-k",
+            kind,
+            "-n",
+            "100",
+            "-f",
+            "binary",
+            "--chunk-size",
+            "7",
+            "-o",
+            str(output),
+        ]
+    )
+    data = output.read_bytes()
+    assert len(data) == 100 * width
+    assert len({data[i : i + width] for i in range(0, len(data), width)}) == 100
+    if kind == "incremental":
+        assert data[-width:] == (99).to_bytes(8, "big")
+
+
+def test_cli_stdout(capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    main(["-k", "nanoid", "--size", "8", "-n", "5", "-q"])
+    captured = capsysbinary.readouterr()
+    assert len(captured.out.splitlines()) == 5
+    assert all(len(line) == 8 for line in captured.out.splitlines())
+    assert captured.err == b""
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-k", "uuid4", "--size", "3"],
+        ["-k", "typeid", "--prefix", "BAD"],
+    ],
+)
+def test_cli_invalid_options(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, argv: t.List[str]
+) -> None:
+    with pytest.raises(SystemExit):
+        main([*argv, "-o", str(tmp_path / "ids")])
+    assert "invalid options for kind" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv, error",
+    [
+        (["-k", "nanoid", "--size", "0"], "size must be a positive integer"),
+        (["-k", "nanoid", "-f", "binary", "--size", "0"], "size must be"),
+        (["-k", "nanoid", "--alphabet", ""], "alphabet must not be empty"),
+        (["-k", "secret", "--length", "0"], "length must be a positive integer"),
+        (["-k", "incremental", "--offset", "-1"], "offset must be a non-negative"),
+        (
+            ["-k", "incremental", "-f", "binary", "--offset", str(2**64 - 1)],
+            "offset is too large",
+        ),
+        (
+            ["-k", "constant", "-f", "binary", "--value", ""],
+            "value must not be empty in binary format",
+        ),
+    ],
+)
+def test_cli_invalid_option_values(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, argv: t.List[str], error: str
+) -> None:
+    with pytest.raises(SystemExit):
+        main([*argv, "-n", "2", "-o", str(tmp_path / "ids")])
+    assert error in capsys.readouterr().err
+    assert not (tmp_path / "ids").exists()
+
+
+def test_cli_largest_binary_offset(tmp_path: Path) -> None:
+    output = tmp_path / "ids.bin"
+    argv = ["-k", "incremental", "-f", "binary", "--offset", str(2**64 - 2)]
+    assert main([*argv, "-n", "2", "-q", "-o", str(output)]) == 0
+    assert output.read_bytes() == bytes.fromhex("ff" * 7 + "fe" + "ff" * 8)
+
+
+def test_cli_missing_required_option(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit):
+        main(["-k", "constant"])
+    assert "option --value is required for kind constant" in capsys.readouterr().err
+
+
+def test_cli_seed(tmp_path: Path) -> None:
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    for output in (first, second):
+        assert main(["-k", "uuid4", "-n", "100", "--seed", "1", "-o", str(output)]) == 0
+    assert first.read_text() == second.read_text()
+    with pytest.raises(SystemExit):
+        main(["-k", "incremental", "--seed", "1"])
@@ -7,3 +7,22 @@ def test_counter(generator: IDGenerator[t.Any]) -> None:
     for i in range(10000):
         idx, _ = generator.new_at_index()
         assert i == idx
+
+
+def test_batch_counter(generator: IDGenerator[t.Any]) -> None:
+    generator.new()
+    index, ids = generator.new_ids_at_index(100)
+    assert index == 1
+    assert len(ids) == 100
+    assert generator.count() == 101
+    strings = generator.new_many(10)
+    assert len(strings) == 10
+    assert all(isinstance(value, str) for value in strings)
+    assert generator.new_at_index()[0] == 111
+
+
+def test_batch_bytes(generator: IDGenerator[t.Any]) -> None:
+    _, ids = generator.new_ids_at_index(10)
+    assert generator.ids_to_bytes(ids) == b"".join(
+        generator.id_to_bytes(value) for value in ids
+    )
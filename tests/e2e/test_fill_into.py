@@ -0,0 +1,121 @@
+import mmap
+import typing as t
+from uuid import UUID
+
+import pytest
+
+from genid.generators import (
+    ConstantIDGenerator,
+    IDGenerator,
+    IncrementalIDGenerator,
+    KSUIDGenerator,
+    NanoIDGenerator,
+    NUIDGenerator,
+    ObjectIDGenerator,
+    UUID4Generator,
+)
+from genid.ksuid import KSUID
+from genid.objectid import ObjectID
+
+
+def test_fill_into(generator: IDGenerator[t.Any]) -> None:
+    width = generator.id_width
+    assert width is not None
+    buffer = bytearray(width * 12)
+    assert generator.fill_into(buffer, 10, offset=width) == 10
+    assert generator.count() == 10
+    assert buffer[:width] == bytes(width)
+    assert buffer[11 * width :] == bytes(width)
+    assert any(buffer[width : 11 * width])
+
+
+def test_fill_into_whole_buffer() -> None:
+    generator = IncrementalIDGenerator(offset=1)
+    buffer = bytearray(8 * 4 + 3)
+    assert generator.fill_into(buffer) == 4
+    assert [int.from_bytes(buffer[i : i + 8], "big") for i in range(0, 32, 8)] == [
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert generator.new() == "5"
+
+
+def test_fill_into_mmap() -> None:
+    generator = ObjectIDGenerator()
+    with mmap.mmap(-1, 12 * 100) as buffer:
+        assert generator.fill_into(buffer) == 100
+        ids = [ObjectID(bytes(buffer[i : i + 12])) for i in range(0, 1200, 12)]
+    assert len(set(ids)) == 100
+    assert ids == sorted(ids)
+
+
+def test_fill_into_uuid4() -> None:
+    buffer = bytearray(16 * 100)
+    UUID4Generator().fill_into(buffer)
+    uuids = [UUID(bytes=bytes(buffer[i : i + 16])) for i in range(0, 1600, 16)]
+    assert all(value.version == 4 for value in uuids)
+    assert all(value.variant == "specified in RFC 4122" for value in uuids)
+    assert len(set(uuids)) == 100
+
+
+def test_fill_into_ksuid() -> None:
+    buffer = bytearray(20 * 10)
+    KSUIDGenerator().fill_into(buffer)
+    ksuids = [KSUID(bytes(buffer[i : i + 20])) for i in range(0, 200, 20)]
+    assert len({value.timestamp for value in ksuids}) == 1
+    assert len(set(ksuids)) == 10
+
+
+def test_fill_into_nuid() -> None:
+    generator = NUIDGenerator()
+    buffer = bytearray(22 * 100)
+    generator.fill_into(buffer)
+    nuids = [buffer[i : i + 22].decode() for i in range(0, 2200, 22)]
+    assert len(set(nuids)) == 100
+    assert len({value[:12] for value in nuids}) == 1
+    # Sequences written into buffers follow the sequences returned by new()
+    following = generator.new()
+    assert following[:12] == nuids[0][:12]
+    assert following > nuids[-1]
+
+
+@pytest.mark.parametrize("alphabet", ["0123456789abcdef", "0123456789"])
+def test_fill_into_nanoid(alphabet: str) -> None:
+    buffer = bytearray(8 * 1000)
+    NanoIDGenerator(alphabet=alphabet, size=8).fill_into(buffer)
+    assert set(buffer.decode()) == set(alphabet)
+
+
+def test_fill_into_not_fixed_width() -> None:
+    generator = NanoIDGenerator(alphabet="àbc")
+    assert generator.id_width is None
+    with pytest.raises(TypeError):
+        generator.fill_into(bytearray(100))
+
+
+@pytest.mark.parametrize(
+    "generator", [NanoIDGenerator(size=0), ConstantIDGenerator("")]
+)
+def test_fill_into_empty_ids(generator: IDGenerator[t.Any]) -> None:
+    assert generator.id_width == 0
+    with pytest.raises(ValueError):
+        generator.fill_into(bytearray(8))
+    with pytest.raises(ValueError):
+        generator.fill_into(bytearray(8), 1)
+    assert generator.count() == 0
+
+
+def test_fill_into_readonly() -> None:
+    with pytest.raises(TypeError):
+        IncrementalIDGenerator().fill_into(bytes(8))
+
+
+def test_fill_into_too_small() -> None:
+    generator = IncrementalIDGenerator()
+    with pytest.raises(ValueError):
+        generator.fill_into(bytearray(15), 2)
+    with pytest.raises(ValueError):
+        generator.fill_into(bytearray(16), 2, offset=1)
+    assert generator.count() == 0
@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import typing as t
+
+import pytest
+
+from genid.generators import Kind, generator
+
+PROCESSES = 4
+COUNT = 1000
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="fork is not available on this platform"
+)
+
+UNIQUE_KINDS = [
+    Kind.NANOID,
+    Kind.NUID,
+    Kind.OBJECTID,
+    Kind.UUID1,
+    Kind.UUID4,
+    Kind.ULID,
+    Kind.KSUID,
+    Kind.TYPEID,
+    Kind.SECRET,
+    Kind.TRACE_ID,
+    Kind.SPAN_ID,
+]
+
+
+def generate_in_children(func: t.Callable[[], t.List[str]]) -> t.List[str]:
+    # Children inherit the state of `func` from the parent process
+    context = multiprocessing.get_context("fork")
+    results: "multiprocessing.Queue[t.List[str]]" = context.Queue()
+    processes = [
+        context.Process(target=lambda: results.put(func())) for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    values = [value for _ in processes for value in results.get(timeout=30)]
+    for process in processes:
+        process.join()
+    return values
+
+
+@pytest.mark.parametrize("kind", UNIQUE_KINDS)
+def test_ids_are_unique_across_forked_processes(kind: Kind) -> None:
+    gen = generator(kind)
+    # Initialize generator state before forking
+    values = gen.new_many(COUNT)
+    values.extend(generate_in_children(lambda: gen.new_many(COUNT)))
+    values.extend(gen.new_many(COUNT))
+    assert len(set(values)) == (PROCESSES + 2) * COUNT
+
+
+@pytest.mark.parametrize("kind", [Kind.NUID, Kind.OBJECTID, Kind.UUID4])
+def test_fill_into_is_unique_across_forked_processes(kind: Kind) -> None:
+    gen = generator(kind)
+    width = t.cast(int, gen.id_width)
+    gen.new()
+
+    def fill() -> t.List[str]:
+        buffer = bytearray(width * COUNT)
+        gen.fill_into(buffer)
+        return [buffer[i : i + width].hex() for i in range(0, len(buffer), width)]
+
+    values = fill() + generate_in_children(fill)
+    assert len(set(values)) == (PROCESSES + 1) * COUNT
+
+
+@pytest.mark.parametrize("kind", [Kind.TRACE_ID, Kind.SPAN_ID])
+def test_pooled_ids_are_unique_across_forked_processes(kind: Kind) -> None:
+    gen = generator(kind)
+    # Fill the pool of random IDs before forking
+    values = [gen.new()]
+    values.extend(generate_in_children(lambda: [gen.new() for _ in range(COUNT)]))
+    values.extend(gen.new() for _ in range(COUNT))
+    assert len(set(values)) == (PROCESSES + 1) * COUNT + 1
@@ -0,0 +1,107 @@
+import multiprocessing
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from genid.generators import IncrementalIDGenerator
+from genid.hilo import BlockAllocator, InvalidStateFile
+
+
+def test_incremental_generator() -> None:
+    gen = IncrementalIDGenerator(offset=5, bound=7)
+    assert [gen.new() for _ in range(4)] == ["5", "6", "0", "1"]
+
+
+def test_persistent_generator_resumes_after_last_block(tmp_path: Path) -> None:
+    state = tmp_path / "state"
+    gen = IncrementalIDGenerator(offset=10, state_file=state, block_size=5)
+    assert [gen.unsafe_create_id() for _ in range(7)] == list(range(10, 17))
+    gen.close()
+    gen = IncrementalIDGenerator(offset=10, state_file=state, block_size=5)
+    assert gen.unsafe_create_id() == 20
+    gen.close()
+
+
+def test_persistent_generator_revert_within_block(tmp_path: Path) -> None:
+    gen = IncrementalIDGenerator(state_file=tmp_path / "state", block_size=2)
+    assert gen.new_at_index(0) == (0, "0")
+    with pytest.raises(IndexError):
+        gen.new_at_index(0)
+    assert gen.new_at_index(1) == (1, "1")
+    assert gen.new_at_index(2) == (2, "2")
+    gen.close()
+
+
+def test_persistent_generator_bound(tmp_path: Path) -> None:
+    gen = IncrementalIDGenerator(state_file=tmp_path / "state", block_size=2, bound=3)
+    assert [gen.unsafe_create_id() for _ in range(5)] == [0, 1, 2, 0, 1]
+    gen.close()
+
+
+def test_generators_sharing_state_file_take_disjoint_blocks(tmp_path: Path) -> None:
+    state = tmp_path / "state"
+    first = IncrementalIDGenerator(state_file=state, block_size=3)
+    second = IncrementalIDGenerator(state_file=state, block_size=3)
+    values = []
+    for _ in range(10):
+        values.append(first.unsafe_create_id())
+        values.append(second.unsafe_create_id())
+    assert len(set(values)) == 20
+    first.close()
+    second.close()
+
+
+def _reserve_blocks(path: str) -> t.List[int]:
+    gen = IncrementalIDGenerator(state_file=path, block_size=10)
+    values = [gen.unsafe_create_id() for _ in range(1000)]
+    gen.close()
+    return values
+
+
+def test_processes_sharing_state_file_take_disjoint_blocks(tmp_path: Path) -> None:
+    path = str(tmp_path / "state")
+    with multiprocessing.Pool(4) as pool:
+        results = pool.map(_reserve_blocks, [path] * 4)
+    values = [value for result in results for value in result]
+    assert len(set(values)) == 4000
+    allocator = BlockAllocator(path)
+    assert allocator.high_water_mark == 4000
+    allocator.close()
+
+
+def test_invalid_state_file(tmp_path: Path) -> None:
+    state = tmp_path / "state"
+    state.write_bytes(b"not a valid state file")
+    with pytest.raises(InvalidStateFile):
+        BlockAllocator(state)
+
+
+def test_incremental_generator_with_key() -> None:
+    gen = IncrementalIDGenerator(key=b"secret", bits=32)
+    values = [gen.unsafe_create_id() for _ in range(10)] + gen.unsafe_create_ids(90)
+    assert len(set(values)) == 100
+    assert values != sorted(values)
+    assert gen.permutation is not None
+    assert gen.permutation.decode_many(values) == list(range(100))
+    assert all(value < 2**32 for value in values)
+
+
+def test_incremental_generator_with_key_and_bound() -> None:
+    gen = IncrementalIDGenerator(offset=3, bound=50, key="secret")
+    _, values = gen.new_ids_at_index(100)
+    assert sorted(values[:50]) == list(range(50))
+    assert values[50:] == values[:50]
+
+
+def test_incremental_generator_with_key_is_exhausted() -> None:
+    gen = IncrementalIDGenerator(key="secret", bits=4)
+    _, values = gen.new_ids_at_index(15)
+    with pytest.raises(ValueError, match="Counter exhausted for bits=4"):
+        gen.new_ids_at_index(2)
+    values.append(gen.new_id_at_index()[1])
+    assert sorted(values) == list(range(16))
+    for create in (gen.new, lambda: gen.new_many(1)):
+        with pytest.raises(ValueError, match="Counter exhausted for bits=4"):
+            create()
+    assert gen.count() == 16
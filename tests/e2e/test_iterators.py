@@ -0,0 +1,50 @@
+import itertools
+import typing as t
+
+import pytest
+
+from genid.generators import IDGenerator, IncrementalIDGenerator
+
+
+def test_iter_chunks(generator: IDGenerator[t.Any]) -> None:
+    chunks = generator.iter_chunks(100)
+    index, first = next(chunks)
+    assert index == 0
+    assert len(first) == 100
+    index, second = next(chunks)
+    assert index == 100
+    assert len(second) == 100
+    assert generator.count() == 200
+
+
+def test_iter_ids_is_lazy() -> None:
+    generator = IncrementalIDGenerator()
+    records = ["a", "b", "c"]
+    assert list(zip(records, generator.iter_ids(chunk_size=2))) == [
+        ("a", "0"),
+        ("b", "1"),
+        ("c", "2"),
+    ]
+    # Only two chunks were generated, and the unused ID was reverted
+    assert generator.count() == 3
+    assert generator.new() == "3"
+
+
+def test_iter_ids_islice() -> None:
+    generator = IncrementalIDGenerator()
+    assert list(itertools.islice(generator.iter_ids(), 5)) == ["0", "1", "2", "3", "4"]
+    assert generator.new() == "5"
+
+
+def test_iter_ids_does_not_revert_other_ids() -> None:
+    generator = IncrementalIDGenerator()
+    ids = generator.iter_ids(chunk_size=10)
+    assert next(ids) == "0"
+    assert generator.new() == "10"
+    ids.close()
+    assert generator.new() == "11"
+
+
+def test_iter_chunks_invalid_size() -> None:
+    with pytest.raises(ValueError):
+        next(IncrementalIDGenerator().iter_chunks(0))
@@ -0,0 +1,62 @@
+import typing as t
+
+from genid.generators import ConstantIDGenerator, IncrementalIDGenerator, generator
+from genid.monitor import BloomFilter, MonitoredIDGenerator, RotatingBloomFilter
+
+
+def test_bloom_filter_add() -> None:
+    bloom = BloomFilter(1000, 1e-6)
+    assert bloom.add(b"a") is False
+    assert bloom.add(b"a") is True
+    assert b"a" in bloom
+    assert b"b" not in bloom
+    assert len(bloom) == 1
+    bloom.clear()
+    assert b"a" not in bloom
+
+
+def test_rotating_bloom_filter_forgets_old_generations() -> None:
+    bloom = RotatingBloomFilter(10, 1e-6)
+    for i in range(10):
+        bloom.add(str(i).encode())
+    # First rotation keeps previous values
+    bloom.add(b"10")
+    assert b"0" in bloom
+    for i in range(11, 21):
+        bloom.add(str(i).encode())
+    assert bloom.rotations == 2
+    assert b"0" not in bloom
+    assert b"20" in bloom
+
+
+def test_monitor_does_not_report_unique_ids() -> None:
+    gen = MonitoredIDGenerator(generator("nanoid"), capacity=10_000)
+    ids = {gen.new() for _ in range(5000)}
+    assert len(ids) == 5000
+    assert gen.suspected_collisions() == 0
+    assert gen.count() == 5000
+
+
+def test_monitor_counts_collisions() -> None:
+    collisions: t.List[str] = []
+    gen = MonitoredIDGenerator(
+        ConstantIDGenerator("test"), capacity=100, on_collision=collisions.append
+    )
+    assert [gen.new() for _ in range(3)] == ["test"] * 3
+    assert gen.suspected_collisions() == 2
+    assert collisions == ["test", "test"]
+
+
+def test_monitor_regenerate_on_collision() -> None:
+    inner = IncrementalIDGenerator(bound=3)
+    gen = MonitoredIDGenerator(inner, capacity=100, regenerate=True, max_attempts=5)
+    assert [gen.new() for _ in range(3)] == ["0", "1", "2"]
+    # Bounded generator wraps around, values 0, 1 and 2 are all rejected
+    # until max attempts is reached
+    assert gen.new() == "1"
+    assert gen.suspected_collisions() == 5
+
+
+def test_monitor_nuid_string_conversion() -> None:
+    gen = MonitoredIDGenerator(generator("nuid"))
+    assert len(gen.new()) == 22
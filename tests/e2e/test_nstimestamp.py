@@ -0,0 +1,65 @@
+import threading
+import typing as t
+
+import pytest
+
+from genid.clock import VirtualClock
+from genid.generators import NanosecondTimestampGenerator
+
+NOW_NS = 1678060800_000000000
+
+
+def test_monotonic_values_when_clock_stalls() -> None:
+    gen = NanosecondTimestampGenerator(clock=VirtualClock(NOW_NS), monotonic=True)
+    values = [gen.unsafe_create_id() for _ in range(3)]
+    assert values == [NOW_NS, NOW_NS + 1, NOW_NS + 2]
+
+
+def test_monotonic_values_when_clock_goes_backward() -> None:
+    clock = VirtualClock(NOW_NS)
+    gen = NanosecondTimestampGenerator(clock=clock, monotonic=True)
+    assert gen.unsafe_create_id() == NOW_NS
+    clock.advance(-1_000_000)
+    assert gen.unsafe_create_id() == NOW_NS + 1
+    clock.set(NOW_NS + 1000 + 17)
+    # Logical bits of physical time are ignored
+    assert gen.unsafe_create_id() == NOW_NS + 1000 + 17 - (1000 + 17) % 256
+
+
+def test_monotonic_revert() -> None:
+    gen = NanosecondTimestampGenerator(clock=VirtualClock(NOW_NS), monotonic=True)
+    assert gen.new_at_index(0) == (0, str(NOW_NS))
+    with pytest.raises(IndexError):
+        gen.new_at_index(0)
+    assert gen.new_at_index(1) == (1, str(NOW_NS + 1))
+
+
+def test_reserve() -> None:
+    clock = VirtualClock(NOW_NS)
+    gen = NanosecondTimestampGenerator(clock=clock, monotonic=True)
+    gen.new()
+    index, values = gen.reserve(10)
+    assert index == 1
+    assert values == range(NOW_NS + 1, NOW_NS + 11)
+    assert gen.count() == 11
+    assert gen.unsafe_create_id() == NOW_NS + 11
+    with pytest.raises(ValueError):
+        NanosecondTimestampGenerator().reserve(10)
+
+
+def test_monotonic_values_across_threads() -> None:
+    gen = NanosecondTimestampGenerator(monotonic=True)
+    results: t.List[t.List[int]] = [[] for _ in range(4)]
+
+    def target(values: t.List[int]) -> None:
+        for _ in range(5000):
+            values.append(int(gen.new()))
+
+    threads = [threading.Thread(target=target, args=(values,)) for values in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for values in results:
+        assert values == sorted(values)
+    assert len({value for values in results for value in values}) == 20000
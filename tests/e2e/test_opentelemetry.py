@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk.trace")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.trace import format_span_id, format_trace_id  # noqa: E402
+
+from genid.opentelemetry import OpenTelemetryIdGenerator  # noqa: E402
+
+
+def test_tracer_provider_uses_generator() -> None:
+    id_generator = OpenTelemetryIdGenerator(pool_size=8)
+    tracer = TracerProvider(id_generator=id_generator).get_tracer(__name__)
+    with tracer.start_as_current_span("parent") as parent:
+        with tracer.start_as_current_span("child") as child:
+            pass
+    parent_context, child_context = parent.get_span_context(), child.get_span_context()
+    assert parent_context.is_valid and child_context.is_valid
+    assert parent_context.trace_id == child_context.trace_id
+    assert parent_context.span_id != child_context.span_id
+    assert len(format_trace_id(parent_context.trace_id)) == 32
+    assert len(format_span_id(child_context.span_id)) == 16
+    assert id_generator.is_trace_id_random()
+
+
+def test_generator_ids_are_unique_and_valid() -> None:
+    id_generator = OpenTelemetryIdGenerator(pool_size=16)
+    trace_ids = [id_generator.generate_trace_id() for _ in range(1000)]
+    span_ids = [id_generator.generate_span_id() for _ in range(1000)]
+    assert len(set(trace_ids)) == len(set(span_ids)) == 1000
+    assert all(0 < value < 1 << 128 for value in trace_ids)
+    assert all(0 < value < 1 << 64 for value in span_ids)
+
+
+def test_seeded_generator_is_reproducible() -> None:
+    first, second = OpenTelemetryIdGenerator(rng=1), OpenTelemetryIdGenerator(rng=1)
+    assert first.generate_trace_id() == second.generate_trace_id()
+    assert first.generate_span_id() == second.generate_span_id()
+    # Trace IDs and span IDs do not reuse the same random bytes
+    assert first.generate_trace_id() & (1 << 64) - 1 != first.generate_span_id()
@@ -0,0 +1,131 @@
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from genid.clock import VirtualClock
+from genid.generators import generator
+from genid.registry import (
+    LOG_RECORD,
+    IDRegistry,
+    InvalidIndex,
+    RegisteredIDGenerator,
+    RegistryLocked,
+)
+
+DAY_NS = 24 * 3600 * 10**9
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "issued"
+
+
+def test_registry_membership(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        registry.add("first")
+        registry.add_many(["second", b"third"])
+        assert "first" in registry
+        assert b"second" in registry
+        assert "third" in registry
+        assert "fourth" not in registry
+        assert len(registry) == 3
+
+
+def test_registry_survives_restart(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        registry.add_many(str(value) for value in range(1000))
+    with IDRegistry(path) as registry:
+        assert len(registry) == 1000
+        assert all(str(value) in registry for value in range(1000))
+        assert "1000" not in registry
+
+
+def test_registry_grows_index(path: Path) -> None:
+    with IDRegistry(path, slots=8) as registry:
+        registry.add_many(str(value) for value in range(100))
+        assert all(str(value) in registry for value in range(100))
+        assert registry._index.slots >= 128
+
+
+def test_registry_rebuilds_missing_index(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        registry.add_many(["a", "b"])
+    Path(f"{path}.index").unlink()
+    with IDRegistry(path) as registry:
+        assert "a" in registry
+        assert "b" in registry
+        assert "c" not in registry
+
+
+def test_registry_invalid_index(path: Path) -> None:
+    Path(f"{path}.index").write_bytes(b"\0" * 128)
+    with pytest.raises(InvalidIndex):
+        IDRegistry(path)
+    # The lock is released when the registry fails to open
+    Path(f"{path}.index").unlink()
+    IDRegistry(path).close()
+
+
+def test_registry_writes_log_before_index(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        registry.add("first")
+        registry.add_many(["second", "third"])
+        data = path.read_bytes()
+        assert len(data) == 3 * LOG_RECORD.size + len("firstsecondthird")
+        assert data.endswith(b"third")
+
+
+def test_registry_is_locked(path: Path) -> None:
+    with IDRegistry(path):
+        with pytest.raises(RegistryLocked):
+            IDRegistry(path)
+    with IDRegistry(path) as registry:
+        registry.add("first")
+
+
+def test_registry_invalid_slots(path: Path) -> None:
+    with pytest.raises(ValueError):
+        IDRegistry(path, slots=100)
+
+
+def test_registry_expiry_and_compaction(path: Path) -> None:
+    clock = VirtualClock(start=100 * DAY_NS)
+    with IDRegistry(path, max_age=2 * 24 * 3600, clock=clock) as registry:
+        registry.add("old")
+        clock.advance(DAY_NS)
+        registry.add("recent")
+        assert registry.issued_at("old") == 100 * DAY_NS // 10**6
+        clock.advance(DAY_NS + 10**6)
+        assert "old" not in registry
+        assert "recent" in registry
+        assert registry.compact() == 1
+        assert len(registry) == 1
+        assert "recent" in registry
+        registry.add("new")
+    size = path.stat().st_size
+    with IDRegistry(path, clock=clock) as registry:
+        assert "old" not in registry
+        assert "recent" in registry
+        assert "new" in registry
+    assert size == path.stat().st_size
+
+
+def test_registered_generator(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        gen = RegisteredIDGenerator(generator("secret"), registry)
+        tokens = [gen.new(), *gen.new_many(10)]
+        assert all(gen.is_issued(token) for token in tokens)
+        assert not gen.is_issued(generator("secret").new())
+        assert len(registry) == 11
+        assert gen.id_width == 32
+
+
+def test_registered_generator_fill_into(path: Path) -> None:
+    with IDRegistry(path) as registry:
+        gen: RegisteredIDGenerator[t.Any] = RegisteredIDGenerator(
+            generator("nanoid"), registry
+        )
+        buffer = bytearray(21 * 3)
+        assert gen.fill_into(buffer) == 3
+        assert all(bytes(buffer[i : i + 21]) in registry for i in range(0, 63, 21))
@@ -0,0 +1,158 @@
+import multiprocessing
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+from genid.generators import Kind, generator
+from genid.objectid import ObjectID
+from genid.reservoir import Reservoir, ReservoirEmpty
+from genid.ulid import ULID
+
+KINDS = [
+    Kind.NANOID,
+    Kind.NUID,
+    Kind.OBJECTID,
+    Kind.UUID1,
+    Kind.UUID4,
+    Kind.ULID,
+    Kind.KSUID,
+    Kind.TYPEID,
+    Kind.INCREMENTAL,
+    Kind.SECRET,
+    Kind.TIMESTAMP,
+    Kind.NSTIMESTAMP,
+    Kind.TRACE_ID,
+    Kind.SPAN_ID,
+]
+
+
+@pytest.fixture
+def reservoir() -> t.Iterator[Reservoir]:
+    with Reservoir.create("incremental", capacity=10) as reservoir:
+        yield reservoir
+
+
+def consume(reservoir: Reservoir, count: int, output: t.Any) -> None:
+    output.put([reservoir.pop(timeout=10) for _ in range(count)])
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_reservoir_fill_and_pop(kind: Kind) -> None:
+    gen = generator(kind)
+    with Reservoir.create(kind, capacity=8) as reservoir:
+        assert reservoir.fill(gen) == 8
+        ids = [reservoir.pop(), *reservoir.pop_many(7)]
+    assert gen.ids_to_strings(ids)
+    assert len(ids) == 8
+
+
+def test_reservoir_typeid_prefix() -> None:
+    gen = generator("typeid", prefix="user")
+    with Reservoir.create("typeid", capacity=4, prefix="user") as reservoir:
+        assert reservoir.prefix == "user"
+        with pytest.raises(ValueError):
+            reservoir.fill(generator("typeid"))
+        reservoir.fill(gen)
+        ids = [reservoir.pop(), *reservoir.pop_many(3)]
+    assert all(str(value).startswith("user_") for value in ids)
+    with pytest.raises(ValueError):
+        Reservoir.create("ulid", prefix="user")
+    with pytest.raises(ValueError):
+        Reservoir.create("typeid", prefix="BAD")
+
+
+def test_reservoir_ring_wraps(reservoir: Reservoir) -> None:
+    gen = generator("incremental")
+    assert reservoir.fill(gen) == 10
+    assert reservoir.fill(gen) == 0
+    assert reservoir.pop_many(7) == list(range(7))
+    assert reservoir.fill(gen) == 7
+    assert reservoir.available() == 10
+    # Block spans the end and the start of the ring
+    assert reservoir.pop_block(6) == b"".join(
+        value.to_bytes(8, "big") for value in range(7, 13)
+    )
+    assert reservoir.pop_many(4) == list(range(13, 17))
+
+
+def test_reservoir_stats(reservoir: Reservoir) -> None:
+    assert reservoir.stats().low_watermark == 10
+    reservoir.fill(generator("incremental"))
+    reservoir.pop_many(8)
+    reservoir.pop()
+    stats = reservoir.stats()
+    assert stats.produced == 10
+    assert stats.consumed == 9
+    assert stats.available == 1
+    assert stats.low_watermark == 2
+    assert stats.starved == 0
+
+
+def test_reservoir_pop_timeout(reservoir: Reservoir) -> None:
+    with pytest.raises(ReservoirEmpty):
+        reservoir.pop(timeout=0.01)
+    assert reservoir.stats().starved == 0
+
+
+def test_reservoir_invalid_arguments(reservoir: Reservoir) -> None:
+    with pytest.raises(ValueError):
+        reservoir.pop_many(11)
+    with pytest.raises(ValueError):
+        reservoir.fill(generator("ulid"))
+    with pytest.raises(ValueError):
+        Reservoir.create("ulid", capacity=0)
+
+
+def test_reservoir_across_processes() -> None:
+    with Reservoir.create("ulid", capacity=1024) as reservoir:
+        stop = multiprocessing.Event()
+        output: t.Any = multiprocessing.Queue()
+        producer = multiprocessing.Process(target=reservoir.produce, args=(stop,))
+        consumers = [
+            multiprocessing.Process(target=consume, args=(reservoir, 2000, output))
+            for _ in range(3)
+        ]
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+        results = [output.get(timeout=30) for _ in consumers]
+        for consumer in consumers:
+            consumer.join()
+        stop.set()
+        producer.join()
+        stats = reservoir.stats()
+    ids = [value for values in results for value in values]
+    assert all(isinstance(value, ULID) for value in ids)
+    assert len(set(ids)) == 6000
+    # IDs popped by each consumer are ordered by time
+    for values in results:
+        timestamps = [value.milliseconds for value in values]
+        assert timestamps == sorted(timestamps)
+    assert stats.consumed == 6000
+    assert stats.produced >= 6000
+
+
+def test_reservoir_survives_other_processes(reservoir: Reservoir) -> None:
+    # Processes started without multiprocessing have their own resource tracker
+    script = (
+        "import sys; from genid.reservoir import _attach; _attach(sys.argv[1], None)"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", script, reservoir.shm.name],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "leaked" not in process.stderr
+    reservoir.fill(generator("incremental"))
+    assert reservoir.pop() == 0
+
+
+def test_reservoir_objectid_order() -> None:
+    with Reservoir.create("objectid", capacity=100) as reservoir:
+        reservoir.fill(generator("objectid"))
+        ids = reservoir.pop_many(100)
+    assert all(isinstance(value, ObjectID) for value in ids)
+    assert ids == sorted(ids, key=lambda oid: oid.binary)
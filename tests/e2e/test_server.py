@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from genid.generators import IDGenerator, Kind, generator
+from genid.server import MAX_LEASE, Address, IDClient, IDServer, LeaseError
+
+
+class ServerThread:
+    """Run an ID server within an event loop running in a background thread."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.listener: t.Optional[asyncio.base_events.Server] = None
+
+    def start(self, server: IDServer, address: Address) -> Address:
+        async def start() -> asyncio.base_events.Server:
+            if isinstance(address, str):
+                return await server.start_unix(address)
+            return await server.start_tcp(*address)
+
+        self.listener = asyncio.run_coroutine_threadsafe(start(), self.loop).result()
+        if isinstance(address, str):
+            return address
+        return t.cast(t.Tuple[str, int], self.listener.sockets[0].getsockname()[:2])
+
+    def stop(self) -> None:
+        async def stop(listener: asyncio.base_events.Server) -> None:
+            listener.close()
+            await listener.wait_closed()
+
+        if self.listener is not None:
+            asyncio.run_coroutine_threadsafe(stop(self.listener), self.loop).result()
+            self.listener = None
+
+
+class BlockingGenerator(IDGenerator[int]):
+    """Incremental generator blocking large batches until `release` is set."""
+
+    _concurrent_create = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.blocked = threading.Event()
+        self.release = threading.Event()
+
+    def unsafe_create_id(self) -> int:
+        return 0
+
+    def unsafe_create_ids(self, count: int) -> t.List[int]:
+        if count == 1:
+            return [0]
+        self.blocked.set()
+        if not self.release.wait(timeout=10):
+            raise TimeoutError("Generator was not released")
+        return list(range(count))
+
+
+@pytest.fixture
+def server_thread() -> t.Iterator[ServerThread]:
+    server_thread = ServerThread()
+    yield server_thread
+    server_thread.stop()
+    server_thread.loop.call_soon_threadsafe(server_thread.loop.stop)
+    server_thread.thread.join()
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> str:
+    return str(tmp_path / "genid.sock")
+
+
+def test_server_lease(server_thread: ServerThread, socket_path: str) -> None:
+    server_thread.start(IDServer("ulid"), socket_path)
+    with IDClient(socket_path) as client:
+        kind, ids = client.lease(100)
+    assert kind == Kind.ULID
+    assert len(set(ids)) == 100
+
+
+@pytest.mark.parametrize("kind", [kind for kind in Kind if kind != Kind.CONSTANT])
+def test_server_lease_kinds(
+    server_thread: ServerThread, socket_path: str, kind: Kind
+) -> None:
+    server_thread.start(IDServer(kind), socket_path)
+    with IDClient(socket_path) as client:
+        leased_kind, ids = client.lease(10)
+    assert leased_kind == kind
+    assert len(generator(kind).ids_to_strings(ids)) == 10
+
+
+def test_server_tcp(server_thread: ServerThread) -> None:
+    address = server_thread.start(IDServer("incremental"), ("127.0.0.1", 0))
+    with IDClient(address, lease_size=10) as client:
+        assert client.new_many(25) == list(range(25))
+        assert client.new() == 25
+
+
+def test_client_leases_consecutive_blocks(
+    server_thread: ServerThread, socket_path: str
+) -> None:
+    server = IDServer("incremental")
+    server_thread.start(server, socket_path)
+    with IDClient(socket_path, lease_size=10, prefetch=0.5) as client:
+        assert [client.new() for _ in range(5)] == list(range(5))
+        # Next block is leased before the current block is exhausted
+        assert client._pending is not None
+        client._pending.result()
+        assert server.generator.count() == 20
+        assert [client.new() for _ in range(30)] == list(range(5, 35))
+
+
+def test_clients_share_generator(server_thread: ServerThread, socket_path: str) -> None:
+    server_thread.start(IDServer("incremental"), socket_path)
+    clients = [IDClient(socket_path, lease_size=7, pool_size=1) for _ in range(4)]
+    with ThreadPoolExecutor(4) as executor:
+        results = executor.map(lambda client: client.new_many(100), clients)
+        ids = [value for values in results for value in values]
+    for client in clients:
+        client.close()
+    assert len(set(ids)) == 400
+
+
+def test_client_reconnects(server_thread: ServerThread, socket_path: str) -> None:
+    gen = generator("incremental")
+    server_thread.start(IDServer("incremental", gen), socket_path)
+    with IDClient(socket_path) as client:
+        client.lease(1)
+        server_thread.stop()
+        Path(socket_path).unlink()
+        server_thread.start(IDServer("incremental", gen), socket_path)
+        assert client.lease(1) == (Kind.INCREMENTAL, [1])
+
+
+def test_client_fails_without_server(socket_path: str) -> None:
+    with IDClient(socket_path, retries=1) as client:
+        with pytest.raises(OSError):
+            client.lease(1)
+
+
+@pytest.mark.parametrize("count", [0, MAX_LEASE + 1])
+def test_server_rejects_invalid_count(
+    server_thread: ServerThread, socket_path: str, count: int
+) -> None:
+    server_thread.start(IDServer("ulid"), socket_path)
+    with IDClient(socket_path) as client:
+        with pytest.raises(LeaseError, match="Number of IDs"):
+            client.lease(count)
+        # Connection can still be used
+        assert len(client.lease(1)[1]) == 1
+
+
+def test_client_invalid_lease_size() -> None:
+    with pytest.raises(ValueError):
+        IDClient("genid.sock", lease_size=0)
+
+
+def test_server_large_lease_does_not_block_other_clients(
+    server_thread: ServerThread, socket_path: str
+) -> None:
+    gen = BlockingGenerator()
+    server_thread.start(IDServer("incremental", gen), socket_path)
+    with IDClient(socket_path, timeout=2) as first, IDClient(
+        socket_path, timeout=2
+    ) as second, ThreadPoolExecutor(1) as executor:
+        pending = executor.submit(first.lease, MAX_LEASE)
+        assert gen.blocked.wait(timeout=5)
+        assert second.lease(1) == (Kind.INCREMENTAL, [0])
+        assert not pending.done()
+        gen.release.set()
+        assert len(pending.result()[1]) == MAX_LEASE
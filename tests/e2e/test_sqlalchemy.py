@@ -0,0 +1,166 @@
+import typing as t
+import uuid
+
+import pytest
+
+sa = pytest.importorskip("sqlalchemy")
+
+from genid.generators import Kind, generator  # noqa: E402
+from genid.ksuid import KSUID  # noqa: E402
+from genid.monitor import MonitoredIDGenerator  # noqa: E402
+from genid.objectid import ObjectID  # noqa: E402
+from genid.sqlalchemy import (  # noqa: E402
+    KSUIDType,
+    ObjectIDType,
+    ULIDType,
+    UUIDType,
+    _BinaryIDType,
+    bulk_insert,
+)
+from genid.ulid import ULID  # noqa: E402
+
+TYPES = [
+    (Kind.ULID, ULIDType, ULID),
+    (Kind.UUID4, UUIDType, uuid.UUID),
+    (Kind.OBJECTID, ObjectIDType, ObjectID),
+    (Kind.KSUID, KSUIDType, KSUID),
+]
+
+
+def create_table(column_type: t.Any) -> t.Tuple[t.Any, t.Any]:
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "items",
+        metadata,
+        sa.Column("id", column_type, primary_key=True),
+        sa.Column("name", sa.String),
+    )
+    metadata.create_all(engine)
+    return engine, table
+
+
+@pytest.mark.parametrize("kind, column_type, python_type", TYPES)
+def test_binary_type_round_trip(
+    kind: Kind, column_type: t.Any, python_type: t.Any
+) -> None:
+    engine, table = create_table(column_type())
+    gen = generator(kind)
+    values = gen.new_many(3)
+    with engine.begin() as connection:
+        connection.execute(
+            table.insert(),
+            [
+                {"id": values[0], "name": "string"},
+                {"id": gen.id_to_bytes(gen.unsafe_create_id()), "name": "bytes"},
+                {
+                    "id": column_type().load(gen.id_to_bytes(gen.unsafe_create_id())),
+                    "name": "object",
+                },
+            ],
+        )
+        stored = connection.execute(sa.select(sa.func.length(table.c.id))).scalars()
+        assert set(stored) == {column_type.size}
+        loaded = connection.execute(
+            sa.select(table.c.id).where(table.c.id == values[0])
+        ).scalar_one()
+    assert isinstance(loaded, python_type)
+    assert str(loaded) == values[0]
+    assert column_type().python_type is python_type
+
+
+@pytest.mark.parametrize("kind, column_type, python_type", TYPES)
+def test_binary_type_rejects_invalid_values(
+    kind: Kind, column_type: t.Any, python_type: t.Any
+) -> None:
+    engine, table = create_table(column_type())
+    with engine.begin() as connection:
+        with pytest.raises(sa.exc.StatementError):
+            connection.execute(table.insert(), {"id": b"short"})
+
+
+def test_binary_type_preserves_order() -> None:
+    engine, table = create_table(ULIDType())
+    values = [ULID.from_timestamp(timestamp) for timestamp in range(100, 0, -1)]
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{"id": value} for value in values])
+        ordered = connection.execute(
+            sa.select(table.c.id).order_by(table.c.id)
+        ).scalars()
+        assert list(ordered) == sorted(values)
+
+
+def test_binary_type_requires_dump_and_load() -> None:
+    class IncompleteType(_BinaryIDType[bytes]):
+        size = 8
+        cache_ok = True
+
+        def dump(self, value: t.Any) -> bytes:
+            return bytes(value)
+
+    with pytest.raises(TypeError):
+        IncompleteType()  # type: ignore[abstract]
+
+
+def test_binary_type_nullable() -> None:
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "items",
+        metadata,
+        sa.Column("key", sa.Integer, primary_key=True),
+        sa.Column("id", ULIDType(), nullable=True),
+    )
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), {"key": 1, "id": None})
+        assert connection.execute(sa.select(table.c.id)).scalar_one() is None
+
+
+@pytest.mark.parametrize("kind, column_type, python_type", TYPES)
+def test_bulk_insert(kind: Kind, column_type: t.Any, python_type: t.Any) -> None:
+    engine, table = create_table(column_type())
+    rows = ({"name": f"row-{idx}"} for idx in range(2500))
+    with engine.begin() as connection:
+        assert bulk_insert(connection, table, rows, generator(kind)) == 2500
+        loaded = connection.execute(sa.select(table.c.id, table.c.name)).all()
+    assert len({row.id for row in loaded}) == 2500
+    assert {row.name for row in loaded} == {f"row-{idx}" for idx in range(2500)}
+    assert all(isinstance(row.id, python_type) for row in loaded)
+
+
+def test_bulk_insert_text_column() -> None:
+    engine, table = create_table(sa.String(21))
+    with engine.begin() as connection:
+        assert (
+            bulk_insert(connection, table, [{}] * 10, generator("nanoid"), batch_size=3)
+            == 10
+        )
+        loaded = connection.execute(sa.select(table.c.id)).scalars().all()
+    assert len(set(loaded)) == 10
+    assert all(len(value) == 21 for value in loaded)
+
+
+def test_bulk_insert_rejects_generator_of_other_width() -> None:
+    engine, table = create_table(ULIDType())
+    with engine.begin() as connection:
+        with pytest.raises(ValueError):
+            bulk_insert(connection, table, [{}], generator("ksuid"))
+        with pytest.raises(ValueError):
+            bulk_insert(connection, table, [{}], generator("ulid"), batch_size=0)
+
+
+@pytest.mark.parametrize("kind", [Kind.UUID4, Kind.TYPEID, Kind.TRACE_ID])
+def test_bulk_insert_rejects_generator_of_other_kind(kind: Kind) -> None:
+    engine, table = create_table(ULIDType())
+    with engine.begin() as connection:
+        with pytest.raises(ValueError, match="ULIDType"):
+            bulk_insert(connection, table, [{}], generator(kind))
+        assert connection.execute(sa.select(table.c.id)).all() == []
+
+
+def test_bulk_insert_wrapped_generator() -> None:
+    engine, table = create_table(ULIDType())
+    gen = MonitoredIDGenerator(generator("ulid"), capacity=1000)
+    with engine.begin() as connection:
+        assert bulk_insert(connection, table, [{}] * 3, gen) == 3
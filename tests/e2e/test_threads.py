@@ -0,0 +1,68 @@
+import sys
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from genid.generators import IDGenerator, NUIDGenerator, generator
+from genid.rng import BlockRandom
+
+THREADS = 8
+COUNT = 500
+
+
+@pytest.fixture(autouse=True)
+def switch_often() -> t.Iterator[None]:
+    # Increase the odds of thread switches within generators
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(func: t.Callable[[], t.List[t.Any]]) -> t.List[t.Any]:
+    barrier = threading.Barrier(THREADS)
+
+    def target() -> t.List[t.Any]:
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(target) for _ in range(THREADS)]
+        return [value for future in futures for value in future.result()]
+
+
+def test_concurrent_indices(generator: IDGenerator[t.Any]) -> None:
+    results = run_threads(lambda: [generator.new_at_index() for _ in range(COUNT)])
+    assert sorted(index for index, _ in results) == list(range(THREADS * COUNT))
+    assert generator.count() == THREADS * COUNT
+
+
+@pytest.mark.parametrize(
+    "kind", ["nanoid", "nuid", "objectid", "uuid1", "uuid4", "ulid", "ksuid"]
+)
+def test_concurrent_ids_are_unique(kind: t.Any) -> None:
+    gen = generator(kind)
+    results = run_threads(lambda: gen.new_many(COUNT) + [gen.new() for _ in range(10)])
+    assert len(set(results)) == THREADS * (COUNT + 10)
+    assert gen.count() == THREADS * (COUNT + 10)
+
+
+def test_concurrent_incremental() -> None:
+    gen = generator("incremental")
+    results = run_threads(lambda: [gen.new_at_index() for _ in range(COUNT)])
+    assert all(index == int(value) for index, value in results)
+
+
+def test_nuid_per_thread_prefix() -> None:
+    gen = NUIDGenerator()
+    results = run_threads(lambda: [gen.new()])
+    assert len({value[:12] for value in results}) == THREADS
+
+
+def test_shared_block_random() -> None:
+    source = BlockRandom(0, block_size=64)
+    gen = generator("uuid4", rng=source)
+    results = run_threads(lambda: gen.new_many(COUNT))
+    assert len(set(results)) == THREADS * COUNT
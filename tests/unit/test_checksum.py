@@ -0,0 +1,141 @@
+import string
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from genid.checksum import (
+    CheckedIDGenerator,
+    Checksum,
+    CrockfordChecksum,
+    checksum,
+    checksum_for,
+)
+from genid.generators import Kind, NanoIDGenerator, SecretIDGenerator, generator
+from genid.monitor import MonitoredIDGenerator
+from genid.registry import IDRegistry, RegisteredIDGenerator
+
+KINDS = [Kind.NANOID, Kind.NUID, Kind.ULID, Kind.SECRET]
+
+
+def substitutions(value: str, alphabet: str) -> t.List[str]:
+    return [
+        value[:idx] + char + value[idx + 1 :]
+        for idx in range(len(value))
+        for char in alphabet
+        if char != value[idx]
+    ]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_checked_generator_ids_are_valid(kind: Kind) -> None:
+    gen = CheckedIDGenerator(generator(kind))
+    values = [gen.new(), *gen.new_many(100)]
+    assert all(gen.verify(value) for value in values)
+    assert gen.verify_many(values) == [True] * len(values)
+    assert gen.checksum.strip(values[0]) + values[0][-1] == values[0]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_checked_generator_rejects_truncated_ids(kind: Kind) -> None:
+    gen = CheckedIDGenerator(generator(kind))
+    value = gen.new()
+    assert (
+        gen.verify_many([value[:-1], value[1:], value + value[-1], ""]) == [False] * 4
+    )
+
+
+@pytest.mark.parametrize("kind", [Kind.NANOID, Kind.NUID, Kind.SECRET])
+def test_checksum_detects_single_substitutions(kind: Kind) -> None:
+    check = checksum(kind)
+    value = CheckedIDGenerator(generator(kind), check).new()
+    assert not any(check.verify_many(substitutions(value, check.alphabet)))
+
+
+def test_checksum_detects_adjacent_transpositions() -> None:
+    check = checksum("nanoid")
+    values = CheckedIDGenerator(generator("nanoid"), check).new_many(100)
+    swapped = [
+        value[:idx] + value[idx + 1] + value[idx] + value[idx + 2 :]
+        for value in values
+        for idx in range(len(value) - 1)
+        if value[idx] != value[idx + 1]
+    ]
+    assert sum(check.verify_many(swapped)) / len(swapped) < 0.01
+
+
+def test_checksum_rejects_invalid_characters() -> None:
+    check = Checksum("0123456789")
+    assert check.append("7992739871") == "79927398713"
+    assert not check.verify("7992739871a")
+    assert not check.verify("799273987é3")
+    with pytest.raises(ValueError):
+        check.compute("12a")
+    with pytest.raises(ValueError):
+        check.strip("79927398710")
+
+
+def test_checksum_invalid_alphabet() -> None:
+    with pytest.raises(ValueError):
+        Checksum("a")
+    with pytest.raises(ValueError):
+        Checksum("aab")
+    with pytest.raises(ValueError):
+        Checksum("aé")
+
+
+def test_crockford_check_symbols() -> None:
+    check = CrockfordChecksum()
+    assert check.compute("00000000000000000000000001") == "1"
+    assert check.compute("0000000000000000000000000Z") == "Z"
+    assert check.compute("00000000000000000000000010") == "*"
+    assert check.compute("00000000000000000000000014") == "U"
+    assert check.verify("00000000000000000000000014u")
+    # Crockford base32 is case insensitive, and I, L and O are aliases
+    value = CheckedIDGenerator(generator("ulid")).new()
+    assert check.verify(value.lower())
+    assert check.verify(value[:-2].replace("1", "I") + value[-2:])
+    assert check.verify(value[:-2].replace("0", "o") + value[-2:])
+    assert not check.verify("80000000000000000000000000" + "0")
+    assert not any(check.verify_many(substitutions(value, string.digits + "ABC")))
+
+
+def test_checksum_for_nanoid_options() -> None:
+    gen = CheckedIDGenerator(generator("nanoid", alphabet="abcdef", size=8))
+    value = gen.new()
+    assert len(value) == 9
+    assert set(value) <= set("abcdef")
+    assert gen.verify(value)
+
+
+def test_checksum_unsupported() -> None:
+    with pytest.raises(ValueError):
+        checksum("uuid4")
+    with pytest.raises(ValueError):
+        checksum_for(generator("uuid4"))
+
+
+def test_checked_generator_binary_form_is_unchanged() -> None:
+    gen = CheckedIDGenerator(generator("nuid"))
+    buffer = bytearray(22)
+    gen.fill_into(buffer)
+    assert gen.id_width == 22
+    assert gen.verify(gen.checksum.append(buffer.decode()))
+
+
+def test_wrapped_generators_forward_concurrent_create(tmp_path: Path) -> None:
+    assert CheckedIDGenerator(generator("nanoid"))._concurrent_create
+    with IDRegistry(tmp_path / "ids") as registry:
+        for kind in ("nanoid", "incremental"):
+            inner = generator(kind)
+            wrapped = RegisteredIDGenerator(inner, registry)
+            assert wrapped._concurrent_create == inner._concurrent_create
+            assert wrapped.generator is inner
+    # Bloom filters are not thread safe
+    assert not MonitoredIDGenerator(generator("nanoid"))._concurrent_create
+
+
+def test_generator_options_are_public() -> None:
+    gen = NanoIDGenerator(alphabet="abc", size=5)
+    assert (gen.alphabet, gen.size) == ("abc", 5)
+    assert SecretIDGenerator(length=4).length == 4
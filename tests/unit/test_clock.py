@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from genid.clock import CachedClock, MillisecondClock, SystemClock, VirtualClock
+from genid.generators import generator
+from genid.ksuid import KSUID
+from genid.objectid import ObjectID
+from genid.ulid import ULID
+
+# 2023-03-06T00:00:00.123456789Z
+NOW_NS = 1678060800_123456789
+
+
+def test_virtual_clock() -> None:
+    clock = VirtualClock(NOW_NS, step=10)
+    assert clock.time_ns() == NOW_NS
+    assert clock.time_ns() == NOW_NS + 10
+    clock.set(NOW_NS)
+    assert clock.time_ms() == NOW_NS // 1_000_000
+    clock.advance(1_000_000_000)
+    assert clock.time_s() == NOW_NS // 1_000_000_000 + 1
+    assert clock.time() == pytest.approx((NOW_NS + 1_000_000_010) / 1e9)
+
+
+def test_system_clocks() -> None:
+    before = time.time_ns()
+    for clock in (SystemClock(), MillisecondClock()):
+        assert before // 1_000_000_000 <= clock.time_s() <= time.time()
+        assert before // 1_000_000 <= clock.time_ms() <= time.time_ns() // 1_000_000
+    assert MillisecondClock().time_ns() % 1_000_000 == 0
+
+
+def test_cached_clock() -> None:
+    source = VirtualClock(NOW_NS)
+    clock = CachedClock(tick=0.001, source=source)
+    try:
+        assert clock.time_ns() == NOW_NS
+        source.advance(1_000_000_000)
+        deadline = time.monotonic() + 5
+        while clock.time_s() == NOW_NS // 1_000_000_000:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        assert clock.time_ns() == NOW_NS + 1_000_000_000
+        assert clock.time_ms() == (NOW_NS + 1_000_000_000) // 1_000_000
+    finally:
+        clock.close()
+
+
+def test_generators_use_clock() -> None:
+    clock = VirtualClock(NOW_NS)
+    assert generator("timestamp", clock=clock).new() == str(NOW_NS // 1_000_000_000)
+    assert generator("nstimestamp", clock=clock).new() == str(NOW_NS)
+    ulid = ULID.from_str(generator("ulid", clock=clock).new())
+    assert ulid.milliseconds == NOW_NS // 1_000_000
+    objectid = ObjectID(generator("objectid", clock=clock).new())
+    assert objectid.generation_time.timestamp() == NOW_NS // 1_000_000_000
+    ksuid = KSUID.parse(generator("ksuid", clock=clock).new())
+    assert ksuid.timestamp == NOW_NS // 1_000_000_000
@@ -0,0 +1,132 @@
+import os
+import random
+import typing as t
+
+import pytest
+
+from genid.codecs import BASE16, BASE32, BASE32_LOWER, BASE58, BASE62, Codec
+
+CODECS = [BASE16, BASE32, BASE32_LOWER, BASE58, BASE62]
+SIZES = [1, 2, 3, 5, 8, 12, 16, 20]
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=repr)
+@pytest.mark.parametrize("size", SIZES)
+def test_codec_bytes_round_trip(codec: Codec, size: int) -> None:
+    for value in [bytes(size), b"\xff" * size, *(os.urandom(size) for _ in range(50))]:
+        text = codec.encode(value)
+        assert len(text) == codec.width(size)
+        assert codec.decode(text, size) == value
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=repr)
+@pytest.mark.parametrize("width", [1, 2, 3, 7, 10, 26, 27])
+def test_codec_int_round_trip(codec: Codec, width: int) -> None:
+    maximum = codec.base**width - 1
+    for value in [0, maximum, *(random.randint(0, maximum) for _ in range(10))]:
+        text = codec.encode_int(value, width)
+        assert len(text) == width
+        assert codec.decode_int(text, width) == value
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=repr)
+def test_codec_encoding_preserves_order(codec: Codec) -> None:
+    values = sorted(os.urandom(16) for _ in range(100))
+    assert sorted(codec.encode(value) for value in values) == [
+        codec.encode(value) for value in values
+    ]
+
+
+def test_codec_known_values() -> None:
+    assert BASE16.encode(b"\x01\xab") == "01ab"
+    assert BASE32.encode(b"\xff" * 16) == "7ZZZZZZZZZZZZZZZZZZZZZZZZZ"
+    assert BASE32_LOWER.encode(b"\x00" * 15 + b"\x20") == "00000000000000000000000010"
+    assert BASE58.encode_int(57, 2) == "1z"
+    assert BASE62.encode(b"\xff" * 20) == "aWgEPTl1tmebfsQzFP4bxwgy80V"
+
+
+def test_codec_decoding_accepts_aliases_and_other_case() -> None:
+    assert BASE32.decode_int("7zzz") == BASE32.decode_int("7ZZZ")
+    assert BASE32.decode_int("IiLlOo") == BASE32.decode_int("111100")
+    assert BASE32_LOWER.decode_int("ABC") == BASE32_LOWER.decode_int("abc")
+    assert BASE16.decode(bytes(range(12)).hex().upper(), 12) == bytes(range(12))
+
+
+@pytest.mark.parametrize(
+    "codec, text",
+    [
+        (BASE16, "0g"),
+        (BASE32, "0U"),
+        (BASE32, "0-"),
+        (BASE58, "0z"),
+        (BASE58, "l1"),
+        (BASE62, "a_"),
+        (BASE62, "é1"),
+        (BASE62, ""),
+    ],
+)
+def test_codec_rejects_invalid_digits(codec: Codec, text: str) -> None:
+    with pytest.raises(ValueError):
+        codec.decode_int(text)
+
+
+def test_codec_rejects_invalid_width_and_overflow() -> None:
+    with pytest.raises(ValueError):
+        BASE62.decode_int("abc", 4)
+    with pytest.raises(ValueError):
+        BASE62.encode_int(62**3, 3)
+    with pytest.raises(ValueError):
+        BASE62.encode_int(-1, 3)
+    with pytest.raises(ValueError):
+        BASE32.decode("8" + "0" * 25, 16)
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=repr)
+def test_codec_batch_round_trip(codec: Codec) -> None:
+    buffer = os.urandom(16 * 100)
+    values = codec.encode_many(buffer, 16)
+    assert values == [
+        codec.encode(buffer[offset : offset + 16]) for offset in range(0, 1600, 16)
+    ]
+    assert codec.decode_many(values, 16) == buffer
+    assert codec.encode_many(b"", 16) == []
+    with pytest.raises(ValueError):
+        codec.encode_many(buffer[:-1], 16)
+
+
+def test_codec_byte_table() -> None:
+    table = BASE32.byte_table()
+    assert bytes(range(32)).translate(table) == BASE32.alphabet.encode()
+    assert bytes(range(32, 64)).translate(table) == BASE32.alphabet.encode()
+    with pytest.raises(ValueError):
+        BASE62.byte_table()
+
+
+@pytest.mark.parametrize(
+    "alphabet, aliases, case_insensitive",
+    [
+        ("0", None, False),
+        ("001", None, False),
+        ("01é", None, False),
+        ("aA", None, True),
+        ("01", {"2": "3"}, False),
+        ("01", {"1": "0"}, False),
+    ],
+)
+def test_codec_rejects_invalid_alphabets(
+    alphabet: str, aliases: t.Optional[t.Dict[str, str]], case_insensitive: bool
+) -> None:
+    with pytest.raises(ValueError):
+        Codec(alphabet, aliases, case_insensitive)
+
+
+def test_ulid_base32_module_functions() -> None:
+    from genid.ulid import base32
+
+    assert base32.encode_timestamp(bytes(range(1, 7))) == "01081G8186"
+    assert base32.encode_randomness(bytes(range(10))) == "000G40R40M30E209"
+    assert base32.decode_timestamp("01081g8186") == bytes(range(1, 7))
+    assert base32.decode_randomness("000G40R40M30E209") == bytes(range(10))
+    assert base32.DECODE[ord("Z")] == 31
+    with pytest.raises(ValueError):
+        base32.decode_timestamp("01081G818")
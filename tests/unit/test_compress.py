@@ -0,0 +1,111 @@
+import io
+import mmap
+import typing as t
+from pathlib import Path
+
+import pytest
+
+from genid.compress import (
+    CompressedIDs,
+    CorruptedData,
+    Decoder,
+    Encoder,
+    compress,
+    decompress,
+)
+from genid.generators import Kind, generator
+
+KINDS = [
+    Kind.INCREMENTAL,
+    Kind.TIMESTAMP,
+    Kind.NSTIMESTAMP,
+    Kind.OBJECTID,
+    Kind.ULID,
+    Kind.KSUID,
+]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_compress_roundtrip(kind: Kind) -> None:
+    gen = generator(kind)
+    _, ids = gen.new_ids_at_index(1000)
+    ids.sort()
+    data = compress(kind, ids, block_size=64)
+    assert len(data) < 1000 * t.cast(int, gen.id_width)
+    assert gen.ids_to_strings(decompress(data)) == gen.ids_to_strings(ids)
+
+
+def test_compress_unsorted_integers() -> None:
+    ids = [5, 3, 2**64 - 1, 0, 7, 7]
+    assert decompress(compress("incremental", ids, block_size=4)) == ids
+
+
+def test_compress_ratio() -> None:
+    data = compress("incremental", list(range(10_000)))
+    # About one byte per ID
+    assert len(data) < 11_000
+
+
+def test_compress_empty() -> None:
+    data = compress("ulid", [])
+    assert decompress(data) == []
+    assert len(CompressedIDs(data)) == 0
+
+
+def test_compress_unsupported_kind() -> None:
+    with pytest.raises(ValueError):
+        compress("uuid4", [])
+
+
+def test_streaming(tmp_path: Path) -> None:
+    gen = generator("objectid")
+    path = tmp_path / "ids.bin"
+    with path.open("wb") as output, Encoder(output, "objectid", 100) as encoder:
+        for _ in range(10):
+            buffer = bytearray(12 * 77)
+            gen.fill_into(buffer)
+            encoder.write_packed(buffer)
+        assert encoder.count == 770
+    with path.open("rb") as stream:
+        decoder = Decoder(stream)
+        assert decoder.kind == Kind.OBJECTID
+        blocks = list(decoder.iter_blocks())
+    assert [len(block) for block in blocks] == [100] * 7 + [70]
+    ids = [value for block in blocks for value in block]
+    assert len(set(ids)) == 770
+
+
+def test_random_access(tmp_path: Path) -> None:
+    ids = list(range(1_000, 1_000_000, 7))
+    path = tmp_path / "ids.bin"
+    path.write_bytes(compress("incremental", ids, block_size=100))
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        compressed = CompressedIDs(m)
+        assert len(compressed) == len(ids)
+        assert compressed[0] == ids[0]
+        assert compressed[-1] == ids[-1]
+        assert compressed[12345] == ids[12345]
+        assert compressed[250:260] == ids[250:260]
+        assert list(compressed) == ids
+        with pytest.raises(IndexError):
+            compressed[len(ids)]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"GIDX\x01\x08\x00\x00\x00\x10\x00",
+        compress("incremental", [1, 2, 3])[:-30],
+    ],
+)
+def test_corrupted_data(data: bytes) -> None:
+    with pytest.raises(CorruptedData):
+        decompress(data)
+
+
+def test_encoder_closed() -> None:
+    encoder = Encoder(io.BytesIO(), "incremental")
+    encoder.close()
+    with pytest.raises(ValueError):
+        encoder.write([1])
@@ -0,0 +1,64 @@
+import pytest
+
+from genid.feistel import FeistelPermutation
+
+
+@pytest.mark.parametrize("bits", [2, 8, 16])
+def test_permutation_is_a_bijection(bits: int) -> None:
+    permutation = FeistelPermutation(b"key", bits=bits)
+    values = permutation.encode_range(0, 1 << bits)
+    assert sorted(values) == list(range(1 << bits))
+    assert permutation.decode_many(values) == list(range(1 << bits))
+
+
+@pytest.mark.parametrize("bound", [1, 2, 3, 1000, 4096, 5000])
+def test_permutation_honours_bound(bound: int) -> None:
+    permutation = FeistelPermutation("key", bound=bound)
+    values = permutation.encode_range(0, bound)
+    assert sorted(values) == list(range(bound))
+    assert permutation.decode_many(values) == list(range(bound))
+
+
+@pytest.mark.parametrize("bits", [32, 48, 64])
+def test_permutation_roundtrip(bits: int) -> None:
+    permutation = FeistelPermutation(b"key", bits=bits)
+    values = permutation.encode_range(0, 1000)
+    assert all(0 <= value < 1 << bits for value in values)
+    assert len(set(values)) == 1000
+    assert values != sorted(values)
+    assert permutation.decode_many(values) == list(range(1000))
+    last = (1 << bits) - 1
+    assert permutation.decode(permutation.encode(last)) == last
+
+
+def test_permutation_depends_on_key() -> None:
+    first = FeistelPermutation(b"first", bits=32)
+    second = FeistelPermutation(b"second", bits=32)
+    assert first.encode_range(0, 100) != second.encode_range(0, 100)
+    assert first.encode_many(range(100)) == first.encode_range(0, 100)
+
+
+def test_permutation_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        FeistelPermutation(b"")
+    with pytest.raises(ValueError):
+        FeistelPermutation(b"key", bits=33)
+    with pytest.raises(ValueError):
+        FeistelPermutation(b"key", bits=66)
+    with pytest.raises(ValueError):
+        FeistelPermutation(b"key", bits=8, bound=257)
+    with pytest.raises(ValueError):
+        FeistelPermutation(b"key", rounds=0)
+    permutation = FeistelPermutation(b"key", bound=10)
+    with pytest.raises(ValueError):
+        permutation.encode(10)
+    with pytest.raises(ValueError):
+        permutation.decode(-1)
+    with pytest.raises(ValueError):
+        permutation.encode_range(5, 11)
+
+
+def test_permutation_bits_of_bound() -> None:
+    # Network size is derived from bound, bits only limits bound
+    assert FeistelPermutation(b"key", bits=64, bound=100).bits == 8
+    assert FeistelPermutation(b"key", bits=8, bound=100).bits == 8
@@ -0,0 +1,76 @@
+import os
+import pickle
+import typing as t
+from datetime import datetime, timezone
+
+import pytest
+
+from genid.ksuid import KSUID, base62
+from genid.ulid import ULID
+
+
+def test_base62_encode_known_values() -> None:
+    assert base62.encode(bytes(20)) == "0" * 27
+    assert base62.encode(b"\xff" * 20) == "aWgEPTl1tmebfsQzFP4bxwgy80V"
+
+
+def test_base62_roundtrip() -> None:
+    for _ in range(100):
+        value = os.urandom(20)
+        assert base62.decode(base62.encode(value)) == value
+
+
+def test_base62_batch_roundtrip() -> None:
+    buffer = os.urandom(20 * 50)
+    encoded = base62.encode_many(buffer)
+    assert len(encoded) == 50
+    assert encoded[1] == base62.encode(buffer[20:40])
+    assert base62.decode_many(encoded) == buffer
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["0" * 26, "0" * 28, "0" * 26 + "-", "0" * 26 + "é", "zzzzzzzzzzzzzzzzzzzzzzzzzzz"],
+)
+def test_base62_decode_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        base62.decode(value)
+
+
+def test_ksuid_parse() -> None:
+    ksuid = KSUID.parse("0ujtsYcgvSTl8PAuAdqWYSMnLOv")
+    assert ksuid.timestamp == 1507608047
+    assert ksuid.datetime == datetime(2017, 10, 10, 4, 0, 47, tzinfo=timezone.utc)
+    assert ksuid.payload.hex() == "b5a1cd34b5f99d1154fb6853345c9735"
+    assert str(ksuid) == "0ujtsYcgvSTl8PAuAdqWYSMnLOv"
+    assert KSUID.from_bytes(ksuid.bytes) == ksuid
+    assert KSUID.from_int(int(ksuid)) == ksuid
+
+
+def test_ksuid_ordering() -> None:
+    first = KSUID.from_timestamp(1_600_000_000)
+    second = KSUID.from_timestamp(1_600_000_001)
+    assert first < second
+    assert str(first) < str(second)
+    assert sorted([second, first]) == [first, second]
+    assert len({first, second, KSUID(first.bytes)}) == 2
+
+
+def test_ksuid_pickle() -> None:
+    ksuid = KSUID()
+    assert pickle.loads(pickle.dumps(ksuid)) == ksuid
+
+
+@pytest.mark.parametrize("cls", [KSUID, ULID])
+def test_comparison_is_consistent_with_hash(cls: t.Type[t.Union[KSUID, ULID]]) -> None:
+    value = cls()
+    assert value == cls(value.bytes)
+    assert value in {cls(value.bytes)}
+    for other in (str(value), int(value), value.bytes):
+        assert value != other
+        assert other not in {value}
+        assert other not in {value: 1}
+        with pytest.raises(TypeError):
+            value < other
+        with pytest.raises(TypeError):
+            value <= other
@@ -0,0 +1,165 @@
+import threading
+import typing as t
+
+import pytest
+
+from genid.clock import VirtualClock
+from genid.generators import IncrementalIDGenerator, Kind, NanoIDGenerator, generator
+from genid.pool import GeneratorPool, PoolKey, State, footprint, generator_state
+
+
+def test_pool_creates_generators_lazily() -> None:
+    pool = GeneratorPool()
+    assert len(pool) == 0
+    gen = pool.get("tenant", "nanoid", size=8)
+    assert isinstance(gen, NanoIDGenerator)
+    assert pool.get("tenant", "nanoid", size=8) is gen
+    assert pool.get("other", "nanoid", size=8) is not gen
+    assert pool.get("tenant", "nanoid", size=9) is not gen
+    assert len(pool.new("tenant", "nanoid", size=8)) == 8
+    assert pool.key("tenant", "nanoid", size=8) in pool
+    stats = pool.stats()
+    assert (stats.size, stats.hits, stats.misses, stats.evictions) == (3, 2, 3, 0)
+
+
+def test_pool_evicts_least_recently_used() -> None:
+    pool = GeneratorPool(max_size=2)
+    first = pool.get("first", "ulid")
+    pool.get("second", "ulid")
+    assert pool.get("first", "ulid") is first
+    pool.get("third", "ulid")
+    assert len(pool) == 2
+    assert pool.key("first", "ulid") in pool
+    assert pool.key("second", "ulid") not in pool
+    assert pool.stats().evictions == 1
+
+
+def test_pool_evicts_idle_generators() -> None:
+    clock = VirtualClock()
+    pool = GeneratorPool(max_idle=60, clock=clock)
+    pool.get("first", "uuid4")
+    clock.advance(30 * 10**9)
+    pool.get("second", "uuid4")
+    clock.advance(31 * 10**9)
+    pool.evict_idle()
+    assert pool.key("first", "uuid4") not in pool
+    assert pool.key("second", "uuid4") in pool
+    clock.advance(60 * 10**9)
+    pool.get("third", "uuid4")
+    assert len(pool) == 1
+
+
+def test_pool_resumes_incremental_generators() -> None:
+    pool = GeneratorPool(max_size=1)
+    assert pool.new_many("first", "incremental", 3) == ["0", "1", "2"]
+    assert pool.new("second", "incremental", offset=100) == "100"
+    assert pool.new("first", "incremental") == "3"
+    assert pool.new("second", "incremental", offset=100) == "101"
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.new("first", "incremental") == "4"
+
+
+def test_pool_persists_states() -> None:
+    states: t.Dict[PoolKey, State] = {}
+    pool = GeneratorPool(
+        max_size=1, save_state=states.__setitem__, load_state=states.get
+    )
+    pool.new_many("first", "incremental", 10, key=b"secret")
+    pool.new("second", "incremental")
+    assert states == {pool.key("first", "incremental", key=b"secret"): {"offset": 10}}
+    other = GeneratorPool(save_state=states.__setitem__, load_state=states.get)
+    gen = t.cast(
+        IncrementalIDGenerator, other.get("first", "incremental", key=b"secret")
+    )
+    assert gen.permutation is not None
+    assert gen.permutation.decode(gen.new_id_at_index()[1]) == 10
+
+
+def test_pool_closes_persistent_generators(tmp_path: t.Any) -> None:
+    path = str(tmp_path / "state")
+    pool = GeneratorPool(max_size=1)
+    first = pool.new("tenant", "incremental", state_file=path, block_size=10)
+    pool.get("other", "nanoid")
+    assert pool.new("tenant", "incremental", state_file=path, block_size=10) != first
+
+
+def test_pool_stateful_generation_is_thread_safe() -> None:
+    pool = GeneratorPool(max_size=2)
+    results: t.List[str] = []
+
+    def worker(idx: int) -> None:
+        ids = []
+        for _ in range(200):
+            ids.extend(pool.new_many(f"tenant-{idx % 3}", "incremental", 2))
+        results.extend(f"{idx % 3}-{value}" for value in ids)
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == len(results) == 6 * 400
+
+
+def test_pool_does_not_serialize_tenants() -> None:
+    pool = GeneratorPool()
+    blocked = pool.get("blocked", "incremental")
+    done = threading.Event()
+
+    def worker() -> None:
+        assert pool.new("other", "incremental") == "0"
+        done.set()
+
+    # Generation of the first tenant waits for the counter lock of its generator
+    with blocked._counter_lock:
+        threads = [
+            threading.Thread(target=pool.new, args=("blocked", "incremental")),
+            threading.Thread(target=worker),
+        ]
+        for thread in threads:
+            thread.start()
+        assert done.wait(5)
+    for thread in threads:
+        thread.join()
+    assert pool.new("blocked", "incremental") == "1"
+
+
+def test_pool_caps_states() -> None:
+    pool = GeneratorPool(max_size=1, max_states=2)
+    for tenant in range(4):
+        pool.new(tenant, "incremental")
+    pool.clear()
+    assert pool.stats().dropped_states == 2
+    assert pool.new(0, "incremental") == "0"
+    assert pool.new(3, "incremental") == "1"
+
+
+def test_pool_options() -> None:
+    with pytest.raises(ValueError):
+        GeneratorPool(max_size=0)
+    with pytest.raises(ValueError):
+        GeneratorPool(max_states=-1)
+    with pytest.raises(ValueError):
+        GeneratorPool(save_state=lambda key, state: None)
+    with pytest.raises(ValueError):
+        GeneratorPool().get("tenant", "unknown")
+
+
+def test_generator_state() -> None:
+    gen = generator("incremental", offset=5)
+    gen.new()
+    assert generator_state(gen) == {"offset": 6}
+    assert isinstance(gen, IncrementalIDGenerator)
+    assert gen.counter == 6 and not gen.persistent
+    assert generator_state(generator("ulid")) is None
+
+
+def test_generators_use_slots() -> None:
+    for kind in [Kind.NANOID, Kind.INCREMENTAL, Kind.ULID, Kind.NUID, Kind.TYPEID]:
+        gen = generator(kind)
+        assert not hasattr(gen, "__dict__")
+        assert footprint(gen) < 256
+    pool = GeneratorPool()
+    pool.get("tenant", "nanoid")
+    assert 0 < pool.footprint() < 1024
@@ -0,0 +1,55 @@
+import random
+import typing as t
+
+import pytest
+
+from genid.clock import VirtualClock
+from genid.generators import Kind, generator
+from genid.nanoid import DEFAULT_ALPHABET, nanoid
+from genid.rng import BlockRandom, get_randbytes
+
+
+def test_block_random_is_reproducible() -> None:
+    first = BlockRandom(42, block_size=64)
+    second = BlockRandom(random.Random(42), block_size=64)
+    assert [first.randbytes(n) for n in (3, 60, 1, 200, 64)] == [
+        second.randbytes(n) for n in (3, 60, 1, 200, 64)
+    ]
+
+
+def test_block_random_sizes() -> None:
+    source = BlockRandom(block_size=16)
+    for n in (0, 1, 15, 16, 17, 100):
+        assert len(source.randbytes(n)) == n
+
+
+def test_block_random_invalid_block_size() -> None:
+    with pytest.raises(ValueError):
+        BlockRandom(block_size=0)
+
+
+def test_get_randbytes() -> None:
+    source = BlockRandom(1)
+    assert get_randbytes(source) == source.randbytes
+    assert len(get_randbytes(None)(10)) == 10
+
+
+@pytest.mark.parametrize(
+    "kind", [Kind.NANOID, Kind.UUID4, Kind.ULID, Kind.KSUID, Kind.SECRET]
+)
+def test_seeded_generators(kind: Kind) -> None:
+    kwargs: t.Dict[str, t.Any] = {}
+    if kind in (Kind.ULID, Kind.KSUID):
+        kwargs["clock"] = VirtualClock(1678060800_000_000_000)
+    first = generator(kind, rng=42, **kwargs)
+    second = generator(kind, rng=random.Random(42), **kwargs)
+    assert [first.new() for _ in range(3)] + first.new_many(100) == [
+        second.new() for _ in range(3)
+    ] + second.new_many(100)
+    assert first.new() != generator(kind, rng=43, **kwargs).new()
+
+
+def test_nanoid_uses_whole_alphabet() -> None:
+    source = BlockRandom(0)
+    ids = "".join(nanoid(randbytes=source) for _ in range(100))
+    assert set(ids) == set(DEFAULT_ALPHABET)
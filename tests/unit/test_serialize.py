@@ -0,0 +1,94 @@
+import pickle
+import typing as t
+from uuid import UUID, uuid4
+
+import pytest
+
+from genid.generators import Kind, generator
+from genid.ksuid import KSUID
+from genid.objectid import ObjectID
+from genid.serialize import (
+    HEADER,
+    KIND_TAGS,
+    WIDTHS,
+    InvalidBatch,
+    msgpack_default,
+    msgpack_ext_hook,
+    pack_ids,
+    unpack_ids,
+)
+from genid.ulid import ULID
+
+
+@pytest.mark.parametrize("value", [ObjectID(), ULID(), KSUID()])
+def test_pickle(value: t.Any) -> None:
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    assert pickle.loads(data) == value
+    # Only raw bytes are pickled
+    assert b"__" not in data
+
+
+def test_ulid_is_hashable() -> None:
+    value = ULID()
+    assert value in {ULID(value.bytes)}
+
+
+@pytest.mark.parametrize("kind", [kind for kind in Kind if kind != Kind.CONSTANT])
+def test_pack_ids(kind: Kind) -> None:
+    gen = generator(kind)
+    _, ids = gen.new_ids_at_index(100)
+    data = pack_ids(kind, ids)
+    if kind in WIDTHS:
+        assert WIDTHS[kind] == gen.id_width
+        assert data[HEADER.size :] == gen.ids_to_bytes(ids)
+    unpacked_kind, unpacked_ids = unpack_ids(data)
+    assert unpacked_kind == kind
+    assert gen.ids_to_strings(unpacked_ids) == gen.ids_to_strings(ids)
+
+
+def test_all_kinds_have_tags() -> None:
+    assert set(KIND_TAGS) == set(Kind)
+    assert len(set(KIND_TAGS.values())) == len(KIND_TAGS)
+
+
+def test_pack_ids_empty() -> None:
+    assert unpack_ids(pack_ids("ulid", [])) == (Kind.ULID, [])
+
+
+def test_pack_constant_ids() -> None:
+    data = pack_ids("constant", ["été", "a"])
+    assert unpack_ids(data) == (Kind.CONSTANT, ["été", "a"])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\x06",
+        b"\xff\x00\x00\x00\x00",
+        pack_ids("ulid", [ULID()])[:-1],
+        pack_ids("secret", ["abc"])[:-1],
+        pack_ids("secret", ["abc"]) + b"d",
+    ],
+)
+def test_unpack_invalid_batch(data: bytes) -> None:
+    with pytest.raises(InvalidBatch):
+        unpack_ids(data)
+
+
+def test_msgpack_hooks() -> None:
+    msgpack = pytest.importorskip("msgpack")
+    payload = {"ids": [ObjectID(), ULID(), KSUID(), uuid4()], "name": "test"}
+    data = msgpack.packb(payload, default=msgpack_default)
+    assert len(data) < len(msgpack.packb({"ids": [str(v) for v in payload["ids"]]}))
+    assert msgpack.unpackb(data, ext_hook=msgpack_ext_hook) == payload
+    other = msgpack.unpackb(
+        msgpack.packb(msgpack.ExtType(42, b"x")), ext_hook=msgpack_ext_hook
+    )
+    assert other == msgpack.ExtType(42, b"x")
+    with pytest.raises(TypeError):
+        msgpack.packb(object(), default=msgpack_default)
+
+
+def test_uuid_batch_values() -> None:
+    value = uuid4()
+    assert unpack_ids(pack_ids("uuid4", [value])) == (Kind.UUID4, [UUID(str(value))])
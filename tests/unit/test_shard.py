@@ -0,0 +1,66 @@
+import typing as t
+from collections import Counter
+
+import pytest
+
+from genid import shard_many, shard_of
+from genid.generators import Kind, generator
+from genid.shard import jump_hash, mix64
+
+KINDS = [kind for kind in Kind if kind != Kind.CONSTANT]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_shard_of_string_and_bytes_agree(kind: Kind) -> None:
+    gen = generator(kind)
+    _, ids = gen.new_ids_at_index(100)
+    width = t.cast(int, gen.id_width)
+    data = gen.ids_to_bytes(ids)
+    binaries = [data[i : i + width] for i in range(0, len(data), width)]
+    strings = gen.ids_to_strings(ids)
+    for consistent in (False, True):
+        expected = shard_many(kind, strings, 64, consistent=consistent)
+        assert shard_many(kind, binaries, 64, consistent=consistent) == expected
+        assert [
+            shard_of(kind, value, 64, consistent=consistent) for value in strings
+        ] == expected
+
+
+@pytest.mark.parametrize(
+    "kind", [Kind.ULID, Kind.OBJECTID, Kind.KSUID, Kind.TYPEID, Kind.UUID1]
+)
+def test_shard_many_is_balanced(kind: Kind) -> None:
+    # IDs generated within the same second share their time prefix
+    _, ids = generator(kind).new_ids_at_index(64_000)
+    counts = Counter(shard_many(kind, generator(kind).ids_to_strings(ids), 64))
+    assert len(counts) == 64
+    assert min(counts.values()) > 800
+    assert max(counts.values()) < 1200
+
+
+def test_shard_of_typeid_ignores_prefix() -> None:
+    gen = generator("typeid", prefix="user")
+    typeid = gen.new()
+    assert shard_of("typeid", typeid, 1024) == shard_of("typeid", typeid[5:], 1024)
+
+
+def test_jump_hash_moves_few_keys() -> None:
+    keys = [mix64(key) for key in range(10_000)]
+    before = [jump_hash(key, 10) for key in keys]
+    after = [jump_hash(key, 11) for key in keys]
+    moved = [(b, a) for b, a in zip(before, after) if b != a]
+    assert all(a == 10 for _, a in moved)
+    assert 700 < len(moved) < 1100
+
+
+@pytest.mark.parametrize("n_shards", [0, -1])
+def test_shard_of_invalid_number_of_shards(n_shards: int) -> None:
+    with pytest.raises(ValueError):
+        shard_of("ulid", "01H455VB4PEX5VSKNK084SN02Q", n_shards)
+    with pytest.raises(ValueError):
+        shard_many("ulid", ["01H455VB4PEX5VSKNK084SN02Q"], n_shards)
+
+
+def test_shard_of_single_shard() -> None:
+    assert shard_many("nuid", [b"a", "b"], 1) == [0, 0]
+    assert shard_of("nuid", "a", 1, consistent=True) == 0
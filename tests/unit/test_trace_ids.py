@@ -0,0 +1,92 @@
+import random
+import re
+import typing as t
+
+import pytest
+
+from genid.generators import (
+    Kind,
+    SpanIDGenerator,
+    TraceIDGenerator,
+    _RandomIntIDGenerator,
+    generator,
+)
+from genid.serialize import pack_ids, unpack_ids
+from genid.shard import shard_of
+
+HEX = {
+    Kind.TRACE_ID: re.compile("^[0-9a-f]{32}$"),
+    Kind.SPAN_ID: re.compile("^[0-9a-f]{16}$"),
+}
+
+
+class ZerosFirst:
+    """Bit generator returning `zeros` zero bits before random bits."""
+
+    def __init__(self, zeros: int) -> None:
+        self.zeros = zeros
+        self.random = random.Random(0)
+
+    def getrandbits(self, k: int) -> int:
+        zeros, self.zeros = min(self.zeros, k), max(self.zeros - k, 0)
+        return self.random.getrandbits(k - zeros) << zeros if k > zeros else 0
+
+
+@pytest.mark.parametrize("kind", [Kind.TRACE_ID, Kind.SPAN_ID])
+def test_trace_ids_are_lowercase_hex(kind: Kind) -> None:
+    gen = generator(kind, pool_size=16)
+    width = t.cast(int, gen.id_width)
+    values = [gen.new() for _ in range(100)] + gen.new_many(100)
+    assert all(HEX[kind].match(value) for value in values)
+    assert len(set(values)) == 200
+    value = gen.new_id_at_index()[1]
+    assert 0 < value < 1 << (8 * width)
+    assert gen.id_to_bytes(value) == bytes.fromhex(gen.id_to_string(value))
+    values_ = gen.new_ids_at_index(10)[1]
+    assert gen.ids_to_bytes(values_) == b"".join(map(gen.id_to_bytes, values_))
+
+
+@pytest.mark.parametrize("generator_type", [TraceIDGenerator, SpanIDGenerator])
+def test_trace_ids_are_never_zero(
+    generator_type: t.Type[t.Union[TraceIDGenerator, SpanIDGenerator]],
+) -> None:
+    width = generator_type._width
+    # The first 3 IDs drawn by each call are all zeros
+    gen = generator_type(ZerosFirst(24 * width), pool_size=8)
+    assert all(gen.new_id_at_index()[1] for _ in range(20))
+    gen = generator_type(ZerosFirst(24 * width), pool_size=8)
+    assert all(gen.new_ids_at_index(8)[1])
+    gen = generator_type(ZerosFirst(24 * width))
+    buffer = bytearray(width * 8)
+    gen.fill_into(buffer)
+    assert bytes(width) not in [
+        buffer[start : start + width] for start in range(0, len(buffer), width)
+    ]
+
+
+def test_trace_ids_are_reproducible_with_seed() -> None:
+    assert generator("traceid", rng=42).new_many(3) == generator(
+        "traceid", rng=42
+    ).new_many(3)
+    assert generator("spanid", rng=42).new() == generator("spanid", rng=42).new()
+
+
+def test_trace_ids_invalid_pool_size() -> None:
+    with pytest.raises(ValueError):
+        TraceIDGenerator(pool_size=0)
+
+
+def test_random_int_generator_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        _RandomIntIDGenerator()  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("kind", [Kind.TRACE_ID, Kind.SPAN_ID])
+def test_trace_ids_serialization_and_sharding(kind: Kind) -> None:
+    gen = generator(kind)
+    values = gen.new_ids_at_index(10)[1]
+    assert unpack_ids(pack_ids(kind, values)) == (kind, values)
+    for value in values:
+        shard = shard_of(kind, value, 7)
+        assert shard_of(kind, gen.id_to_string(value), 7) == shard
+        assert shard_of(kind, gen.id_to_bytes(value), 7) == shard
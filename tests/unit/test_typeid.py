@@ -0,0 +1,115 @@
+import pickle
+import uuid
+
+import pytest
+
+from genid.clock import VirtualClock
+from genid.generators import TypeIDGenerator
+from genid.typeid import InvalidTypeID, TypeID, parse_many
+
+# Test vector taken from TypeID specification
+SPEC_TYPEID = "prefix_01h455vb4pex5vsknk084sn02q"
+SPEC_UUID = uuid.UUID("01890a5d-ac96-774b-bcce-b302099a8057")
+
+
+def test_parse_spec_typeid() -> None:
+    typeid = TypeID.parse(SPEC_TYPEID)
+    assert typeid.prefix == "prefix"
+    assert typeid.uuid == SPEC_UUID
+    assert str(typeid) == SPEC_TYPEID
+    assert str(TypeID.from_uuid(SPEC_UUID, "prefix")) == SPEC_TYPEID
+
+
+def test_parse_without_prefix() -> None:
+    typeid = TypeID.parse("00000000000000000000000000")
+    assert typeid.prefix == ""
+    assert typeid.uuid == uuid.UUID(int=0)
+    assert str(TypeID.parse("7zzzzzzzzzzzzzzzzzzzzzzzzz").uuid) == str(
+        uuid.UUID(int=2**128 - 1)
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "prefix_",
+        "prefix01h455vb4pex5vsknk084sn02q",
+        "PREFIX_01h455vb4pex5vsknk084sn02q",
+        "_prefix_01h455vb4pex5vsknk084sn02q",
+        "prefix__01h455vb4pex5vsknk084sn02q",
+        "pre-fix_01h455vb4pex5vsknk084sn02q",
+        "prefix_01H455VB4PEX5VSKNK084SN02Q",
+        "prefix_81h455vb4pex5vsknk084sn02q",
+        "prefix_01h455vb4pex5vsknk084sn02u",
+        "prefix_01h455vb4pex5vsknk084sn02",
+        "a" * 64 + "_01h455vb4pex5vsknk084sn02q",
+    ],
+)
+def test_parse_invalid(value: str) -> None:
+    with pytest.raises(InvalidTypeID):
+        TypeID.parse(value)
+
+
+def test_parse_expected_prefix() -> None:
+    assert TypeID.parse(SPEC_TYPEID, prefix="prefix").prefix == "prefix"
+    with pytest.raises(InvalidTypeID):
+        TypeID.parse(SPEC_TYPEID, prefix="user")
+
+
+@pytest.mark.parametrize("prefix", ["User", "user_", "_user", "us3r", "a" * 64])
+def test_invalid_prefix(prefix: str) -> None:
+    with pytest.raises(ValueError):
+        TypeIDGenerator(prefix)
+
+
+def test_generator() -> None:
+    clock = VirtualClock(1678060800_123_000_000)
+    gen = TypeIDGenerator("user", clock=clock)
+    values = [gen.new() for _ in range(5)] + gen.new_many(100)
+    assert len(set(values)) == 105
+    for value in values:
+        typeid = TypeID.parse(value, prefix="user")
+        assert typeid.uuid.version == 7
+        assert typeid.uuid.variant == uuid.RFC_4122
+        assert typeid.milliseconds == 1678060800_123
+
+
+def test_generator_is_sortable() -> None:
+    clock = VirtualClock(1678060800_000_000_000, step=1_000_000)
+    gen = TypeIDGenerator("user", clock=clock)
+    values = [gen.new() for _ in range(100)]
+    assert values == sorted(values)
+
+
+def test_fill_into() -> None:
+    gen = TypeIDGenerator("user")
+    buffer = bytearray(16 * 10)
+    gen.fill_into(buffer)
+    for offset in range(0, 160, 16):
+        value = uuid.UUID(bytes=bytes(buffer[offset : offset + 16]))
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+
+def test_parse_many() -> None:
+    values = TypeIDGenerator("user").new_many(100)
+    typeids = parse_many(values, "user")
+    assert [str(typeid) for typeid in typeids] == values
+    assert parse_many(["00000000000000000000000000"], "") == [TypeID("", bytes(16))]
+    with pytest.raises(InvalidTypeID):
+        parse_many(values + [SPEC_TYPEID], "user")
+
+
+def test_pickle() -> None:
+    typeid = TypeID("user")
+    assert pickle.loads(pickle.dumps(typeid)) == typeid
+    assert hash(TypeID.parse(str(typeid))) == hash(typeid)
+
+
+def test_equality_is_consistent_with_hash() -> None:
+    typeid = TypeID.parse(SPEC_TYPEID, prefix="prefix")
+    assert typeid == TypeID.from_uuid(SPEC_UUID, "prefix")
+    assert typeid != TypeID.from_uuid(SPEC_UUID)
+    assert typeid != SPEC_TYPEID
+    assert SPEC_TYPEID not in {typeid}